@@ -1,7 +1,16 @@
 # -*- mode: python -*-
 a = Analysis(['../src/rtkgers.py'],
              pathex=['../src'],
-             hiddenimports=[],
+             # The algorithms are imported by name, see rtkgers.registry.
+             hiddenimports=['rtkgers.kgers.consensus',
+                            'rtkgers.kgers.diameter',
+                            'rtkgers.kgers.leastsquares',
+                            'rtkgers.kgers.original',
+                            'rtkgers.kgers.weights',
+                            'rtkgers.rtree.bestfirst',
+                            'rtkgers.rtree.candidates',
+                            'rtkgers.rtree.distributed',
+                            'rtkgers.rtree.original'],
              hookspath=None,
              runtime_hooks=None)
 pyz = PYZ(a.pure)
@@ -8,17 +8,24 @@ The style guide follows the strict python PEP 8 guidelines.
 @requires Python >=2.7
 @copyright 2014 - Present Aaron Zampaglione
 """
+import collections
 import csv
 import getopt
+import itertools
+import logging
 import os
 import pickle
 import sys
 
 import ConfigParser
 
-from rtkgers.hyperplane import Hyperplane
+import rtkgers.utils.config as ConfigUtils
+
 from rtkgers.point import Point
-from rtkgers.rtree.original import RTreeOriginal
+
+
+# The number of rows of the input predicted at a time.
+PREDICT_CHUNK_SIZE = 4096
 
 
 # The mode when execution is for "training".
@@ -29,12 +36,44 @@ MODE_TRAIN = 'train'
 MODE_PREDICT = 'predict'
 
 
+# The mode when execution is for generating a standalone predictor module.
+MODE_EXPORT = 'export'
+
+
+# The mode when execution is for absorbing new points into a model.
+MODE_UPDATE = 'update'
+
+
+# The mode when execution is for growing subtrees for a coordinator.
+MODE_WORKER = 'worker'
+
+
+def export(model_filename, output_filename, vectorize=False):
+  """
+  Generates a standalone Python module that solves points like a rtkgers
+  model, see rtkgers.rtree.export.
+
+  Key arguments:
+  model_filename  -- The rtkgers model written to disk.
+  output_filename -- The output file name of the module.
+  vectorize       -- True to generate the NumPy module for arrays of points.
+  """
+
+  import rtkgers.rtree.export as Export
+
+  with open(model_filename, 'rb') as model_file:
+    rtkgers = pickle.load(model_file)
+
+  Export.write(rtkgers, output_filename, vectorize)
+
+
 def main():
   """Main execution."""
 
   # Determine command line arguments.
   try:
-    rawopts, _ = getopt.getopt(sys.argv[1:], 'c:e:m:i:o:')
+    rawopts, _ = getopt.getopt(sys.argv[1:], 'b:c:e:m:i:o:',
+      ['profile', 'profile-dump=', 'vectorize'])
   except getopt.GetoptError:
     usage()
     sys.exit(2)
@@ -43,13 +82,20 @@ def main():
 
   # Process each command line argument.
   for o, a in rawopts:
-    opts[o[1]] = a
+    opts[o.lstrip('-')] = a
 
   # The following arguments are required in all cases.
-  for opt in ['e', 'i', 'o']:
-    if not opt in opts:
-      usage()
-      sys.exit(2)
+  if not 'e' in opts:
+    usage()
+    sys.exit(2)
+
+  # The following arguments are required to train, predict and update,
+  #  exporting only requires the output.
+  if opts['e'] != MODE_WORKER:
+    for opt in (['o'] if opts['e'] == MODE_EXPORT else ['i', 'o']):
+      if not opt in opts:
+        usage()
+        sys.exit(2)
 
   # Training.
   if opts['e'] == MODE_TRAIN:
@@ -58,16 +104,46 @@ def main():
       usage()
       sys.exit(2)
 
-    train(opts['c'], opts['i'], opts['o'])
+    train(opts['c'], opts['i'], opts['o'],
+      profile='profile' in opts, profile_dump=opts.get('profile-dump'),
+      model_filename=opts.get('m'))
 
   # Prediction.
   elif opts['e'] == MODE_PREDICT:
+    # Make sure either the models or the bank of models was provided.
+    if ('m' in opts) == ('b' in opts):
+      usage()
+      sys.exit(2)
+
+    predict(opts['m'].split(',') if 'm' in opts else [], opts['i'], opts['o'],
+      opts.get('b'))
+
+  # Updating.
+  elif opts['e'] == MODE_UPDATE:
+    # Make sure the model was provided.
+    if not 'm' in opts:
+      usage()
+      sys.exit(2)
+
+    update(opts['m'], opts['i'], opts['o'], opts.get('c'))
+
+  # Exporting.
+  elif opts['e'] == MODE_EXPORT:
     # Make sure the model was provided.
     if not 'm' in opts:
       usage()
       sys.exit(2)
 
-    predict(opts['m'], opts['i'], opts['o'])
+    export(opts['m'], opts['o'], vectorize='vectorize' in opts)
+
+  # Serving a coordinator.
+  elif opts['e'] == MODE_WORKER:
+    # Make sure the config was provided.
+    if not 'c' in opts:
+      usage()
+      sys.exit(2)
+
+    work(opts['c'])
 
   # Mode not recognized.
   else:
@@ -75,18 +151,39 @@ def main():
     sys.exit(2)
 
 
-def predict(model_filename, input_filename, output_filename):
+def predict(model_filenames, input_filename, output_filename,
+  bank_directory=None):
   """
-  Loads in a rtkgers model and predicts the values in the input file.
+  Loads in rtkgers models and predicts the values in the input file. The
+  input is read in chunks, and each chunk is parsed once and predicted by
+  every model, with one prediction column per model in the output.
+
+  With a bank of models, the second column of each row of the input file
+  names the model to predict the row with, rather than the solution, and
+  is kept in the output. The rows of a chunk are predicted model by model.
 
   Key arguments:
-  model_filename  -- The rtkgers model written to disk.
+  model_filenames -- The rtkgers models written to disk.
   input_filename  -- The input file name with the test values.
   output_filename -- The output file for the prediction values.
+  bank_directory  -- The directory of the models, by id (optional).
   """
 
-  with open(model_filename, 'rb') as model_file:
-    rtkgers = pickle.load(model_file)
+  bank = None
+  models = []
+  if bank_directory:
+    from rtkgers.bank import ModelBank
+
+    bank = ModelBank.directory(bank_directory)
+  else:
+    for model_filename in model_filenames:
+      with open(model_filename, 'rb') as model_file:
+        models.append(pickle.load(model_file))
+
+    # Points are read in the precision the models were trained in, the
+    #  widest one if they differ.
+    Point.DTYPE = max([getattr(rtkgers, 'dtype', Point.DTYPE)
+      for rtkgers in models], key=lambda dtype: dtype.itemsize)
 
   # Create our reader.
   with open(input_filename, 'rb') as reader_file:
@@ -96,48 +193,164 @@ def predict(model_filename, input_filename, output_filename):
 
       # Skip the first line.
       reader.next()
-      for row in reader:
-        point = Point([float(feature) for feature in row[2:]])
-        solution = rtkgers.solve(point)
-        writer.writerow([row[0]] + [solution] + row[2:])
-
-
-def train(config_filename, input_filename, output_filename):
+      while True:
+        rows = list(itertools.islice(reader, PREDICT_CHUNK_SIZE))
+        if (len(rows) == 0):
+          break
+
+        if (bank != None):
+          # The rows of the chunk by the id of their model.
+          groups = collections.defaultdict(list)
+          for i, row in enumerate(rows):
+            groups[row[1]].append(i)
+
+          solutions = [None] * len(rows)
+          for model_id, indices in groups.items():
+            rtkgers = bank.get(model_id)
+            Point.DTYPE = getattr(rtkgers, 'dtype', Point.DTYPE)
+            for i in indices:
+              solutions[i] = rtkgers.solve(
+                Point([float(feature) for feature in rows[i][2:]]))
+
+          for row, solution in zip(rows, solutions):
+            writer.writerow(row[:2] + [solution] + row[2:])
+          continue
+
+        points = [Point([float(feature) for feature in row[2:]])
+          for row in rows]
+        solutions = zip(*[[rtkgers.solve(point) for point in points]
+          for rtkgers in models])
+
+        for row, solution in zip(rows, solutions):
+          writer.writerow([row[0]] + list(solution) + row[2:])
+
+
+def train(config_filename, input_filename, output_filename, profile=False,
+  profile_dump=None, model_filename=None):
   """
   Generates a RTKGERS model based on the provided training set and config.
 
   Key arguments:
   config_filename  -- The config file name.
-  input_filename   -- The input file name.
+  input_filename   -- The input file name (CSV or binary ".npy").
   output_filename  -- The output file name.
+  profile          -- True to print a per-phase timing summary.
+  profile_dump     -- The file name to write cProfile statistics to.
+  model_filename   -- The model to reuse the splits of (optional).
   """
 
-  # Load in the configuration.
-  config = ConfigParser.ConfigParser()
+  # The training stack is imported here rather than with the module, so
+  #  predicting does not pay for it.
+  import cProfile
+
+  import numpy as np
+
+  import rtkgers.registry as Registry
+
+  from rtkgers.dataset import Dataset
+  from rtkgers.hyperplane import Hyperplane
+  from rtkgers.pool import Pool
+  from rtkgers.profiler import Profiler
+
+  # Load in the configuration, "%(dir)s" is the directory of the config.
+  config = ConfigParser.ConfigParser(
+    {'dir': os.path.dirname(os.path.abspath(config_filename))})
   config.read(config_filename)
 
-  # The points are essentially feature sets with the known solution.
-  points = []
+  # Report the progress of training to the log file, if one was provided.
+  log_filename = ConfigUtils.get(config, 'Main', 'LogFile')
+  if log_filename:
+    logging.basicConfig(filename=log_filename, level=logging.INFO,
+      format='%(asctime)s %(levelname)s %(message)s')
 
-  # Create our reader.
-  with open(input_filename, 'rb') as reader_file:
-    reader = csv.reader(reader_file, delimiter=',', quotechar='|')
+  # The profiler can be enabled from either the command line or the config.
+  profile = profile or ConfigUtils.getboolean(config, 'Main', 'Profile')
+  profile_dump = profile_dump or ConfigUtils.get(config, 'Main', 'ProfileDump')
+
+  Profiler.enable(profile)
+
+  profiler = None
+  if profile_dump:
+    profiler = cProfile.Profile()
+    profiler.enable()
+
+  # The precision of the points and of the coefficients of the leaves.
+  Point.DTYPE = np.dtype(ConfigUtils.get(config, 'Main', 'Precision',
+    'float64'))
 
-    # Skip the first line.
-    reader.next()
-    for row in reader:
-      points.append(
-        Point([float(feature) for feature in row[2:]], float(row[1])))
+  # The points are essentially feature sets with the known solution,
+  #  a binary data set is memory-mapped rather than read.
+  with Profiler.timer('data.parse'):
+    dataset = Dataset.load(input_filename)
 
   # Overload globals.
-  Hyperplane.MAX_SAMPLE_ATTEMPTS = config.get('KGERS', 'MaxHyperplaneAttempts')
+  Hyperplane.MAX_SAMPLE_ATTEMPTS = \
+    config.getint('KGERS', 'MaxHyperplaneAttempts')
+  Pool.configure(config.getint('Main', 'MaxThreads'))
 
   # Load the desired algorithm.
-  algorithm = config.get('RTree', 'Algorithm')
-  rtkgers = globals()[algorithm](config, points)
+  algorithm = Registry.load(Registry.RTREE, config.get('RTree', 'Algorithm'))
+  rtkgers = algorithm(config, dataset)
+
+  # Execute, starting from the splits of a trained model if one was provided.
+  with Profiler.timer('rtree.populate'):
+    if model_filename:
+      with open(model_filename, 'rb') as model_file:
+        rtkgers.reuse(pickle.load(model_file))
+    else:
+      rtkgers.populate()
+
+  with Profiler.timer('model.pickle'):
+    with open(output_filename, 'wb') as output_file:
+      pickle.dump(rtkgers, output_file, pickle.HIGHEST_PROTOCOL)
+
+  # Only the main thread is visible to cProfile,
+  #  the worker threads are covered by the phase timers.
+  if profiler:
+    profiler.disable()
+    profiler.dump_stats(profile_dump)
+
+  if profile:
+    print(Profiler.summary())
+
+
+def update(model_filename, input_filename, output_filename,
+  config_filename=None):
+  """
+  Absorbs new points into a rtkgers model without training it again.
+
+  Key arguments:
+  model_filename  -- The rtkgers model written to disk.
+  input_filename  -- The input file name with the new points.
+  output_filename -- The output file name of the updated model.
+  config_filename -- The config file name, replaces the config the model
+                     was trained with (optional).
+  """
+
+  from rtkgers.dataset import Dataset
+  from rtkgers.hyperplane import Hyperplane
+  from rtkgers.pool import Pool
 
-  # Execute.
-  rtkgers.populate()
+  with open(model_filename, 'rb') as model_file:
+    rtkgers = pickle.load(model_file)
+
+  if config_filename:
+    config = ConfigParser.ConfigParser(
+      {'dir': os.path.dirname(os.path.abspath(config_filename))})
+    config.read(config_filename)
+
+    # The settings read from the old config are read again.
+    rtkgers.configure(config)
+
+  # Points are read in the precision the model was trained in.
+  Point.DTYPE = getattr(rtkgers, 'dtype', Point.DTYPE)
+
+  # Overload globals.
+  Hyperplane.MAX_SAMPLE_ATTEMPTS = \
+    rtkgers.config.getint('KGERS', 'MaxHyperplaneAttempts')
+  Pool.configure(rtkgers.config.getint('Main', 'MaxThreads'))
+
+  rtkgers.update(Dataset.load(input_filename).points())
 
   with open(output_filename, 'wb') as output_file:
     pickle.dump(rtkgers, output_file, pickle.HIGHEST_PROTOCOL)
@@ -149,17 +362,69 @@ def usage():
   print("\n" +
     "The following are arguments required:\n" +
     "\t-c: the path to the configuration file.\n" +
-    "\t-e: the execution mode (train,predict).\n" +
-    "\t-m: the model file (only required in predict mode).\n" +
-    "\t-i: the input file.\n" +
-    "\t-o: the output file.\n" +
+    "\t-e: the execution mode (train,predict,update,export,worker).\n" +
+    "\t-m: the model file (required in predict, update and export mode, the\n" +
+    "\t    model to reuse the splits of in train mode); predict mode accepts\n" +
+    "\t    several comma separated models, one output column per model.\n" +
+    "\t-b: the directory of the models \"<id>.model\" to predict with, instead\n" +
+    "\t    of -m; the second input column is the id, and is kept in the\n" +
+    "\t    output (predict mode).\n" +
+    "\t-i: the input file (not required in export and worker mode).\n" +
+    "\t-o: the output file (not required in worker mode).\n" +
+    "\n" +
+    "The following arguments are optional:\n" +
+    "\t--profile: print a per-phase timing summary (train mode).\n" +
+    "\t--profile-dump: the file to write cProfile statistics to (train mode).\n" +
+    "\t--vectorize: generate a NumPy module for arrays of points (export mode).\n" +
     "\n" +
     "Example Usage:\n" +
     "\tpython rtkgers.py -e \"train\" -c \"config.cfg\" -i \"training.csv\" -o \"rtkgers.model\"\n" +
-    "\tpython rtkgers.py -e \"predict\" -m \"rtkgers.model\" -i \"test.csv\" -o \"predictions.csv\"" +
+    "\tpython rtkgers.py -e \"predict\" -m \"rtkgers.model\" -i \"test.csv\" -o \"predictions.csv\"\n" +
+    "\tpython rtkgers.py -e \"predict\" -m \"a.model,b.model\" -i \"test.csv\" -o \"predictions.csv\"\n" +
+    "\tpython rtkgers.py -e \"predict\" -b \"models\" -i \"test.csv\" -o \"predictions.csv\"\n" +
+    "\tpython rtkgers.py -e \"update\" -m \"rtkgers.model\" -i \"new.csv\" -o \"updated.model\"\n" +
+    "\tpython rtkgers.py -e \"export\" -m \"rtkgers.model\" -o \"predictor.py\"\n" +
+    "\tpython rtkgers.py -e \"worker\" -c \"config.cfg\"" +
     "\n")
 
 
+def work(config_filename):
+  """
+  Grows the subtrees that coordinators send, until interrupted.
+
+  Key arguments:
+  config_filename -- The config file name, the [Distributed] Address is
+                     listened on.
+  """
+
+  from multiprocessing.connection import Listener
+
+  from rtkgers.pool import Pool
+  from rtkgers.rtree.distributed import Worker
+  from rtkgers.rtree.distributed import address
+
+  # Load in the configuration, "%(dir)s" is the directory of the config.
+  config = ConfigParser.ConfigParser(
+    {'dir': os.path.dirname(os.path.abspath(config_filename))})
+  config.read(config_filename)
+
+  log_filename = ConfigUtils.get(config, 'Main', 'LogFile')
+  if log_filename:
+    logging.basicConfig(filename=log_filename, level=logging.INFO,
+      format='%(asctime)s %(levelname)s %(message)s')
+
+  Pool.configure(config.getint('Main', 'MaxThreads'))
+
+  listener = Listener(address(ConfigUtils.get(config, 'Distributed',
+    'Address', 'localhost:6000')),
+    authkey=ConfigUtils.get(config, 'Distributed', 'AuthKey', 'rtkgers'))
+
+  try:
+    Worker(listener).serve()
+  finally:
+    listener.close()
+
+
 """Main execution."""
 if __name__ == "__main__":
   main()
@@ -0,0 +1,205 @@
+"""
+See class summary.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import collections
+import glob
+import os
+import pickle
+import threading
+
+from rtkgers.exceptions.bank import BankException
+
+
+class ModelBank(object):
+  """
+  Serves many models written to disk by their ids.
+
+  A model is only loaded the first time it is requested. The most recently
+  used models are kept loaded, up to a number of models and a number of
+  bytes (the size of their files), and the least recently used ones are
+  evicted beyond that. A loaded model is reloaded when its file changes.
+  """
+
+  # The default number of models kept loaded.
+  MAX_MODELS = 100
+
+
+  @staticmethod
+  def directory(path, max_models=MAX_MODELS, max_bytes=None,
+    extension='.model'):
+    """
+    Factory method that produces a bank of the models of a directory, the
+    id of a model is its file name without the extension. A model written
+    to the directory later is found the first time it is requested.
+
+    Key arguments:
+    path       -- The directory.
+    max_models -- The number of models kept loaded, None is unlimited.
+    max_bytes  -- The bytes of the models kept loaded, None is unlimited.
+    extension  -- The extension of the model files.
+    """
+
+    filenames = glob.glob(os.path.join(path, '*' + extension))
+
+    bank = ModelBank(dict((os.path.basename(filename)[:-len(extension)],
+      filename) for filename in filenames), max_models, max_bytes)
+    bank.path = path
+    bank.extension = extension
+
+    return bank
+
+
+  def __init__(self, filenames, max_models=MAX_MODELS, max_bytes=None):
+    """
+    Constructor.
+
+    Key arguments:
+    filenames  -- The file names of the models, by id.
+    max_models -- The number of models kept loaded, None is unlimited.
+    max_bytes  -- The bytes of the models kept loaded, None is unlimited.
+    """
+
+    self.filenames = dict(filenames)
+    self.max_models = max_models
+    self.max_bytes = max_bytes
+
+    # The loaded models by id as (model, modification time, bytes), from
+    #  the least to the most recently used.
+    self.models = collections.OrderedDict()
+    self.bytes = 0
+
+    # The lock that guards the loaded models across serving threads.
+    self.lock = threading.RLock()
+
+    # The directory searched for the models missing from the bank, and the
+    #  extension of their files, see directory().
+    self.path = None
+    self.extension = None
+
+
+  def __contains__(self, id):
+    """
+    Returns true if the bank has a model.
+
+    Key arguments:
+    id -- The id of the model.
+    """
+
+    return self.find(id)
+
+
+  def evict(self):
+    """Evicts the least recently used models beyond the limits."""
+
+    with self.lock:
+      while (len(self.models) > 1 and
+        ((self.max_models != None and len(self.models) > self.max_models) or
+        (self.max_bytes != None and self.bytes > self.max_bytes))):
+        self.bytes -= self.models.popitem(last=False)[1][2]
+
+
+  def find(self, id):
+    """
+    Returns true if the bank has a model, searching the directory of the
+    bank for it if it is missing.
+
+    Key arguments:
+    id -- The id of the model.
+    """
+
+    with self.lock:
+      if id in self.filenames:
+        return True
+
+      # An id is only a file name, never a path.
+      if (self.path == None or os.path.basename(id) != id):
+        return False
+
+      filename = os.path.join(self.path, id + self.extension)
+      if not os.path.isfile(filename):
+        return False
+
+      self.filenames[id] = filename
+
+      return True
+
+
+  def get(self, id):
+    """
+    Returns a model, loading it if it is not loaded or its file changed.
+
+    Key arguments:
+    id -- The id of the model.
+    """
+
+    with self.lock:
+      if not self.find(id):
+        raise BankException("Unknown model \"%s\"." % id)
+
+      status = os.stat(self.filenames[id])
+
+      entry = self.models.pop(id, None)
+      if (entry != None):
+        self.bytes -= entry[2]
+        if (entry[1] != status.st_mtime or entry[2] != status.st_size):
+          entry = None
+
+      if (entry == None):
+        entry = (self.load(self.filenames[id]), status.st_mtime,
+          status.st_size)
+
+      # The model is now the most recently used.
+      self.models[id] = entry
+      self.bytes += entry[2]
+
+      self.evict()
+
+      return entry[0]
+
+
+  def ids(self):
+    """Returns the ids of the models."""
+
+    return sorted(self.filenames.keys())
+
+
+  def load(self, filename):
+    """
+    Loads a model from its file.
+
+    Key arguments:
+    filename -- The file name of the model.
+    """
+
+    with open(filename, 'rb') as model_file:
+      return pickle.load(model_file)
+
+
+  def loaded(self):
+    """Returns the ids of the loaded models, least recently used first."""
+
+    with self.lock:
+      return list(self.models.keys())
+
+
+  def register(self, id, filename):
+    """
+    Adds a model to the bank, replacing any model with the same id.
+
+    Key arguments:
+    id       -- The id of the model.
+    filename -- The file name of the model.
+    """
+
+    with self.lock:
+      self.filenames[id] = filename
+      entry = self.models.pop(id, None)
+      if (entry != None):
+        self.bytes -= entry[2]
@@ -0,0 +1,203 @@
+"""
+See class summary.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import os
+import tempfile
+
+import numpy as np
+
+import rtkgers.utils.data as DataUtils
+
+from rtkgers.point import Point
+
+
+class Dataset(object):
+  """
+  A data set stored as one (n, d + 1) array of coordinates, where each row
+  is the features of a point followed by its solution.
+
+  The array can be placed in a memory-mapped file, which makes the data
+  set shared: it is pickled as a small handle, and other processes attach
+  to the same pages instead of receiving a copy. Workers are then given
+  index ranges of the data set to work on.
+  """
+
+
+  @staticmethod
+  def attach(handle):
+    """
+    Attaches to a shared data set.
+
+    Key arguments:
+    handle -- The handle of the data set, see Dataset.handle().
+    """
+
+    filename, shape, dtype, offset = handle
+
+    return Dataset(
+      np.memmap(filename, dtype=np.dtype(dtype), mode='r', shape=shape,
+        offset=offset),
+      filename, offset)
+
+
+  @staticmethod
+  def factory(points):
+    """
+    Factory method that produces a data set from points.
+
+    Key arguments:
+    points -- The points of the data set.
+    """
+
+    return Dataset(np.array([point.coordinates for point in points],
+      dtype=Point.DTYPE))
+
+
+  @staticmethod
+  def load(filename):
+    """
+    Loads a data set from a file. A binary data set is memory-mapped, and
+    therefore shared, without being read into memory, unless it has to be
+    converted to the precision of the points.
+
+    Key arguments:
+    filename -- The file name to read from.
+    """
+
+    if DataUtils.is_binary(filename):
+      coordinates = np.load(filename, mmap_mode='r')
+      if (coordinates.dtype != Point.DTYPE):
+        return Dataset(coordinates.astype(Point.DTYPE))
+
+      return Dataset(coordinates, coordinates.filename, coordinates.offset)
+
+    return Dataset.factory(DataUtils.read_csv(filename))
+
+
+  def __init__(self, coordinates, filename=None, offset=0):
+    """
+    Constructor.
+
+    Key arguments:
+    coordinates -- The (n, d + 1) coordinates array.
+    filename    -- The file the array is mapped from, if it is shared.
+    offset      -- The offset of the array in the file.
+    """
+
+    self.coordinates = coordinates
+    self.filename = filename
+    self.offset = offset
+
+    # Whether the file was created by share() and should be removed.
+    self.temporary = False
+
+
+  def __getstate__(self):
+    """Pickles a shared data set as its handle only."""
+
+    if self.filename == None:
+      return {'coordinates': self.coordinates}
+
+    return {'handle': self.handle()}
+
+
+  def __len__(self):
+    """Returns the number of points."""
+
+    return len(self.coordinates)
+
+
+  def __setstate__(self, state):
+    """Unpickles a data set, attaching to it if it is shared."""
+
+    if 'handle' in state:
+      self.__dict__.update(Dataset.attach(state['handle']).__dict__)
+    else:
+      self.__init__(state['coordinates'])
+
+
+  def close(self):
+    """Removes the file created by share(), if there is one."""
+
+    if self.temporary:
+      self.coordinates = np.array(self.coordinates)
+      os.remove(self.filename)
+      self.filename = None
+      self.offset = 0
+      self.temporary = False
+
+
+  @property
+  def dimensions(self):
+    """Returns the dimensions of the points (features plus solution)."""
+
+    return self.coordinates.shape[1]
+
+
+  def handle(self):
+    """
+    Returns the handle other processes attach to the data set with,
+    sharing the data set first if necessary.
+    """
+
+    if self.filename == None:
+      self.share()
+
+    return (self.filename, self.coordinates.shape, self.coordinates.dtype.str,
+      self.offset)
+
+
+  def points(self, start=0, end=None):
+    """
+    Returns the points in an index range.
+
+    Key arguments:
+    start -- The first index.
+    end   -- The index after the last (optional, the end of the data set).
+    """
+
+    return [Point.view(row) for row in self.coordinates[start:end]]
+
+
+  def share(self, directory=None):
+    """
+    Moves the data set into a temporary memory-mapped file, which is
+    removed by close().
+
+    Key arguments:
+    directory -- The directory to create the file in (optional).
+    """
+
+    if self.filename != None:
+      return
+
+    descriptor, filename = tempfile.mkstemp(suffix='.dat', dir=directory)
+    os.close(descriptor)
+
+    shared = np.memmap(filename, dtype=self.coordinates.dtype, mode='w+',
+      shape=self.coordinates.shape)
+    shared[:] = self.coordinates
+    shared.flush()
+
+    self.coordinates = shared
+    self.filename = filename
+    self.offset = 0
+    self.temporary = True
+
+
+  def take(self, indices):
+    """
+    Returns the points at the indices provided.
+
+    Key arguments:
+    indices -- The indices of the points.
+    """
+
+    return [Point.view(row) for row in self.coordinates[indices]]
@@ -0,0 +1,30 @@
+"""
+See class summary.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+
+class BatchException(Exception):
+  """A batch exception, which carries the exceptions of every failed task."""
+
+  def __init__(self, message, exceptions):
+    """
+    Constructor.
+
+    Key arguments:
+    message    -- The exception message.
+    exceptions -- The exceptions of the failed tasks.
+    """
+
+    Exception.__init__(self, message)
+    self.exceptions = exceptions
+
+
+class CancelledException(Exception):
+  """A task was cancelled before it finished."""
+  pass
@@ -0,0 +1,14 @@
+"""
+See class summary.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+
+class DistributedException(Exception):
+  """A distributed training exception."""
+  pass
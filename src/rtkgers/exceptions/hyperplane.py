@@ -8,7 +8,14 @@ The style guide follows the strict python PEP 8 guidelines.
 @requires Python >=2.7
 @copyright 2014 - Present Aaron Zampaglione
 """
+from rtkgers.exceptions.batch import BatchException
+
 
 class HyperplaneException(Exception):
   """A Hyperplane exception."""
   pass
+
+
+class HyperplaneBatchException(HyperplaneException, BatchException):
+  """A batch of hyperplanes could not be generated."""
+  pass
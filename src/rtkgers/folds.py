@@ -0,0 +1,149 @@
+"""
+See class summary.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import numpy as np
+
+
+class Folds(object):
+  """
+  The train/test splits of a list of points, as the fold each position of
+  the list is tested in (-1 is never tested). The training points of a
+  fold are all the others, so points are never hashed or compared.
+
+  Slicing the folds slices the labels (a view), which gives the folds of
+  the same slice of the points, e.g. of every candidate side of a split.
+  """
+
+
+  @staticmethod
+  def holdout(size, count, seed=None):
+    """
+    Factory method that produces one fold testing random positions.
+
+    Key arguments:
+    size  -- The number of points.
+    count -- The number of points to test.
+    seed  -- The seed of the shuffle, see permutation().
+    """
+
+    labels = np.empty(size, dtype=np.intp)
+    labels.fill(-1)
+    labels[Folds.permutation(size, seed)[:count]] = 0
+
+    return Folds(labels, 1)
+
+
+  @staticmethod
+  def interleaved(size, k):
+    """
+    Factory method that produces k folds, the position i is tested in the
+    fold i % k. Every range of the positions is split evenly, so the folds
+    can be shared by every candidate side of a split of sorted points.
+
+    Key arguments:
+    size -- The number of points.
+    k    -- The number of folds.
+    """
+
+    return Folds(np.arange(size, dtype=np.intp) % k, k)
+
+
+  @staticmethod
+  def permutation(size, seed=None):
+    """
+    Returns a random permutation of the positions. Without a seed, the
+    global NumPy generator is used, so seeding it repeats the permutation.
+
+    Key arguments:
+    size -- The number of points.
+    seed -- The seed of the permutation (optional).
+    """
+
+    if (seed == None):
+      return np.random.permutation(size)
+
+    return np.random.RandomState(seed).permutation(size)
+
+
+  @staticmethod
+  def shuffled(size, k, seed=None):
+    """
+    Factory method that produces k folds of random positions, of sizes
+    that differ by one at most.
+
+    Key arguments:
+    size -- The number of points.
+    k    -- The number of folds.
+    seed -- The seed of the shuffle, see permutation().
+    """
+
+    labels = np.empty(size, dtype=np.intp)
+    for fold, positions in enumerate(
+      np.array_split(Folds.permutation(size, seed), k)):
+      labels[positions] = fold
+
+    return Folds(labels, k)
+
+
+  def __init__(self, labels, k):
+    """
+    Constructor.
+
+    Key arguments:
+    labels -- The fold each position is tested in, -1 is never tested.
+    k      -- The number of folds.
+    """
+
+    self.labels = labels
+    self.k = k
+
+
+  def __getitem__(self, key):
+    """
+    Returns the folds of a slice of the points.
+
+    Key arguments:
+    key -- The slice.
+    """
+
+    return Folds(self.labels[key], self.k)
+
+
+  def __len__(self):
+    """Returns the number of points."""
+
+    return len(self.labels)
+
+
+  def indices(self, fold=0):
+    """
+    Returns the (training positions, test positions) of a fold, in order.
+
+    Key arguments:
+    fold -- The fold.
+    """
+
+    test = self.labels == fold
+
+    return (np.flatnonzero(~test), np.flatnonzero(test))
+
+
+  def take(self, points, fold=0):
+    """
+    Returns the (training points, test points) of a fold.
+
+    Key arguments:
+    points -- The points, in the order of the positions.
+    fold   -- The fold.
+    """
+
+    training, test = self.indices(fold)
+
+    return ([points[i] for i in training], [points[i] for i in test])
@@ -12,8 +12,12 @@ import numpy as np
 
 import utils
 
+from exceptions.batch import CancelledException
 from exceptions.hyperplane import HyperplaneException
 from point import Point
+from pool import Batch
+from profiler import Profiler
+from statistics import Statistics
 
 
 class Hyperplane(object):
@@ -23,6 +27,7 @@ class Hyperplane(object):
   The coefficients represent the linear equation based on the points
   provided.
   """
+  __slots__ = ('coefficients', 'points')
 
   # The max amount of times to sample a data set
   #  until it is determined that all samples are
@@ -31,6 +36,7 @@ class Hyperplane(object):
 
 
   @staticmethod
+  @Profiler.timed('hyperplane.sample')
   def sample(points):
     """
     Attempts to generate a hyperplane by sampling a large set of
@@ -58,14 +64,20 @@ class Hyperplane(object):
 
     # Try X amount of times to generate a hyperplane with the points provided.
     while (count < Hyperplane.MAX_SAMPLE_ATTEMPTS):
+      # Stop retrying if the batch this sample belongs to was cancelled.
+      if Batch.interrupted():
+        raise CancelledException("The sample was cancelled.")
+
       try:
         hyperplane = Hyperplane.factory(samples)
         break
       except HyperplaneException, e:
         count += 1
+        Profiler.count('hyperplane.retries')
         samples = utils.math.sample(points, num_to_sample)
 
     if (count >= Hyperplane.MAX_SAMPLE_ATTEMPTS):
+      Profiler.count('hyperplane.failures')
       raise HyperplaneException(
         "Failed to generate a hyperplane from the samples.")
 
@@ -90,7 +102,7 @@ class Hyperplane(object):
     # Make sure we are provided with a full rank matrix.
     points_as_array = np.array(
       [point.coordinates for point in points],
-      dtype=Point.DTYPE)
+      dtype=Statistics.DTYPE)
 
     if round(np.linalg.det(points_as_array), 1) == 0.0:
       raise HyperplaneException("The points provided are linearly dependent.")
@@ -98,13 +110,13 @@ class Hyperplane(object):
     # Build our linear equation matrix.
     a = np.array(
       [np.append(point.features, [1.0]) for point in points],
-      dtype=Point.DTYPE)
+      dtype=Statistics.DTYPE)
 
     b = np.array(
       [point.solution for point in points],
-      dtype=Point.DTYPE)
+      dtype=Statistics.DTYPE)
 
-    return Hyperplane(np.linalg.lstsq(a, b)[0], points)
+    return Hyperplane(np.linalg.lstsq(a, b)[0].astype(Point.DTYPE), points)
 
 
   def __init__(self, coefficients, points):
@@ -120,6 +132,27 @@ class Hyperplane(object):
     self.points = points
 
 
+  def __getstate__(self):
+    """Returns the state to pickle."""
+
+    return (self.coefficients, self.points)
+
+
+  def __setstate__(self, state):
+    """
+    Restores a pickled state.
+
+    Key arguments:
+    state -- The pickled state, a dictionary for hyperplanes pickled before
+             they were slotted.
+    """
+
+    if isinstance(state, dict):
+      state = (state['coefficients'], state['points'])
+
+    self.coefficients, self.points = state
+
+
   def solve(self, point):
     """
     Given a point (set of features), return the predicted solution.
@@ -0,0 +1,150 @@
+"""
+See class summary.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import math
+import random
+
+import numpy as np
+
+import rtkgers.utils.config as ConfigUtils
+
+from rtkgers.hyperplane import Hyperplane
+from rtkgers.kgers.core import KGERSCore
+from rtkgers.point import Point
+from rtkgers.profiler import Profiler
+from rtkgers.statistics import Statistics
+
+from rtkgers.exceptions.hyperplane import HyperplaneException
+
+
+class KGERSConsensus(KGERSCore):
+  """
+  The consensus KGERS algorithm is a RANSAC style variant. Hyperplanes are
+  generated in batches of K and each one is scored by the number of points
+  in a validation block that it fits within a threshold (its inliers). The
+  validation block is held out of the samples, so a hyperplane never
+  scores the points it was solved from.
+
+  The threshold is an absolute residual, in the units of the solutions, so
+  it must be set for the scale of the data set.
+
+  Generation stops as soon as enough hyperplanes have been tried to find
+  an all inlier sample with the configured confidence. The hyperplane with
+  the most inliers is then refit by least squares on all of its inliers
+  in the training set.
+  """
+
+  # The smallest absolute determinant of a sample that is solved.
+  MIN_DETERMINANT = 1e-10
+
+
+  @staticmethod
+  def required(ratio, size, confidence):
+    """
+    Returns the number of samples needed to draw at least one sample of
+    inliers only with the confidence provided.
+
+    Key arguments:
+    ratio      -- The fraction of points that are inliers.
+    size       -- The number of points in a sample.
+    confidence -- The probability of drawing an all inlier sample.
+    """
+
+    if (ratio >= 1.0):
+      return 1
+
+    probability = pow(ratio, size)
+    if (probability <= 0.0):
+      return float('inf')
+
+    return int(math.ceil(math.log(1.0 - confidence) /
+      math.log(1.0 - probability)))
+
+
+  @Profiler.timed('kgers.execute')
+  def execute(self):
+    """See parent class summary."""
+
+    k = self.config.getint('KGERS', 'K')
+    max_hyperplanes = k * ConfigUtils.getint(self.config, 'KGERSConsensus',
+      'Multiple', 10)
+    threshold = ConfigUtils.getfloat(self.config, 'KGERSConsensus',
+      'Threshold', 1.0)
+    confidence = ConfigUtils.getfloat(self.config, 'KGERSConsensus',
+      'Confidence', 0.99)
+    num_of_validators = ConfigUtils.getint(self.config, 'KGERSConsensus',
+      'NumOfValidationPoints', 100)
+
+    # The linear equation matrix of the training points.
+    size = self.training[0].dimensions
+    a = np.ones((len(self.training), size), dtype=Statistics.DTYPE)
+    a[:, :-1] = [point.features for point in self.training]
+    b = np.array([point.solution for point in self.training],
+      dtype=Statistics.DTYPE)
+
+    # Every hyperplane is scored against the same validation block, and is
+    #  sampled from the other half of the training points at least.
+    rows = np.random.permutation(len(self.training))
+    validators = rows[:min(num_of_validators, len(self.training) / 2)]
+    rows = rows[len(validators):]
+    validators_a = a[validators]
+    validators_b = b[validators]
+
+    coefficients = []
+    inliers = []
+    required = max_hyperplanes
+    attempts = 0
+
+    while (len(coefficients) < min(required, max_hyperplanes) and
+      attempts < max_hyperplanes + Hyperplane.MAX_SAMPLE_ATTEMPTS):
+      # Sample a batch of K hyperplanes at once.
+      samples = rows[np.array([random.sample(xrange(len(rows)), size)
+        for i in range(k)])]
+      attempts += k
+
+      # Only solve the samples that are linearly independent.
+      samples_a = a[samples]
+      samples_b = b[samples]
+      independent = np.abs(np.linalg.det(samples_a)) > \
+        KGERSConsensus.MIN_DETERMINANT
+
+      Profiler.count('hyperplane.retries', int(np.sum(~independent)))
+      if not independent.any():
+        continue
+
+      batch = np.linalg.solve(samples_a[independent], samples_b[independent])
+
+      # Count the inliers of every hyperplane in the batch in one operation.
+      residuals = np.abs(np.dot(validators_a, batch.T) - validators_b[:, None])
+      counts = np.sum(residuals <= threshold, axis=0)
+
+      coefficients.extend(batch)
+      inliers.extend(counts)
+
+      # Update how many hyperplanes are needed based on the best so far.
+      required = KGERSConsensus.required(
+        max(inliers) / float(len(validators)), size, confidence)
+
+    if (len(coefficients) == 0):
+      Profiler.count('hyperplane.failures')
+      raise HyperplaneException(
+        "Failed to generate a hyperplane from the samples.")
+
+    best = coefficients[int(np.argmax(inliers))]
+
+    # Refit the best hyperplane on its consensus set, the fraction of the
+    #  training points it holds is more precise than that of the block.
+    consensus = np.nonzero(np.abs(np.dot(a, best) - b) <= threshold)[0]
+    self.inliers = len(consensus) / float(len(self.training))
+    if (len(consensus) >= size):
+      best = Statistics.factory(
+        [self.training[i] for i in consensus]).solve()
+
+    self.coefficients = np.array(best, dtype=Point.DTYPE)
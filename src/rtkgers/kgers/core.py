@@ -11,10 +11,15 @@ The style guide follows the strict python PEP 8 guidelines.
 import abc
 import math
 
-import rtkgers.utils.math as MathUtils
-
+from rtkgers.dataset import Dataset
+from rtkgers.folds import Folds
 from rtkgers.hyperplane import Hyperplane
+from rtkgers.pool import Batch
+from rtkgers.pool import Pool
 
+from rtkgers.exceptions.batch import BatchException
+from rtkgers.exceptions.hyperplane import HyperplaneBatchException
+from rtkgers.exceptions.hyperplane import HyperplaneException
 from rtkgers.exceptions.kgers import KGERSException
 
 
@@ -26,25 +31,45 @@ class KGERSCore(object):
   """
   __metaclass__ = abc.ABCMeta
 
+  # The capabilities of the algorithm, see rtkgers.registry.
+  CAPABILITIES = frozenset()
+
 
-  def __init__(self, config, points, test = None):
+  def __init__(self, config, points, test = None, folds = None, fold = 0):
     """
     Contructor.
 
     Key arguments:
-    points -- The points to train on.
+    points -- The points to train on, or the data set of the points.
     test   -- The points to test against. If this is not provided,
     approximately 30 percent of the points provided will be used
     for test.
+    folds  -- The folds of the points to take the training and test points
+    from, instead of the test points (optional, see rtkgers.folds).
+    fold   -- The fold of the folds to test against.
     """
 
     # Save the configuration.
     self.config = config
 
+    if isinstance(points, Dataset):
+      points = points.points()
+
     # Make sure we have more than one point.
     if (len(points) == 0):
       raise KGERSException("Not enough points provided.")
 
+    if (folds != None):
+      self.training, self.test = folds.take(points, fold)
+
+      # The training points need 2 * (n + 1) points, and there must be one
+      #  point to test against.
+      if (len(self.training) < 2 * points[0].dimensions or
+        len(self.test) == 0):
+        raise KGERSException("Not enough points to train on.")
+
+      return
+
     # If a test set was provided, we only need 2 * (n + 1) points.
     if (test != None and len(points) < 2 * points[0].dimensions):
       raise KGERSException("Not enough points to train on.")
@@ -55,9 +80,12 @@ class KGERSCore(object):
 
     # Check if we need to generate the test set.
     if (test == None):
-      # Take 30% of the data set for testing, or the minimum required.
+      # Take 30% of the data set for testing, or the minimum required, from
+      #  one permutation of the points.
       num_of_test = max([int(len(points) * .3), points[0].dimensions])
-      test = MathUtils.sample(points, size=num_of_test)
+      self.training, self.test = \
+        Folds.holdout(len(points), num_of_test).take(points)
+      return
 
     # Set the test set.
     self.test = test
@@ -65,6 +93,36 @@ class KGERSCore(object):
     self.training = list(set(points).difference(set(self.test)))
 
 
+  def dispatch(self, workers, tolerance=0):
+    """
+    Runs the workers as one batch on the shared pool and returns the
+    workers that succeeded.
+
+    As soon as more workers failed than tolerated, the result is unusable:
+    the remaining workers are cancelled and one exception with the
+    exceptions of every failed worker is raised.
+
+    Key arguments:
+    workers   -- The workers to run.
+    tolerance -- The number of workers that may fail.
+    """
+
+    batch = Batch(Pool.shared(), tolerance)
+    for worker in workers:
+      batch.submit(worker.run)
+
+    try:
+      futures = batch.wait()
+    except BatchException, ex:
+      if all([isinstance(exception, HyperplaneException)
+        for exception in ex.exceptions]):
+        raise HyperplaneBatchException(str(ex), ex.exceptions)
+      raise
+
+    return [worker for worker, future in zip(workers, futures)
+      if future.exception() == None]
+
+
   def error(self, test = None):
     """
     Returns the RMSE of the hyperplane based on the test set.
@@ -8,14 +8,15 @@ The style guide follows the strict python PEP 8 guidelines.
 @requires Python >=2.7
 @copyright 2014 - Present Aaron Zampaglione
 """
-from Queue import PriorityQueue
+import numpy as np
 
+import rtkgers.utils.config as ConfigUtils
 import rtkgers.utils.math as MathUtils
 import rtkgers.utils.hyperplane as HyperplaneUtils
 
-from rtkgers.exthread import ExThread
 from rtkgers.hyperplane import Hyperplane
 from rtkgers.kgers.core import KGERSCore
+from rtkgers.profiler import Profiler
 
 from rtkgers.exceptions.hyperplane import HyperplaneException
 
@@ -24,8 +25,13 @@ class KGERSDiameter(KGERSCore):
   """
   The diameter KGERS algorithm takes the top X percent of the hyperplanes
   generated ranked by their respective diameter between points.
+
+  The spread can also be measured as the volume of the bounding box of
+  the points, or the smallest distance between two of the points
+  ([KGERSDiameter] Metric).
   """
 
+  @Profiler.timed('kgers.execute')
   def execute(self):
     """See parent class summary."""
 
@@ -34,40 +40,32 @@ class KGERSDiameter(KGERSCore):
 
     workers = []
     for i in range(0, num_of_hyperplanes):
-      worker = KGERSDiameter.Worker(i, self.training)
-      worker.start()
-      workers.append(worker)
-
-    # Wait for all threads to complete.
-    #  If an exception occurs, catch only the latest one
-    #  and make sure all the threads finish out.
-    queue = PriorityQueue()
-    exception = None
-    for worker in workers:
-      try:
-        worker.join_with_exception()
-        # Insert the result into the queue, with the higher weights in front.
-        queue.put((1.0 / worker.diameter, (worker.hyperplane, worker.weight)))
-      except Exception, ex:
-        exception = ex
-
-    # If there was an exception in any of the threads,
-    #  re-throw the latest one.
-    if exception:
-      raise exception
+      workers.append(KGERSDiameter.Worker(i, self.training))
+
+    # Only K hyperplanes are needed, the rest may fail.
+    workers = self.dispatch(workers, num_of_hyperplanes -
+      self.config.getint('KGERS', 'K'))
 
+    # Measure the spread of the points of every hyperplane at once.
+    metric = ConfigUtils.get(self.config, 'KGERSDiameter', 'Metric',
+      'Diameter')
+    blocks = np.array([[point.coordinates for point in worker.hyperplane.points]
+      for worker in workers])
+    spreads = HyperplaneUtils.spread(blocks, metric)
+
+    # Keep the K hyperplanes with the largest spread.
+    ranked = np.argsort(-spreads, kind='mergesort')
     hyperplanes = []
     weights = []
-    for i in range(0, self.config.getint('KGERS', 'K')):
-      hyperplane, weight = queue.get()[1]
-      hyperplanes.append(hyperplane)
-      weights.append(weight)
+    for i in ranked[:self.config.getint('KGERS', 'K')]:
+      hyperplanes.append(workers[i].hyperplane)
+      weights.append(workers[i].weight)
 
     self.coefficients = HyperplaneUtils.average(hyperplanes, weights)
 
 
-  class Worker(ExThread):
-    """The worker thread for the container class."""
+  class Worker(object):
+    """The worker task for the container class."""
 
 
     def __init__(self, uid, training):
@@ -75,19 +73,17 @@ class KGERSDiameter(KGERSCore):
       Constructor.
 
       Key arguments:
-      uid      -- The unique ID of the thread.
-      training -- The training set to use for this thread.
+      uid      -- The unique ID of the task.
+      training -- The training set to use for this task.
       """
 
-      ExThread.__init__(self)
       self.uid = uid
       self.training = training
       self.hyperplane = None
       self.weight = None
-      self.diameter = 0.0
 
 
-    def run_with_exception(self):
+    def run(self):
       """Generates a hyperplane and determines the weight."""
 
       # Create a hyperplane from the training points.
@@ -103,10 +99,3 @@ class KGERSDiameter(KGERSCore):
 
       # Find the weight for this hyperplane.
       self.weight = HyperplaneUtils.weigh(hyperplane, validators)
-
-      # Find the diameter based on the distance between each segment.
-      size = len(hyperplane.points)
-      for i in range(0, size):
-        point1 = hyperplane.points[i]
-        point2 = hyperplane.points[(i + 1) % size]
-        self.diameter += point1.distance(point2)
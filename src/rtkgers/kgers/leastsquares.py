@@ -0,0 +1,80 @@
+"""
+See class summary.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import numpy as np
+
+import rtkgers.registry as Registry
+import rtkgers.utils.config as ConfigUtils
+
+from rtkgers.kgers.core import KGERSCore
+from rtkgers.point import Point
+from rtkgers.profiler import Profiler
+from rtkgers.statistics import Statistics
+
+
+class KGERSLeastSquares(KGERSCore):
+  """
+  The least squares KGERS algorithm fits the training points with a single
+  closed form (ridge) least squares solve from their sufficient
+  statistics, rather than averaging sampled hyperplanes.
+
+  It is deterministic and much cheaper than the sampling variants, which
+  makes it a good surrogate for scoring splits in a tree. As the fit only
+  depends on the statistics of the training points, a tree can score
+  every split of a node from prefix sums of the statistics.
+  """
+
+  # The capabilities of the algorithm, see rtkgers.registry.
+  CAPABILITIES = frozenset([Registry.BATCH_FIT, Registry.INCREMENTAL])
+
+
+  @staticmethod
+  def batch(config, ata, aty):
+    """
+    Returns the coefficients of many fits in one operation.
+
+    Key arguments:
+    config -- The configuration to use.
+    ata    -- The (m, d, d) A'A statistics of the fits.
+    aty    -- The (m, d) A'y statistics of the fits.
+    """
+
+    ridge = ConfigUtils.getfloat(config, 'KGERSLeastSquares', 'Ridge', 0.0)
+
+    # The constant is not penalized by the ridge.
+    ata = ata.copy()
+    diagonal = np.arange(ata.shape[1] - 1)
+    ata[:, diagonal, diagonal] += ridge
+
+    # The same (minimum norm) solve as a single fit, see fit().
+    return Statistics.lstsq(ata, aty)
+
+
+  @staticmethod
+  def fit(config, statistics):
+    """
+    Returns the coefficients of the fit of the statistics.
+
+    Key arguments:
+    config     -- The configuration to use.
+    statistics -- The statistics of the training points.
+    """
+
+    return statistics.solve(ConfigUtils.getfloat(config, 'KGERSLeastSquares',
+      'Ridge', 0.0))
+
+
+  @Profiler.timed('kgers.execute')
+  def execute(self):
+    """See parent class summary."""
+
+    self.statistics = Statistics.factory(self.training)
+    self.coefficients = KGERSLeastSquares.fit(self.config,
+      self.statistics).astype(Point.DTYPE)
@@ -11,9 +11,9 @@ The style guide follows the strict python PEP 8 guidelines.
 import rtkgers.utils.math as MathUtils
 import rtkgers.utils.hyperplane as HyperplaneUtils
 
-from rtkgers.exthread import ExThread
 from rtkgers.hyperplane import Hyperplane
 from rtkgers.kgers.core import KGERSCore
+from rtkgers.profiler import Profiler
 
 from rtkgers.exceptions.hyperplane import HyperplaneException
 
@@ -24,6 +24,7 @@ class KGERSOriginal(KGERSCore):
   them using weights generated by cross validation.
   """
 
+  @Profiler.timed('kgers.execute')
   def execute(self):
     """See parent class summary."""
 
@@ -32,32 +33,19 @@ class KGERSOriginal(KGERSCore):
 
     workers = []
     for i in range(0, self.config.getint('KGERS', 'K')):
-      worker = KGERSOriginal.Worker(i, self.training)
-      worker.start()
-      workers.append(worker)
-
-    # Wait for all threads to complete.
-    #  If an exception occurs, catch only the latest one
-    #  and make sure all the threads finish out.
-    exception = None
+      workers.append(KGERSOriginal.Worker(i, self.training))
+
+    self.dispatch(workers)
+
     for worker in workers:
-      try:
-        worker.join_with_exception()
-        hyperplanes.append(worker.hyperplane)
-        weights.append(worker.weight)
-      except Exception, ex:
-        exception = ex
-
-    # If there was an exception in any of the threads,
-    #  re-throw the latest one.
-    if exception:
-      raise exception
+      hyperplanes.append(worker.hyperplane)
+      weights.append(worker.weight)
 
     self.coefficients = HyperplaneUtils.average(hyperplanes, weights)
 
 
-  class Worker(ExThread):
-    """The worker thread for the container class."""
+  class Worker(object):
+    """The worker task for the container class."""
 
 
     def __init__(self, uid, training):
@@ -65,18 +53,17 @@ class KGERSOriginal(KGERSCore):
       Constructor.
 
       Key arguments:
-      uid      -- The unique ID of the thread.
-      training -- The training set to use for this thread.
+      uid      -- The unique ID of the task.
+      training -- The training set to use for this task.
       """
 
-      ExThread.__init__(self)
       self.uid = uid
       self.training = training
       self.hyperplane = None
       self.weight = None
 
 
-    def run_with_exception(self):
+    def run(self):
       """Generates a hyperplane and determines the weight."""
 
       # Create a hyperplane from the training points.
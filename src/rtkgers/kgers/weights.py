@@ -13,9 +13,9 @@ from Queue import PriorityQueue
 import rtkgers.utils.math as MathUtils
 import rtkgers.utils.hyperplane as HyperplaneUtils
 
-from rtkgers.exthread import ExThread
 from rtkgers.hyperplane import Hyperplane
 from rtkgers.kgers.core import KGERSCore
+from rtkgers.profiler import Profiler
 
 from rtkgers.exceptions.hyperplane import HyperplaneException
 
@@ -26,6 +26,7 @@ class KGERSWeights(KGERSCore):
   generated ranked by their respective weights.
   """
 
+  @Profiler.timed('kgers.execute')
   def execute(self):
     """See parent class summary."""
 
@@ -34,27 +35,16 @@ class KGERSWeights(KGERSCore):
 
     workers = []
     for i in range(0, num_of_hyperplanes):
-      worker = KGERSWeights.Worker(i, self.training)
-      worker.start()
-      workers.append(worker)
+      workers.append(KGERSWeights.Worker(i, self.training))
 
-    # Wait for all threads to complete.
-    #  If an exception occurs, catch only the latest one
-    #  and make sure all the threads finish out.
+    # Only K hyperplanes are needed, the rest may fail.
+    workers = self.dispatch(workers, num_of_hyperplanes -
+      self.config.getint('KGERS', 'K'))
+
+    # Insert the results into the queue, with the higher weights in front.
     queue = PriorityQueue()
-    exception = None
     for worker in workers:
-      try:
-        worker.join_with_exception()
-        # Insert the result into the queue, with the higher weights in front.
-        queue.put((1.0 / worker.weight, (worker.hyperplane, worker.weight)))
-      except Exception, ex:
-        exception = ex
-
-    # If there was an exception in any of the threads,
-    #  re-throw the latest one.
-    if exception:
-      raise exception
+      queue.put((1.0 / worker.weight, (worker.hyperplane, worker.weight)))
 
     hyperplanes = []
     weights = []
@@ -66,8 +56,8 @@ class KGERSWeights(KGERSCore):
     self.coefficients = HyperplaneUtils.average(hyperplanes, weights)
 
 
-  class Worker(ExThread):
-    """The worker thread for the container class."""
+  class Worker(object):
+    """The worker task for the container class."""
 
 
     def __init__(self, uid, training):
@@ -75,18 +65,17 @@ class KGERSWeights(KGERSCore):
       Constructor.
 
       Key arguments:
-      uid      -- The unique ID of the thread.
-      training -- The training set to use for this thread.
+      uid      -- The unique ID of the task.
+      training -- The training set to use for this task.
       """
 
-      ExThread.__init__(self)
       self.uid = uid
       self.training = training
       self.hyperplane = None
       self.weight = None
 
 
-    def run_with_exception(self):
+    def run(self):
       """Generates a hyperplane and determines the weight."""
 
       # Create a hyperplane from the training points.
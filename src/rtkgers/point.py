@@ -22,12 +22,35 @@ class Point(object):
   point = Point([x, y], z)
   point.features = [x, y]
   point.solution = z
+
+  Points are slotted, as there are millions of them.
   """
+  __slots__ = ('features', 'solution')
 
-  # The data type for the coordinates of a point.
+  # The data type for the coordinates of a point, "[Main] Precision".
+  #  Sums and solves over many coordinates are always carried out in
+  #  double precision.
   DTYPE = np.dtype(float)
 
 
+  @staticmethod
+  def view(coordinates):
+    """
+    Factory method that produces a point whose features are a view into
+    a coordinate array (features followed by the solution), rather than
+    a copy, e.g. a row of a shared data set.
+
+    Key arguments:
+    coordinates -- The coordinate array.
+    """
+
+    point = Point.__new__(Point)
+    point.features = coordinates[:-1]
+    point.solution = float(coordinates[-1])
+
+    return point
+
+
   def __init__(self, features, solution = None):
     """
     Constructor.
@@ -47,8 +70,26 @@ class Point(object):
     # Store the solution.
     self.solution = solution
 
-    # Find the dimensions of the point.
-    self.dimensions = len(self.coordinates)
+
+  def __getstate__(self):
+    """Returns the state to pickle."""
+
+    return (self.features, self.solution)
+
+
+  def __setstate__(self, state):
+    """
+    Restores a pickled state.
+
+    Key arguments:
+    state -- The pickled state, a dictionary for points pickled before
+             they were slotted.
+    """
+
+    if isinstance(state, dict):
+      state = (state['features'], state['solution'])
+
+    self.features, self.solution = state
 
 
   def __str__(self):
@@ -64,6 +105,13 @@ class Point(object):
     return np.append(self.features, [self.solution])
 
 
+  @property
+  def dimensions(self):
+    """Returns the dimensions of the point (features plus solution)."""
+
+    return len(self.features) + 1
+
+
   def distance(self, point):
     """
     Returns the distance between this point and another point.
@@ -0,0 +1,313 @@
+"""
+See class summary.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import sys
+import threading
+import Queue
+
+from rtkgers.exceptions.batch import BatchException
+from rtkgers.exceptions.batch import CancelledException
+
+
+class Batch(object):
+  """
+  A group of tasks that fails fast.
+
+  Once more tasks have failed than the batch tolerates, the batch is
+  cancelled: the tasks that have not started are skipped, and the tasks
+  that are running can stop early by checking Batch.interrupted().
+  """
+
+
+  @staticmethod
+  def interrupted():
+    """
+    Returns true if the batch of the task running in this thread was
+    cancelled.
+    """
+
+    future = getattr(Future.Local, 'future', None)
+
+    return future != None and future.batch != None and \
+      future.batch.cancelled()
+
+
+  def __init__(self, pool, tolerance=0):
+    """
+    Constructor.
+
+    Key arguments:
+    pool      -- The pool to run the tasks on.
+    tolerance -- The number of tasks that may fail without cancelling
+                 the batch.
+    """
+
+    self.pool = pool
+    self.tolerance = tolerance
+    self.futures = []
+    self.failures = 0
+    self.lock = threading.Lock()
+    self.event = threading.Event()
+
+
+  def cancel(self):
+    """Cancels the tasks of the batch that have not finished."""
+
+    self.event.set()
+
+
+  def cancelled(self):
+    """Returns true if the batch was cancelled."""
+
+    return self.event.is_set()
+
+
+  def fail(self):
+    """Records a failed task, cancelling the batch if it is one too many."""
+
+    with self.lock:
+      self.failures += 1
+      if self.failures > self.tolerance:
+        self.cancel()
+
+
+  def submit(self, function, *args):
+    """
+    Submits a task to the batch and returns its future.
+
+    Key arguments:
+    function -- The function to run.
+    args     -- The arguments to run the function with.
+    """
+
+    future = Future(function, args, self)
+    self.futures.append(future)
+    self.pool.enqueue(future)
+
+    return future
+
+
+  def wait(self):
+    """
+    Waits for every task of the batch and returns their futures.
+
+    If more tasks failed than the batch tolerates, a BatchException with
+    the exceptions of every failed task is raised instead.
+    """
+
+    for future in self.futures:
+      future.event.wait()
+
+    if self.failures > self.tolerance:
+      exceptions = [future.exception() for future in self.futures]
+      raise BatchException(
+        "%d of %d tasks failed." % (self.failures, len(self.futures)),
+        [exception for exception in exceptions if exception != None and
+          not isinstance(exception, CancelledException)])
+
+    return self.futures
+
+
+class Future(object):
+  """
+  The pending result of a task submitted to a pool.
+  """
+
+  # The future of the task running in each thread.
+  Local = threading.local()
+
+
+  def __init__(self, function, args, batch=None):
+    """
+    Constructor.
+
+    Key arguments:
+    function -- The function to run.
+    args     -- The arguments to run the function with.
+    batch    -- The batch the task belongs to (optional).
+    """
+
+    self.function = function
+    self.args = args
+    self.batch = batch
+    self.value = None
+    self.exc_info = None
+    self.event = threading.Event()
+
+
+  def done(self):
+    """Returns true if the task has finished."""
+
+    return self.event.is_set()
+
+
+  def exception(self):
+    """Waits for the task and returns its exception, if one occurred."""
+
+    self.event.wait()
+
+    if self.exc_info == None:
+      return None
+
+    return self.exc_info[1]
+
+
+  def result(self):
+    """Waits for the task and returns its result, or raises its exception."""
+
+    self.event.wait()
+
+    if self.exc_info != None:
+      raise self.exc_info[0], self.exc_info[1], self.exc_info[2]
+
+    return self.value
+
+
+  def run(self):
+    """Runs the task, this method should only be called by the pool."""
+
+    # Skip the task if its batch was cancelled before it started.
+    if self.batch != None and self.batch.cancelled():
+      self.exc_info = (CancelledException,
+        CancelledException("The task was cancelled."), None)
+      self.event.set()
+      return
+
+    previous = getattr(Future.Local, 'future', None)
+    Future.Local.future = self
+
+    try:
+      self.value = self.function(*self.args)
+    except Exception:
+      self.exc_info = sys.exc_info()
+      if self.batch != None and \
+        not isinstance(self.exc_info[1], CancelledException):
+        self.batch.fail()
+    finally:
+      Future.Local.future = previous
+      self.event.set()
+
+
+class Pool(object):
+  """
+  A fixed number of worker threads that run submitted tasks.
+
+  The threads are created once and reused, so the number of live threads
+  stays constant no matter how many tasks are submitted. A task submitted
+  from one of the pool's own threads is run immediately in that thread,
+  so nested submissions can not deadlock the pool.
+  """
+
+  # The default number of threads of the shared pool.
+  DEFAULT_SIZE = 4
+
+  # The pool shared by the whole process, see Pool.shared().
+  Shared = None
+
+  # The lock that guards the creation of the shared pool.
+  Shared_Lock = threading.Lock()
+
+
+  @staticmethod
+  def configure(size):
+    """
+    Replaces the shared pool with one of the size provided.
+
+    Key arguments:
+    size -- The number of threads.
+    """
+
+    with Pool.Shared_Lock:
+      if Pool.Shared != None:
+        Pool.Shared.shutdown()
+      Pool.Shared = Pool(size)
+
+
+  @staticmethod
+  def shared():
+    """Returns the shared pool, creating it if necessary."""
+
+    with Pool.Shared_Lock:
+      if Pool.Shared == None:
+        Pool.Shared = Pool(Pool.DEFAULT_SIZE)
+
+      return Pool.Shared
+
+
+  def __init__(self, size):
+    """
+    Constructor.
+
+    Key arguments:
+    size -- The number of threads.
+    """
+
+    self.size = size
+    self.tasks = Queue.Queue()
+    self.threads = []
+
+    for i in range(0, size):
+      thread = threading.Thread(target=self.work)
+      thread.daemon = True
+      thread.start()
+      self.threads.append(thread)
+
+    self.idents = set([thread.ident for thread in self.threads])
+
+
+  def enqueue(self, future):
+    """
+    Queues a future to be run by the threads.
+
+    Key arguments:
+    future -- The future to run.
+    """
+
+    if threading.current_thread().ident in self.idents:
+      future.run()
+    else:
+      self.tasks.put(future)
+
+
+  def shutdown(self):
+    """Finishes the tasks already submitted and stops the threads."""
+
+    for thread in self.threads:
+      self.tasks.put(None)
+
+    for thread in self.threads:
+      if thread.ident != threading.current_thread().ident:
+        thread.join()
+
+
+  def submit(self, function, *args):
+    """
+    Submits a task to the pool and returns its future.
+
+    Key arguments:
+    function -- The function to run.
+    args     -- The arguments to run the function with.
+    """
+
+    future = Future(function, args)
+    self.enqueue(future)
+
+    return future
+
+
+  def work(self):
+    """Runs tasks until the pool is shut down."""
+
+    while True:
+      future = self.tasks.get()
+      if future == None:
+        return
+
+      future.run()
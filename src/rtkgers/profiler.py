@@ -0,0 +1,200 @@
+"""
+See class summary.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import functools
+import threading
+import time
+
+
+class Profiler(object):
+  """
+  Collects call counts, timings and counters for the phases of training.
+
+  The profiler is disabled by default, in which case every hook returns
+  immediately. Phases are timed with either the context manager,
+
+    with Profiler.timer('phase'):
+      ...
+
+  or the decorator, @Profiler.timed('phase').
+  """
+
+  # Whether the profiler is collecting.
+  Enabled = False
+
+  # The lock that guards the collected values across worker threads.
+  Lock = threading.Lock()
+
+  # The event counters, keyed by name.
+  Counters = {}
+
+  # The phase timers, keyed by name, as [calls, total seconds].
+  Timers = {}
+
+
+  @staticmethod
+  def count(name, amount=1):
+    """
+    Increments an event counter.
+
+    Key arguments:
+    name   -- The name of the counter.
+    amount -- The amount to increment by.
+    """
+
+    if not Profiler.Enabled:
+      return
+
+    with Profiler.Lock:
+      Profiler.Counters[name] = Profiler.Counters.get(name, 0) + amount
+
+
+  @staticmethod
+  def enable(enabled=True):
+    """
+    Enables (or disables) the profiler.
+
+    Key arguments:
+    enabled -- True to start collecting.
+    """
+
+    Profiler.Enabled = enabled
+
+
+  @staticmethod
+  def record(name, seconds):
+    """
+    Records one call of a phase.
+
+    Key arguments:
+    name    -- The name of the phase.
+    seconds -- The time spent in the phase.
+    """
+
+    with Profiler.Lock:
+      timer = Profiler.Timers.setdefault(name, [0, 0.0])
+      timer[0] += 1
+      timer[1] += seconds
+
+
+  @staticmethod
+  def reset():
+    """Clears all the collected values."""
+
+    with Profiler.Lock:
+      Profiler.Counters = {}
+      Profiler.Timers = {}
+
+
+  @staticmethod
+  def summary():
+    """Returns the collected values as a printable table."""
+
+    lines = ["%-30s %10s %14s %14s" % ('Phase', 'Calls', 'Total (s)',
+      'Mean (s)')]
+    for name in sorted(Profiler.Timers):
+      calls, total = Profiler.Timers[name]
+      lines.append("%-30s %10d %14.6f %14.6f" % (name, calls, total,
+        total / calls))
+
+    lines.append("")
+    lines.append("%-30s %10s" % ('Counter', 'Count'))
+    for name in sorted(Profiler.Counters):
+      lines.append("%-30s %10d" % (name, Profiler.Counters[name]))
+
+    return "\n".join(lines)
+
+
+  @staticmethod
+  def timed(name):
+    """
+    Decorator that times every call of the function as a phase.
+
+    Key arguments:
+    name -- The name of the phase.
+    """
+
+    def decorator(function):
+      @functools.wraps(function)
+      def wrapper(*args, **kwargs):
+        if not Profiler.Enabled:
+          return function(*args, **kwargs)
+
+        with Profiler.Timer(name):
+          return function(*args, **kwargs)
+
+      return wrapper
+
+    return decorator
+
+
+  @staticmethod
+  def timer(name):
+    """
+    Returns a context manager that times a phase.
+
+    Key arguments:
+    name -- The name of the phase.
+    """
+
+    if not Profiler.Enabled:
+      return Profiler.NULL_TIMER
+
+    return Profiler.Timer(name)
+
+
+  class Timer(object):
+    """Context manager that records the time spent in a phase."""
+
+
+    def __init__(self, name):
+      """
+      Constructor.
+
+      Key arguments:
+      name -- The name of the phase.
+      """
+
+      self.name = name
+      self.start = None
+
+
+    def __enter__(self):
+      """Starts the clock."""
+
+      self.start = time.time()
+      return self
+
+
+    def __exit__(self, *exc_info):
+      """Stops the clock and records the phase."""
+
+      Profiler.record(self.name, time.time() - self.start)
+      return False
+
+
+  class NullTimer(object):
+    """Context manager that does nothing, used while disabled."""
+
+
+    def __enter__(self):
+      """Does nothing."""
+
+      return self
+
+
+    def __exit__(self, *exc_info):
+      """Does nothing."""
+
+      return False
+
+
+# The shared no-op timer.
+Profiler.NULL_TIMER = Profiler.NullTimer()
@@ -0,0 +1,194 @@
+"""
+The registry of the algorithms that can be selected by name in the
+configuration: KGERS variants, tree growers and split candidate
+strategies.
+
+An algorithm is registered as "module:attribute" and its module is only
+imported the first time the algorithm is loaded, so selecting one
+algorithm does not pull in every other one. Algorithms of other packages
+are registered through the "rtkgers.<kind>" entry point groups, e.g.
+
+  entry_points={'rtkgers.kgers': ['KGERSMine = mine.kgers:KGERSMine']}
+
+An algorithm declares what it supports in its CAPABILITIES attribute,
+which lets the tree pick faster paths for it.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import importlib
+import threading
+
+from rtkgers.exceptions.registry import RegistryException
+
+
+# The kind of the KGERS variants.
+KGERS = 'kgers'
+
+
+# The kind of the tree growers.
+RTREE = 'rtree'
+
+
+# The kind of the split candidate strategies.
+CANDIDATES = 'candidates'
+
+
+# The capability of a KGERS variant that can fit many point sets in one
+#  call, see KGERSLeastSquares.batch().
+BATCH_FIT = 'batch_fit'
+
+
+# The capability of a KGERS variant whose fit only depends on the
+#  sufficient statistics of its training points, see KGERSLeastSquares.fit().
+INCREMENTAL = 'incremental'
+
+
+# The algorithms of each kind by name, as "module:attribute".
+ALGORITHMS = {
+  KGERS: {
+    'KGERSConsensus': 'rtkgers.kgers.consensus:KGERSConsensus',
+    'KGERSDiameter': 'rtkgers.kgers.diameter:KGERSDiameter',
+    'KGERSLeastSquares': 'rtkgers.kgers.leastsquares:KGERSLeastSquares',
+    'KGERSOriginal': 'rtkgers.kgers.original:KGERSOriginal',
+    'KGERSWeights': 'rtkgers.kgers.weights:KGERSWeights'
+  },
+  RTREE: {
+    'RTreeBestFirst': 'rtkgers.rtree.bestfirst:RTreeBestFirst',
+    'RTreeDistributed': 'rtkgers.rtree.distributed:RTreeDistributed',
+    'RTreeOriginal': 'rtkgers.rtree.original:RTreeOriginal'
+  },
+  CANDIDATES: {
+    'All': 'rtkgers.rtree.candidates:every',
+    'Quantiles': 'rtkgers.rtree.candidates:quantiles',
+    'Random': 'rtkgers.rtree.candidates:sample'
+  }
+}
+
+
+# The algorithms loaded so far, by (kind, name).
+LOADED = {}
+
+
+# The kinds whose entry points were discovered.
+DISCOVERED = set()
+
+
+# The lock that guards the loading of algorithms.
+LOCK = threading.RLock()
+
+
+def capabilities(kind, name):
+  """
+  Returns the capabilities of an algorithm.
+
+  Key arguments:
+  kind -- The kind of the algorithm.
+  name -- The name of the algorithm.
+  """
+
+  return getattr(load(kind, name), 'CAPABILITIES', frozenset())
+
+
+def discover(kind):
+  """
+  Registers the algorithms of a kind that other packages provide through
+  entry points. The built-in algorithms take precedence.
+
+  Key arguments:
+  kind -- The kind of the algorithms.
+  """
+
+  with LOCK:
+    if kind in DISCOVERED:
+      return
+
+    DISCOVERED.add(kind)
+
+    # Entry points are only available with setuptools installed.
+    try:
+      import pkg_resources
+    except ImportError:
+      return
+
+    for entry in pkg_resources.iter_entry_points('rtkgers.' + kind):
+      ALGORITHMS.setdefault(kind, {}).setdefault(entry.name,
+        '%s:%s' % (entry.module_name, '.'.join(entry.attrs)))
+
+
+def load(kind, name):
+  """
+  Returns an algorithm, importing its module if necessary.
+
+  Key arguments:
+  kind -- The kind of the algorithm.
+  name -- The name of the algorithm.
+  """
+
+  with LOCK:
+    if not (kind, name) in LOADED:
+      # Entry points are only looked up for names that are not built in,
+      #  as scanning them is slow.
+      if not name in ALGORITHMS.get(kind, {}):
+        discover(kind)
+      if not name in ALGORITHMS.get(kind, {}):
+        raise RegistryException(
+          "Unknown %s algorithm \"%s\"." % (kind, name))
+
+      module, attribute = ALGORITHMS[kind][name].split(':')
+      LOADED[(kind, name)] = getattr(importlib.import_module(module),
+        attribute)
+
+    return LOADED[(kind, name)]
+
+
+def modules():
+  """Returns the modules of every registered algorithm, e.g. for builds."""
+
+  return sorted(set([path.split(':')[0] for algorithms in ALGORITHMS.values()
+    for path in algorithms.values()]))
+
+
+def names(kind):
+  """
+  Returns the names of the algorithms of a kind.
+
+  Key arguments:
+  kind -- The kind of the algorithms.
+  """
+
+  discover(kind)
+
+  return sorted(ALGORITHMS.get(kind, {}).keys())
+
+
+def register(kind, name, path):
+  """
+  Registers an algorithm, replacing any algorithm of the same name.
+
+  Key arguments:
+  kind -- The kind of the algorithm.
+  name -- The name of the algorithm.
+  path -- The location of the algorithm, as "module:attribute".
+  """
+
+  with LOCK:
+    ALGORITHMS.setdefault(kind, {})[name] = path
+    LOADED.pop((kind, name), None)
+
+
+def supports(kind, name, capability):
+  """
+  Returns true if an algorithm has a capability.
+
+  Key arguments:
+  kind       -- The kind of the algorithm.
+  name       -- The name of the algorithm.
+  capability -- The capability, e.g. INCREMENTAL.
+  """
+
+  return capability in capabilities(kind, name)
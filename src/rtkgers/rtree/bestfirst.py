@@ -0,0 +1,129 @@
+"""
+See class summary.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import heapq
+
+import rtkgers.utils.config as ConfigUtils
+
+from rtkgers.rtree.node import Node
+from rtkgers.rtree.original import RTreeOriginal
+
+
+class RTreeBestFirst(RTreeOriginal):
+  """
+  Grows the recursive tree by always expanding the leaf whose best split
+  reduces the error the most, until the leaf budget is reached.
+
+  The best split of a leaf is found when the leaf is created, so the
+  expected error reduction is known before the leaf is expanded.
+  """
+
+  def configure(self, config):
+    """See parent."""
+
+    RTreeOriginal.configure(self, config)
+
+    # The minimum reduction of a leaf's error, as a fraction, for a split
+    #  to be worth expanding.
+    self.min_gain = ConfigUtils.getfloat(config, 'RTreeBestFirst', 'MinGain',
+      0.0)
+
+
+  def consider(self, frontier, sequence, node):
+    """
+    Finds the best split of a leaf and adds it to the frontier, keyed by
+    the reduction in the total squared error, the same measure the leaves
+    are ranked by in RTreeCore.push(). The range of the leaf is partitioned for
+    the split right away, which does not affect the range of any other leaf.
+
+    Key arguments:
+    frontier -- The frontier heap.
+    sequence -- The order the leaf was added in.
+    node     -- The leaf.
+    """
+
+    if not self.expandable(node) or self.progress.expired():
+      self.progress.settle(node.size())
+      return
+
+    split = self.split(node)
+    if (split == None):
+      self.progress.settle(node.size())
+      return
+
+    feature, threshold, left, right = split
+    middle = self.partition(node, feature, threshold)
+
+    # The reduction in the total squared error of the leaf.
+    error = node.size() * pow(node.hyperplane.error(), 2)
+    gain = error - ((middle - node.start) * pow(left.error(), 2) +
+      (node.end - middle) * pow(right.error(), 2))
+
+    if (gain <= 0.0 or gain < self.min_gain * error):
+      self.progress.settle(node.size())
+      return
+
+    heapq.heappush(frontier, (-gain, sequence, node,
+      (feature, threshold, left, right, middle)))
+
+
+  def grow(self, node):
+    """See parent."""
+
+    # The expandable leaves, as a heap of
+    #  (-gain, sequence, node, (feature, threshold, left, right, middle)).
+    frontier = []
+    leaves = 1
+    sequence = 0
+
+    # The leaves are not searched for splits once the leaf budget is used up.
+    if (self.max_leaves != None and leaves >= self.max_leaves):
+      self.progress.settle(node.size())
+      return
+
+    self.consider(frontier, sequence, node)
+
+    while (len(frontier) > 0):
+      # Stop when the time budget has been used up.
+      if self.progress.expired():
+        break
+
+      node, split = heapq.heappop(frontier)[2:]
+
+      node.feature, node.threshold, left, right, middle = split
+
+      # Only the leaves keep their statistics.
+      node.statistics = None
+
+      node.left = Node()
+      node.left.hyperplane = left
+      node.left.depth = node.depth + 1
+      node.left.start, node.left.end = node.start, middle
+
+      node.right = Node()
+      node.right.hyperplane = right
+      node.right.depth = node.depth + 1
+      node.right.start, node.right.end = middle, node.end
+
+      leaves += 1
+      self.progress.expand()
+
+      if (self.max_leaves != None and leaves >= self.max_leaves):
+        self.progress.settle(node.size())
+        break
+
+      sequence += 1
+      self.consider(frontier, sequence, node.left)
+      sequence += 1
+      self.consider(frontier, sequence, node.right)
+
+    # Every leaf remaining is final.
+    for entry in frontier:
+      self.progress.settle(entry[2].size())
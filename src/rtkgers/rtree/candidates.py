@@ -0,0 +1,67 @@
+"""
+Split candidate strategies.
+
+Every strategy returns the sorted split indices to evaluate between low
+and high (inclusive), where a split at index i puts the first i points on
+the left. Strategies other than "All" evaluate at most size indices, so
+the cost of a node does not grow with its number of points.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import random
+
+
+def every(low, high, size):
+  """
+  Returns every index.
+
+  Key arguments:
+  low  -- The lowest index.
+  high -- The highest index.
+  size -- Ignored, every index is returned.
+  """
+
+  return range(low, high + 1)
+
+
+def quantiles(low, high, size):
+  """
+  Returns evenly spaced indices, including both ends.
+
+  Key arguments:
+  low  -- The lowest index.
+  high -- The highest index.
+  size -- The max number of indices to return.
+  """
+
+  if (high - low + 1 <= size):
+    return every(low, high, size)
+
+  if (size == 1):
+    return [(low + high) / 2]
+
+  step = (high - low) / float(size - 1)
+
+  return sorted(set([low + int(round(i * step)) for i in range(size)]))
+
+
+def sample(low, high, size):
+  """
+  Returns randomly sampled indices.
+
+  Key arguments:
+  low  -- The lowest index.
+  high -- The highest index.
+  size -- The max number of indices to return.
+  """
+
+  if (high - low + 1 <= size):
+    return every(low, high, size)
+
+  return sorted(random.sample(xrange(low, high + 1), size))
+
@@ -9,10 +9,22 @@ The style guide follows the strict python PEP 8 guidelines.
 @copyright 2014 - Present Aaron Zampaglione
 """
 import abc
+import heapq
+import math
 
-from rtkgers.kgers.original import KGERSOriginal
+import numpy as np
+
+import rtkgers.registry as Registry
+import rtkgers.utils.config as ConfigUtils
+
+from rtkgers.dataset import Dataset
+from rtkgers.exceptions.hyperplane import HyperplaneException
+from rtkgers.exceptions.kgers import KGERSException
+from rtkgers.point import Point
 
 from rtkgers.rtree.node import Node
+from rtkgers.rtree.progress import Progress
+from rtkgers.statistics import Statistics
 
 
 class RTreeCore(object):
@@ -21,6 +33,10 @@ class RTreeCore(object):
   """
   __metaclass__ = abc.ABCMeta
 
+  # The squared errors that are below this fraction of the squared
+  #  solutions are rounding noise, not a better fit.
+  PRECISION = 1e-12
+
 
   def __init__(self, config, points):
     """
@@ -28,17 +44,196 @@ class RTreeCore(object):
 
     Key arguments:
     config -- The configuration to use.
-    points -- The points to train on.
+    points -- The points to train on, or the data set of the points.
     """
     self.root = None
-    self.config = config
+
+    # The data set is kept so workers in other processes can attach to it,
+    #  points are stored as one so their coordinates are only held once.
+    if not isinstance(points, Dataset):
+      points = Dataset.factory(points)
+    self.dataset = points
+
+    # The coordinates of the points, one row per point, so the points of a
+    #  node are split and partitioned by whole columns. The coordinates are
+    #  a range of a larger storage that new points are appended to, and
+    #  the points are views of their rows, see append().
+    self.storage = self.dataset.coordinates
+    self.offset = 0
+    self.coordinates = self.storage
+    self.points = self.dataset.points()
+
+    # The positions of the points, every node covers a contiguous range of
+    #  it which is partitioned in place when the node is split.
+    self.index = np.arange(len(self.points), dtype=np.intp)
+
+    # The precision of the points and the coefficients of the leaves.
+    self.dtype = Point.DTYPE
+
+    self.configure(config)
+
+    # The progress of the growth, only available while populating.
+    self.progress = None
+
+
+  def __getstate__(self):
+    """
+    Pickles the model without the data set it was trained on, or the
+    coordinates of its points, which are rebuilt when it is unpickled.
+    """
+
+    state = self.__dict__.copy()
+    state['dataset'] = None
+    state['storage'] = None
+    state['coordinates'] = None
+
+    return state
+
+
+  def __setstate__(self, state):
+    """
+    Restores a pickled model. The settings are read from its configuration
+    first, so a model pickled by an older version gets the settings added
+    since, and the coordinates of its points are rebuilt.
+
+    A model pickled before the points of the nodes were ranges of an index
+    also has the depths of its nodes set again, and the index is rebuilt by
+    routing its points to the leaves.
+
+    Key arguments:
+    state -- The pickled state.
+    """
+
+    self.__init__(state['config'], state['points'])
+    points = self.points
+    storage = self.storage
+
+    # Older versions only trained in double precision.
+    self.dtype = np.dtype(float)
+
+    self.__dict__.update(state)
+
+    # The points are views of the rebuilt coordinates.
     self.points = points
+    self.storage = self.coordinates = storage
+    self.offset = 0
+
+    if not 'index' in state:
+      self.root.depth = 0
+      nodes = [self.root]
+      while (len(nodes) > 0):
+        node = nodes.pop()
+        if (node.left != None and node.right != None):
+          node.left.depth = node.right.depth = node.depth + 1
+          nodes.extend([node.left, node.right])
+
+      members = dict((id(leaf), []) for leaf in self.leaves(self.root))
+      for leaf, points in self.route(self.points):
+        members[id(leaf)] = points
+
+      self.layout(members)
+
+
+  def append(self, points):
+    """
+    Appends points to the coordinates and returns the views of their rows,
+    see Point.view(). The storage grows geometrically, so only the new rows
+    are copied, but for the occasional move of every point to a new one.
+
+    Key arguments:
+    points -- The points to append.
+    """
+
+    size = len(self.points)
+    end = self.offset + size + len(points)
+
+    if (end > len(self.storage)):
+      storage = np.empty((2 * (size + len(points)), self.storage.shape[1]),
+        dtype=self.storage.dtype)
+      storage[:size] = self.coordinates
+
+      # The points become views of the new storage.
+      for point, row in zip(self.points, storage):
+        point.features = row[:-1]
+
+      self.storage = storage
+      self.offset = 0
+      end = size + len(points)
+
+    rows = self.storage[end - len(points):end]
+    for point, row in zip(points, rows):
+      row[:-1] = point.features
+      row[-1] = point.solution
+
+    self.coordinates = self.storage[self.offset:end]
+
+    return [Point.view(row) for row in rows]
+
+
+  def budgeted(self):
+    """Returns true if the growth is limited by leaves or time."""
+
+    return self.max_leaves != None or self.time_budget != None
+
+
+  def candidates(self, size):
+    """
+    Returns the split indices to evaluate for a node, leaving at least the
+    minimum number of points on each side.
+
+    Key arguments:
+    size -- The number of points in the node.
+    """
+
+    return Registry.load(Registry.CANDIDATES, self.split_candidates)(
+      self.min_points, size - self.min_points, self.num_of_split_candidates)
+
+
+  def configure(self, config):
+    """
+    Reads the settings of the tree from a configuration, which replaces the
+    configuration the tree was built with.
+
+    Key arguments:
+    config -- The configuration to use.
+    """
+
+    self.config = config
 
     # Determine the algorithm to use.
-    self.algorithm = self.config.get('KGERS', 'Algorithm')
+    self.algorithm = config.get('KGERS', 'Algorithm')
+
+    # Determine the (cheaper) algorithm to score splits with, the leaves
+    #  are refit with the algorithm above once the tree is grown.
+    self.split_algorithm = ConfigUtils.get(config, 'RTree', 'SplitAlgorithm',
+      self.algorithm)
+
+    # The capabilities of the split algorithm decide how splits are scored.
+    self.capabilities = Registry.capabilities(Registry.KGERS,
+      self.split_algorithm)
 
     # The minimum number of points necessary to run KGERS on.
-    self.min_points = 3 * points[0].dimensions
+    self.min_points = 3 * self.points[0].dimensions
+
+    # The limits on the growth of the tree, None is unlimited.
+    self.max_depth = ConfigUtils.getint(config, 'RTree', 'MaxDepth')
+    self.max_leaves = ConfigUtils.getint(config, 'RTree', 'MaxLeaves')
+    self.time_budget = ConfigUtils.getfloat(config, 'RTree', 'TimeBudget')
+
+    # The strategy that picks the split indices to evaluate in a node.
+    self.split_candidates = ConfigUtils.get(config, 'RTree',
+      'SplitCandidates', 'All')
+    self.num_of_split_candidates = ConfigUtils.getint(config, 'RTree',
+      'NumOfSplitCandidates', 32)
+
+    # The number of folds to cross validate splits with, None scores splits
+    #  with the test points of each model.
+    self.split_folds = ConfigUtils.getint(config, 'RTree', 'SplitFolds')
+
+    # The number of the best candidates of a split that are cross validated,
+    #  when the split algorithm fits models (2 * k fits per candidate).
+    self.split_finalists = ConfigUtils.getint(config, 'RTree',
+      'SplitFinalists', 4)
 
 
   def error(self, test):
@@ -54,6 +249,89 @@ class RTreeCore(object):
       float(len(test)))
 
 
+  def expandable(self, node):
+    """
+    Returns true if a leaf is allowed to be split.
+
+    Key arguments:
+    node -- The leaf to check.
+    """
+
+    # Make sure we have enough points to split.
+    if (node.size() < self.min_points * 2):
+      return False
+
+    return self.max_depth == None or node.depth < self.max_depth
+
+
+  def grow(self, node):
+    """
+    Grows the tree from the node provided by expanding one leaf at a time
+    until no leaf can be split or a limit is reached.
+
+    Without a leaf or time budget the leaves are expanded depth first.
+    With a budget, the leaf with the largest total error is expanded first
+    so the most valuable splits are made before the budget runs out.
+
+    Key arguments:
+    node -- The node to grow from.
+    """
+
+    # The expandable leaves, as a heap of (priority, sequence, node).
+    frontier = []
+    leaves = 1
+    sequence = 0
+
+    self.push(frontier, sequence, node)
+
+    while (len(frontier) > 0):
+      # Stop when the leaf or time budget has been used up.
+      if (self.max_leaves != None and leaves >= self.max_leaves) or \
+        self.progress.expired():
+        break
+
+      node = heapq.heappop(frontier)[2]
+
+      if not self.expandable(node):
+        self.progress.settle(node.size())
+        continue
+
+      split = self.split(node)
+      self.progress.expand()
+
+      if (split == None):
+        self.progress.settle(node.size())
+        continue
+
+      node.feature, node.threshold, left, right = split
+      middle = self.partition(node, node.feature, node.threshold)
+
+      # Only the leaves keep their statistics.
+      node.statistics = None
+
+      node.left = Node()
+      node.left.hyperplane = left
+      node.left.depth = node.depth + 1
+      node.left.start, node.left.end = node.start, middle
+
+      node.right = Node()
+      node.right.hyperplane = right
+      node.right.depth = node.depth + 1
+      node.right.start, node.right.end = middle, node.end
+
+      leaves += 1
+
+      # The right is pushed first so the left is grown first (depth first).
+      sequence += 1
+      self.push(frontier, sequence, node.right)
+      sequence += 1
+      self.push(frontier, sequence, node.left)
+
+    # Every leaf remaining is final.
+    for entry in frontier:
+      self.progress.settle(entry[2].size())
+
+
   def hyperplane(self, point):
     """
     Returns the hyperplane to solve a point by recursively navigating the tree.
@@ -62,6 +340,52 @@ class RTreeCore(object):
     point -- The point to analyze.
     """
 
+    return self.leaf(point).hyperplane
+
+
+  def layout(self, members):
+    """
+    Lays the points of the leaves out in a new index, in the order of the
+    leaves, and updates the ranges of every node.
+
+    Key arguments:
+    members -- The points of each leaf, by the id of the leaf.
+    """
+
+    positions = dict((id(point), i) for i, point in enumerate(self.points))
+
+    # The nodes in depth first order, the leaves from left to right.
+    nodes = []
+    pending = [self.root]
+    while (len(pending) > 0):
+      node = pending.pop()
+      nodes.append(node)
+      if (node.left != None and node.right != None):
+        pending.extend([node.right, node.left])
+
+    index = []
+    for node in nodes:
+      if (node.left == None or node.right == None):
+        node.start = len(index)
+        index.extend([positions[id(point)] for point in members[id(node)]])
+        node.end = len(index)
+
+    # The range of a node spans the ranges of its children.
+    for node in reversed(nodes):
+      if (node.left != None and node.right != None):
+        node.start, node.end = node.left.start, node.right.end
+
+    self.index = np.array(index, dtype=np.intp)
+
+
+  def leaf(self, point):
+    """
+    Returns the leaf a point belongs to by recursively navigating the tree.
+
+    Key arguments:
+    point -- The point to analyze.
+    """
+
     node = self.root
     while (node.left != None and node.right != None):
       if (point.features[node.feature] <= node.threshold):
@@ -69,31 +393,306 @@ class RTreeCore(object):
       else:
         node = node.right
 
-    return node.hyperplane
+    return node
 
 
-  @abc.abstractmethod
-  def grow(self, node, points):
+  def leaves(self, node):
     """
-    The recursive method that builds the tree.
+    Returns the leaves under a node.
+
+    Key arguments:
+    node -- The node.
     """
 
-    pass
+    leaves = []
+
+    nodes = [node]
+    while (len(nodes) > 0):
+      node = nodes.pop()
+      if (node.left != None and node.right != None):
+        nodes.extend([node.right, node.left])
+      else:
+        leaves.append(node)
+
+    return leaves
+
+
+  def members(self, node):
+    """
+    Returns the points of a node.
+
+    Key arguments:
+    node -- The node.
+    """
+
+    return [self.points[i] for i in self.index[node.start:node.end]]
+
+
+  def model(self, algorithm, points, folds=None, fold=0):
+    """
+    Returns a new (not executed) KGERS model.
+
+    Key arguments:
+    algorithm -- The name of the KGERS algorithm.
+    points    -- The points to train on.
+    folds     -- The folds to take the training and test points from
+                 (optional).
+    fold      -- The fold to test against.
+    """
+
+    return Registry.load(Registry.KGERS, algorithm)(self.config, points,
+      folds=folds, fold=fold)
 
 
   def populate(self):
     """
-    Populates the tree by creating the root and calling the recursive
-    abstract function.
+    Populates the tree by creating the root and growing it.
+    """
+
+    self.progress = Progress(len(self.points), self.time_budget)
+
+    try:
+      self.root = Node()
+      self.root.feature = None
+      self.root.threshold = None
+      self.root.hyperplane = self.model(self.split_algorithm, self.points)
+      self.root.hyperplane.execute()
+      self.root.start, self.root.end = 0, len(self.points)
+
+      self.grow(self.root)
+
+      if (self.split_algorithm != self.algorithm):
+        self.refit(self.root)
+
+      self.progress.finish()
+    finally:
+      # The progress is not part of the model.
+      self.progress = None
+
+
+  def partition(self, node, feature, threshold):
+    """
+    Partitions the range of a node in place by a split, the points on the
+    left of the threshold first, and returns the position the points on
+    the right start at. Only the points on the wrong side of that position
+    are swapped, the order within each side is not kept.
+
+    Key arguments:
+    node      -- The node.
+    feature   -- The feature of the split.
+    threshold -- The threshold of the split.
+    """
+
+    segment = self.index[node.start:node.end]
+    left = self.coordinates[segment, feature] <= threshold
+    middle = int(np.count_nonzero(left))
+
+    misplaced_left = np.flatnonzero(~left[:middle])
+    misplaced_right = middle + np.flatnonzero(left[middle:])
+    segment[misplaced_left], segment[misplaced_right] = \
+      segment[misplaced_right], segment[misplaced_left]
+
+    return node.start + middle
+
+
+  def push(self, frontier, sequence, node):
+    """
+    Adds a leaf to the frontier.
+
+    Key arguments:
+    frontier -- The frontier heap.
+    sequence -- The order the leaf was added in.
+    node     -- The leaf.
+    """
+
+    if self.budgeted():
+      # The total squared error is the most a split could remove.
+      priority = -node.size() * pow(node.hyperplane.error(), 2)
+    else:
+      # The last leaf added is expanded next.
+      priority = -sequence
+
+    heapq.heappush(frontier, (priority, sequence, node))
+
+
+  def rebuild(self, node, start, end):
+    """
+    Rebuilds a node of a trained tree from a range of the new points and
+    returns it. Every node is refit with the split algorithm, and the split
+    of a node is kept if its sides still fit better than the node alone,
+    otherwise the node becomes a leaf and is grown again. The leaves of the
+    trained tree stay leaves.
+
+    Key arguments:
+    node  -- The node of the trained tree.
+    start -- The start of the range of the new points.
+    end   -- The end of the range of the new points.
+    """
+
+    rebuilt = Node()
+    rebuilt.depth = node.depth
+    rebuilt.start, rebuilt.end = start, end
+
+    points = self.members(rebuilt)
+    rebuilt.hyperplane = self.model(self.split_algorithm, points)
+    rebuilt.hyperplane.execute()
+
+    if (node.left != None and node.right != None):
+      middle = self.partition(rebuilt, node.feature, node.threshold)
+
+      if (middle - start >= self.min_points and
+        end - middle >= self.min_points):
+        try:
+          left = self.rebuild(node.left, start, middle)
+          right = self.rebuild(node.right, middle, end)
+        except HyperplaneException, e:
+          left = right = None
+
+        # The split is kept if the sides fit better than the node alone,
+        #  by more than rounding noise.
+        if (left != None and self.sse(left) + self.sse(right) <
+          self.sse(rebuilt) -
+          self.PRECISION * sum([pow(point.solution, 2) for point in points])):
+          rebuilt.feature = node.feature
+          rebuilt.threshold = node.threshold
+          rebuilt.left = left
+          rebuilt.right = right
+
+          return rebuilt
+
+      # Examine the node again.
+      self.grow(rebuilt)
+
+      return rebuilt
+
+    self.progress.settle(rebuilt.size())
+
+    return rebuilt
+
+
+  def refit(self, node):
+    """
+    Refits every leaf under a node with the KGERS algorithm. If a leaf
+    cannot be refit, it keeps the model it was split with.
+
+    Key arguments:
+    node -- The node to refit the leaves of.
+    """
+
+    nodes = [node]
+    while (len(nodes) > 0):
+      node = nodes.pop()
+
+      if (node.left != None and node.right != None):
+        nodes.extend([node.left, node.right])
+        continue
+
+      model = self.model(self.algorithm, self.members(node))
+      try:
+        model.execute()
+        node.hyperplane = model
+      except HyperplaneException, e:
+        continue
+
+
+  def refresh(self, node):
+    """
+    Refits a leaf whose points changed. The model of an incremental
+    algorithm is fit from the statistics of the leaf, otherwise it is fit
+    from the points again. If a leaf cannot be refit, it keeps its model.
+
+    Key arguments:
+    node -- The leaf to refresh.
     """
 
-    self.root = Node()
-    self.root.feature = None
-    self.root.threshold = None
-    self.root.hyperplane = globals()[self.algorithm](self.config, self.points)
-    self.root.hyperplane.execute()
+    if (node.size() < self.min_points):
+      return
+
+    model = self.model(self.algorithm, self.members(node))
+    incremental = Registry.supports(Registry.KGERS, self.algorithm,
+      Registry.INCREMENTAL)
+
+    try:
+      if incremental:
+        model.statistics = node.statistics
+        model.coefficients = model.fit(self.config,
+          node.statistics).astype(Point.DTYPE)
+      else:
+        model.execute()
+    except HyperplaneException, e:
+      return
+
+    node.hyperplane = model
+
+
+  def regrow(self, node):
+    """
+    Fits a leaf from its points again and grows a new subtree from it.
+
+    Key arguments:
+    node -- The leaf to regrow.
+    """
+
+    if (node.size() < self.min_points):
+      return
+
+    model = self.model(self.split_algorithm, self.members(node))
+    try:
+      model.execute()
+    except HyperplaneException, e:
+      return
+
+    node.hyperplane = model
+    self.grow(node)
 
-    self.grow(self.root, self.points)
+    if (self.split_algorithm != self.algorithm):
+      self.refit(node)
+
+
+  def reuse(self, tree):
+    """
+    Populates the tree from the splits of a trained tree (a warm start),
+    see rebuild(). If the new points can not be fit as a whole, the tree is
+    populated from scratch instead.
+
+    Key arguments:
+    tree -- The trained tree.
+    """
+
+    self.progress = Progress(len(self.points), self.time_budget)
+
+    try:
+      try:
+        self.root = self.rebuild(tree.root, 0, len(self.points))
+      except HyperplaneException, e:
+        # Grow the tree from scratch, which starts its own progress.
+        self.progress = None
+        self.populate()
+        return
+
+      if (self.split_algorithm != self.algorithm):
+        self.refit(self.root)
+
+      self.progress.finish()
+    finally:
+      # The progress is not part of the model.
+      self.progress = None
+
+
+  def route(self, points):
+    """
+    Returns the points grouped by leaf, as a list of (leaf, points).
+
+    Key arguments:
+    points -- The points to route.
+    """
+
+    leaves = {}
+    for point in points:
+      leaf = self.leaf(point)
+      leaves.setdefault(id(leaf), (leaf, []))[1].append(point)
+
+    return leaves.values()
 
 
   def solve(self, point):
@@ -105,3 +704,138 @@ class RTreeCore(object):
     """
 
     return self.hyperplane(point).solve(point)
+
+
+  @abc.abstractmethod
+  def split(self, node):
+    """
+    Finds the best split of a leaf, from the range of the leaf in the index.
+
+    Returns None if no split improves the error, otherwise a tuple of
+    (feature, threshold, left model, right model). The range of the leaf is
+    partitioned by the caller, see partition().
+
+    Key arguments:
+    node -- The leaf to split.
+    """
+
+    pass
+
+
+  def sse(self, node):
+    """
+    Returns the sum of the squared errors of the model of a node over the
+    points of the node.
+
+    Key arguments:
+    node -- The node.
+    """
+
+    return node.size() * pow(node.hyperplane.error(self.members(node)), 2)
+
+
+  def update(self, points):
+    """
+    Absorbs new points without growing the tree again.
+
+    Every point is routed to its leaf and the statistics of the leaf are
+    updated. A leaf is regrown if its model fits the new points worse than
+    "[Update] ErrorRatio" times its error, or if it has more than
+    "[Update] MaxLeafPoints" points, otherwise it is only refreshed. With a
+    "[Update] Window", only the most recent points are kept and the oldest
+    ones are evicted from the statistics of their leaves.
+
+    Key arguments:
+    points -- The new points.
+    """
+
+    error_ratio = ConfigUtils.getfloat(self.config, 'Update', 'ErrorRatio',
+      2.0)
+    max_leaf_points = ConfigUtils.getint(self.config, 'Update',
+      'MaxLeafPoints')
+    window = ConfigUtils.getint(self.config, 'Update', 'Window')
+
+    # The points of every leaf, by the id of the leaf.
+    members = dict((id(leaf), self.members(leaf))
+      for leaf in self.leaves(self.root))
+
+    # The new points are kept as views of their rows of the coordinates.
+    points = self.append(points)
+
+    # The leaves that changed, and the ones that need to be regrown.
+    changed = {}
+    drifted = set()
+
+    for leaf, new_points in self.route(points):
+      if (leaf.statistics == None):
+        leaf.statistics = Statistics.factory(members[id(leaf)])
+
+      # Compare the error of the model on the new points before adding them.
+      if (leaf.hyperplane.error(new_points) >
+        error_ratio * leaf.hyperplane.error()):
+        drifted.add(id(leaf))
+
+      for point in new_points:
+        leaf.statistics.add(point)
+
+      members[id(leaf)].extend(new_points)
+      changed[id(leaf)] = leaf
+
+    self.points.extend(points)
+
+    if (window != None and len(self.points) > window):
+      evicted = self.points[:len(self.points) - window]
+      self.points = self.points[len(self.points) - window:]
+
+      # The rows of the evicted points are left behind in the storage.
+      self.offset += len(evicted)
+      self.coordinates = self.storage[self.offset:self.offset +
+        len(self.points)]
+
+      for leaf, old_points in self.route(evicted):
+        if (leaf.statistics == None):
+          leaf.statistics = Statistics.factory(members[id(leaf)])
+
+        for point in old_points:
+          leaf.statistics.remove(point)
+
+        old_points = set([id(point) for point in old_points])
+        members[id(leaf)] = [point for point in members[id(leaf)]
+          if id(point) not in old_points]
+        changed[id(leaf)] = leaf
+
+    self.layout(members)
+
+    self.progress = Progress(len(self.points), self.time_budget)
+
+    try:
+      for key, leaf in changed.items():
+        if (key in drifted or
+          (max_leaf_points != None and leaf.size() > max_leaf_points)):
+          self.regrow(leaf)
+        else:
+          self.refresh(leaf)
+    finally:
+      self.progress = None
+
+
+  def validate(self, points, folds):
+    """
+    Returns the RMSE of the split algorithm cross validated over folds of
+    the points, or infinity if a fold cannot be fit.
+
+    Key arguments:
+    points -- The points.
+    folds  -- The folds of the points.
+    """
+
+    errors = []
+    for fold in range(folds.k):
+      try:
+        model = self.model(self.split_algorithm, points, folds, fold)
+        model.execute()
+      except (HyperplaneException, KGERSException), e:
+        return float('inf')
+      errors.append(model.error())
+
+    return sum(errors) / len(errors)
@@ -0,0 +1,518 @@
+"""
+See class summary.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import logging
+import multiprocessing
+import socket
+import threading
+import traceback
+import Queue
+
+import ConfigParser
+
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+from multiprocessing.connection import Listener
+
+import rtkgers.registry as Registry
+import rtkgers.utils.config as ConfigUtils
+
+from rtkgers.dataset import Dataset
+from rtkgers.exceptions.distributed import DistributedException
+from rtkgers.hyperplane import Hyperplane
+from rtkgers.point import Point
+from rtkgers.rtree.node import Node
+from rtkgers.rtree.original import RTreeOriginal
+from rtkgers.rtree.progress import Progress
+
+
+# The errors of a connection to a worker that was lost or refused.
+CONNECTION_ERRORS = (AuthenticationError, EOFError, IOError, socket.error)
+
+
+def address(value):
+  """
+  Returns the (host, port) address of a "host:port" string.
+
+  Key arguments:
+  value -- The address string.
+  """
+
+  host, port = value.strip().rsplit(':', 1)
+
+  return (host, int(port))
+
+
+def grow(job):
+  """
+  Grows a subtree from a leaf and returns the leaf, this is the job
+  workers run.
+
+  Key arguments:
+  job -- A tuple of (configuration sections, data set, indices, leaf).
+
+  Returns the leaf and the order the points of the leaf were partitioned
+  in, see RTreeDistributed.merge().
+  """
+
+  sections, dataset, indices, node = job
+
+  config = ConfigParser.RawConfigParser()
+  for section, options in sections.items():
+    config.add_section(section)
+    for option, value in options.items():
+      config.set(section, option, value)
+
+  if (indices != None):
+    dataset = Dataset(dataset.coordinates[indices])
+
+  Hyperplane.MAX_SAMPLE_ATTEMPTS = ConfigUtils.getint(config, 'KGERS',
+    'MaxHyperplaneAttempts', Hyperplane.MAX_SAMPLE_ATTEMPTS)
+  Point.DTYPE = dataset.coordinates.dtype
+
+  # The leaf already has its model, only its subtree is grown.
+  tree = Registry.load(Registry.RTREE, ConfigUtils.get(config, 'Distributed',
+    'Grower', 'RTreeOriginal'))(config, dataset)
+  tree.progress = Progress(len(tree.points), tree.time_budget)
+
+  # The leaf covers every point of the tree grown here.
+  node.start, node.end = 0, len(tree.points)
+
+  try:
+    tree.grow(node)
+    if (tree.split_algorithm != tree.algorithm):
+      tree.refit(node)
+  finally:
+    tree.progress = None
+
+  return (node, tree.index)
+
+
+def sections(config):
+  """
+  Returns the configuration as a (picklable) dictionary of sections.
+
+  Key arguments:
+  config -- The configuration.
+  """
+
+  return dict((section, dict((option, config.get(section, option))
+    for option in config.options(section))) for section in config.sections())
+
+
+class LocalCluster(object):
+  """
+  Worker processes on this host, a stand-in for a cluster of machines.
+
+  Usage:
+    with LocalCluster(2) as cluster:
+      config.set('Distributed', 'Workers', cluster.workers())
+  """
+
+
+  def __init__(self, size, authkey='rtkgers'):
+    """
+    Constructor.
+
+    Key arguments:
+    size    -- The number of worker processes.
+    authkey -- The key the coordinator authenticates with.
+    """
+
+    self.size = size
+    self.authkey = authkey
+    self.listeners = []
+    self.processes = []
+
+
+  def __enter__(self):
+    """Starts the workers."""
+
+    self.start()
+
+    return self
+
+
+  def __exit__(self, type, value, traceback):
+    """Stops the workers."""
+
+    self.stop()
+
+
+  def start(self):
+    """Starts the workers, each listening on a free port."""
+
+    for i in range(0, self.size):
+      listener = Listener(('localhost', 0), authkey=self.authkey)
+
+      process = multiprocessing.Process(target=Worker(listener).serve)
+      process.daemon = True
+      process.start()
+
+      self.listeners.append(listener)
+      self.processes.append(process)
+
+
+  def stop(self):
+    """Stops the workers."""
+
+    for process in self.processes:
+      process.terminate()
+      process.join()
+
+    for listener in self.listeners:
+      listener.close()
+
+    self.listeners = []
+    self.processes = []
+
+
+  def workers(self):
+    """Returns the addresses of the workers, as the Workers option."""
+
+    return ','.join(['%s:%d' % listener.address
+      for listener in self.listeners])
+
+
+class RTreeDistributed(RTreeOriginal):
+  """
+  The distributed recursive tree grows the top of the tree locally, until
+  there is a leaf for each job, and then ships the growth of the subtree
+  of each leaf to worker processes, possibly on other hosts. The subtrees
+  that are returned are merged back into the tree.
+
+  A job is the configuration, the leaf and either the handle of the shared
+  data set with the indices of the leaf (ShareData, for workers that can
+  reach the same file) or the rows of the leaf. The jobs a worker fails to
+  take are grown locally.
+
+  The jobs are pickled, so the workers must only be reachable by trusted
+  coordinators, which authenticate with the AuthKey.
+  """
+
+
+  def __init__(self, config, points):
+    """See parent class summary."""
+
+    RTreeOriginal.__init__(self, config, points)
+
+    # The leaves that have no split, found while growing locally.
+    self.final = set()
+
+    self.logger = logging.getLogger('rtkgers')
+
+
+  def __getstate__(self):
+    """Pickles the model without the state of the coordinator."""
+
+    state = RTreeOriginal.__getstate__(self)
+    state['final'] = set()
+    state['logger'] = None
+
+    return state
+
+
+  def configure(self, config):
+    """See parent."""
+
+    RTreeOriginal.configure(self, config)
+
+    self.workers = [address(worker) for worker in
+      ConfigUtils.get(config, 'Distributed', 'Workers', '').split(',')
+      if worker.strip()]
+    self.authkey = ConfigUtils.get(config, 'Distributed', 'AuthKey',
+      'rtkgers')
+    self.jobs = ConfigUtils.getint(config, 'Distributed', 'Jobs',
+      2 * max(1, len(self.workers)))
+    self.share = ConfigUtils.getboolean(config, 'Distributed', 'ShareData',
+      False)
+
+
+  def dispatch(self, worker, jobs, failed, errors):
+    """
+    Sends jobs to a worker until there are none left.
+
+    Key arguments:
+    worker -- The address of the worker.
+    jobs   -- The queue of jobs.
+    failed -- The list to add the jobs the worker failed to take to.
+    errors -- The list to add the errors of the jobs to.
+    """
+
+    try:
+      connection = Client(worker, authkey=self.authkey)
+    except CONNECTION_ERRORS, e:
+      self.logger.warning("Failed to connect to worker %s:%d: %s.",
+        worker[0], worker[1], e)
+      return
+
+    try:
+      while True:
+        try:
+          job = jobs.get_nowait()
+        except Queue.Empty:
+          return
+
+        try:
+          connection.send(self.message(job))
+          succeeded, value = connection.recv()
+        except CONNECTION_ERRORS, e:
+          self.logger.warning("Lost worker %s:%d: %s.", worker[0], worker[1],
+            e)
+          failed.append(job)
+          return
+
+        if not succeeded:
+          errors.append(value)
+          continue
+
+        self.merge(job[0], *value)
+    finally:
+      connection.close()
+
+
+  def distribute(self, jobs):
+    """
+    Grows the subtrees of the jobs on the workers, and locally for the
+    jobs no worker took.
+
+    Key arguments:
+    jobs -- The jobs, as tuples of (leaf, indices, leaf budget).
+    """
+
+    queue = Queue.Queue()
+    for job in jobs:
+      queue.put(job)
+
+    failed = []
+    errors = []
+
+    threads = [threading.Thread(target=self.dispatch,
+      args=(worker, queue, failed, errors)) for worker in self.workers]
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+
+    if (len(errors) > 0):
+      raise DistributedException(
+        "%d of %d jobs failed on the workers:\n%s" %
+        (len(errors), len(jobs), '\n'.join(errors)))
+
+    while not queue.empty():
+      failed.append(queue.get())
+
+    if (len(failed) > 0):
+      self.logger.warning("Growing %d of %d jobs locally.", len(failed),
+        len(jobs))
+
+    max_leaves = self.max_leaves
+    try:
+      for node, indices, leaves in failed:
+        self.max_leaves = leaves
+        self.grow(node)
+        if (self.split_algorithm != self.algorithm):
+          self.refit(node)
+    finally:
+      self.max_leaves = max_leaves
+
+
+  def merge(self, node, subtree, order):
+    """
+    Merges a subtree grown by a worker into the tree.
+
+    Key arguments:
+    node    -- The leaf the subtree was grown from.
+    subtree -- The subtree.
+    order   -- The order the worker partitioned the points of the leaf in.
+    """
+
+    start = node.start
+
+    segment = self.index[node.start:node.end]
+    segment[:] = segment[order]
+
+    node.update(subtree)
+
+    # The ranges of the subtree are relative to the range of the leaf.
+    nodes = [node]
+    while (len(nodes) > 0):
+      node = nodes.pop()
+      node.start += start
+      node.end += start
+      if (node.left != None and node.right != None):
+        nodes.extend([node.left, node.right])
+
+
+  def message(self, job):
+    """
+    Returns the message that ships a job to a worker.
+
+    Key arguments:
+    job -- A tuple of (leaf, indices, leaf budget).
+    """
+
+    node, indices, leaves = job
+
+    config = sections(self.config)
+    config.setdefault('RTree', {})
+    config['RTree']['MaxLeaves'] = '' if leaves == None else str(leaves)
+    config['RTree']['TimeBudget'] = '' if self.time_budget == None else \
+      str(max(0.0, self.time_budget - self.progress.elapsed()))
+
+    if self.share:
+      return (config, self.dataset, indices, node)
+
+    return (config, Dataset(self.dataset.coordinates[indices]), None, node)
+
+
+  def populate(self):
+    """See parent class summary."""
+
+    self.progress = Progress(len(self.points), self.time_budget)
+
+    # A shared data set is only created for the duration of training.
+    temporary = self.share and self.dataset.filename == None
+    if self.share:
+      self.dataset.share()
+
+    try:
+      self.root = Node()
+      self.root.feature = None
+      self.root.threshold = None
+      self.root.hyperplane = self.model(self.split_algorithm, self.points)
+      self.root.hyperplane.execute()
+      self.root.start, self.root.end = 0, len(self.points)
+
+      # Grow the top of the tree locally until there is a leaf per job.
+      max_leaves = self.max_leaves
+      self.max_leaves = self.jobs if max_leaves == None else \
+        min(self.jobs, max_leaves)
+      try:
+        self.grow(self.root)
+      finally:
+        self.max_leaves = max_leaves
+
+      leaves = self.leaves(self.root)
+
+      jobs = []
+      if (max_leaves == None or len(leaves) < max_leaves) and \
+        not self.progress.expired():
+        jobs = [leaf for leaf in leaves if id(leaf) not in self.final and
+          self.expandable(leaf)]
+
+      for leaf in leaves:
+        if (leaf not in jobs and self.split_algorithm != self.algorithm):
+          self.refit(leaf)
+
+      self.distribute(self.schedule(jobs, len(leaves), max_leaves))
+
+      self.progress.finish()
+    finally:
+      # The progress and the shared data set are not part of the model.
+      self.progress = None
+      self.final = set()
+      if temporary:
+        self.dataset.close()
+
+
+  def schedule(self, nodes, leaves, max_leaves):
+    """
+    Returns the jobs of the leaves to grow remotely, sharing the leaf
+    budget (if any) between them by their number of points.
+
+    Key arguments:
+    nodes      -- The leaves to grow.
+    leaves     -- The number of leaves in the tree.
+    max_leaves -- The leaf budget of the tree.
+    """
+
+    total = sum([node.size() for node in nodes])
+    remaining = None if max_leaves == None else \
+      max_leaves - leaves + len(nodes)
+
+    jobs = []
+    for node in nodes:
+      budget = None if remaining == None else \
+        max(1, remaining * node.size() / total)
+      jobs.append((node, self.index[node.start:node.end].tolist(), budget))
+
+    return jobs
+
+
+  def split(self, node):
+    """See parent class summary."""
+
+    split = RTreeOriginal.split(self, node)
+    if (split == None):
+      self.final.add(id(node))
+
+    return split
+
+
+class Worker(object):
+  """
+  Grows the subtrees a coordinator sends, one connection at a time.
+  """
+
+
+  def __init__(self, listener):
+    """
+    Constructor.
+
+    Key arguments:
+    listener -- The listener coordinators connect to.
+    """
+
+    self.listener = listener
+    self.logger = logging.getLogger('rtkgers')
+
+
+  def handle(self, connection):
+    """
+    Grows the subtrees of a connection until it is closed.
+
+    Key arguments:
+    connection -- The connection to the coordinator.
+    """
+
+    while True:
+      try:
+        job = connection.recv()
+      except EOFError:
+        return
+
+      if (job == None):
+        return
+
+      try:
+        result = (True, grow(job))
+      except Exception:
+        result = (False, traceback.format_exc())
+
+      connection.send(result)
+
+
+  def serve(self):
+    """Serves coordinators forever."""
+
+    while True:
+      try:
+        connection = self.listener.accept()
+      except CONNECTION_ERRORS, e:
+        self.logger.warning("Rejected a coordinator: %s.", e)
+        continue
+
+      try:
+        self.handle(connection)
+      except CONNECTION_ERRORS, e:
+        self.logger.warning("Lost a coordinator: %s.", e)
+      finally:
+        connection.close()
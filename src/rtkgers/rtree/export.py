@@ -0,0 +1,178 @@
+"""
+Exports trained trees as standalone Python modules, which solve points
+without rtkgers, the Node objects or a pickle.
+
+The plain module turns the splits into nested "if" statements and every
+leaf into an inline linear expression, which is the fastest for single
+points. The vectorized module selects the leaf of every row of a NumPy
+array with np.select() and solves all rows at once.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+
+
+# The depth of nested "if" statements after which a subtree is moved into
+#  its own function, Python limits the indentation of a module.
+MAX_NESTING = 32
+
+
+# The header of the generated modules.
+HEADER = '"""\nGenerated by rtkgers from a trained tree, do not edit.\n"""\n'
+
+
+def branch(node, depth, functions):
+  """
+  Returns the lines of the statements that solve a node, the subtrees
+  nested too deep are generated as functions of their own.
+
+  Key arguments:
+  node      -- The node.
+  depth     -- The indentation depth of the statements.
+  functions -- The list of generated functions.
+  """
+
+  indent = '  ' * depth
+
+  if (node.left == None or node.right == None):
+    return [indent + 'return ' + expression(node.hyperplane.coefficients)]
+
+  if (depth > MAX_NESTING):
+    # The slot of the function is taken before its own subtrees add theirs.
+    index = len(functions)
+    name = '_subtree%d' % (index + 1)
+    functions.append(None)
+    functions[index] = function(node, name, functions)
+
+    return [indent + 'return %s(features)' % name]
+
+  return ['%sif features[%d] <= %r:' % (indent, node.feature,
+    float(node.threshold))] + branch(node.left, depth + 1, functions) + \
+    [indent + 'else:'] + branch(node.right, depth + 1, functions)
+
+
+def expression(coefficients):
+  """
+  Returns the inline linear expression of the coefficients of a leaf.
+
+  Key arguments:
+  coefficients -- The coefficients, the last one is the constant.
+  """
+
+  terms = ['%r * features[%d]' % (float(coefficient), i)
+    for i, coefficient in enumerate(coefficients[:-1]) if coefficient != 0.0]
+
+  return ' + '.join(terms + [repr(float(coefficients[-1]))])
+
+
+def function(node, name, functions):
+  """
+  Returns the source of the function that solves a subtree.
+
+  Key arguments:
+  node      -- The root of the subtree.
+  name      -- The name of the function.
+  functions -- The list of generated functions.
+  """
+
+  lines = ['def %s(features):' % name,
+    '  """Returns the solution of the features of a point."""', '']
+
+  return '\n'.join(lines + branch(node, 1, functions)) + '\n'
+
+
+def python(tree):
+  """
+  Returns the source of a module with a "solve(features)" function that
+  solves the features of one point by walking nested "if" statements.
+
+  Key arguments:
+  tree -- The trained tree.
+  """
+
+  functions = []
+  functions.insert(0, function(tree.root, 'solve', functions))
+
+  return HEADER + ''.join(['\n\n' + source for source in functions])
+
+
+def vectorized(tree):
+  """
+  Returns the source of a NumPy module with a "solve(features)" function
+  that solves the rows of a (n, d) features array. Every split is compared
+  once for all rows, the leaf of each row is selected with np.select() and
+  the rows are solved with the coefficients of their leaves.
+
+  Key arguments:
+  tree -- The trained tree.
+  """
+
+  # The comparisons of the splits and the conditions of the leaves.
+  comparisons = []
+  conditions = []
+  coefficients = []
+
+  pending = [(tree.root, [])]
+  while (len(pending) > 0):
+    node, path = pending.pop()
+
+    if (node.left == None or node.right == None):
+      conditions.append(' & '.join(path))
+      coefficients.append([float(coefficient)
+        for coefficient in node.hyperplane.coefficients])
+      continue
+
+    name = 'c%d' % len(comparisons)
+    comparisons.append('  %s = features[:, %d] <= %r' % (name, node.feature,
+      float(node.threshold)))
+
+    pending.append((node.right, path + ['~' + name]))
+    pending.append((node.left, path + [name]))
+
+  lines = [HEADER, 'import numpy as np', '', '',
+    '# The coefficients of the leaves, the last column is the constant.',
+    'COEFFICIENTS = np.array([']
+  lines.extend(['  [%s],' % ', '.join([repr(coefficient)
+    for coefficient in row]) for row in coefficients])
+  lines.extend(['])', '', '',
+    'def solve(features):',
+    '  """Returns the solutions of the rows of a (n, d) features array."""',
+    '',
+    '  features = np.atleast_2d(np.asarray(features, dtype=np.float64))',
+    ''])
+  lines.extend(comparisons)
+
+  # The last leaf is the one of the rows no other leaf selects.
+  if (len(conditions) == 1):
+    lines.append('  leaf = np.zeros(len(features), dtype=np.intp)')
+  else:
+    lines.append('  leaf = np.select([')
+    lines.extend(['    %s,' % condition for condition in conditions[:-1]])
+    lines.append('  ], range(%d), default=%d)' % (len(conditions) - 1,
+      len(conditions) - 1))
+
+  lines.extend(['',
+    '  coefficients = COEFFICIENTS[leaf]',
+    '',
+    "  return np.einsum('ij,ij->i', features, coefficients[:, :-1]) + \\",
+    '    coefficients[:, -1]'])
+
+  return '\n'.join(lines) + '\n'
+
+
+def write(tree, filename, vectorize=False):
+  """
+  Writes the module of a tree.
+
+  Key arguments:
+  tree      -- The trained tree.
+  filename  -- The file name of the module.
+  vectorize -- True to write the NumPy module, see vectorized().
+  """
+
+  with open(filename, 'w') as writer:
+    writer.write(vectorized(tree) if vectorize else python(tree))
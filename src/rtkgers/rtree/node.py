@@ -11,10 +11,15 @@ The style guide follows the strict python PEP 8 guidelines.
 
 class Node(object):
   """Node class for the recursive tree."""
+  __slots__ = ('depth', 'end', 'feature', 'hyperplane', 'index', 'left',
+    'right', 'start', 'statistics', 'threshold')
 
   def __init__(self):
     """Constructor."""
 
+    # The depth of this node in the tree, the root is zero.
+    self.depth = 0
+
     # The feature analyzed at the time this node was generated.
     self.feature = None
 
@@ -26,5 +31,53 @@ class Node(object):
     self.left = None
     self.right = None
 
+    # The range of the points of this node in the index of the tree, see
+    #  RTreeCore.members().
+    self.start = None
+    self.end = None
+
+    # The statistics of the points of a leaf, built on the first update.
+    self.statistics = None
+
     # The threshold that this node was split at.
     self.threshold = None
+
+
+  def __getstate__(self):
+    """Returns the state to pickle."""
+
+    return dict((name, getattr(self, name)) for name in Node.__slots__)
+
+
+  def __setstate__(self, state):
+    """
+    Restores a pickled state, the attributes missing from nodes pickled by
+    older versions keep their defaults.
+
+    Key arguments:
+    state -- The pickled state.
+    """
+
+    self.__init__()
+
+    for name, value in state.items():
+      if name in Node.__slots__:
+        setattr(self, name, value)
+
+
+  def size(self):
+    """Returns the number of points of this node."""
+
+    return self.end - self.start
+
+
+  def update(self, node):
+    """
+    Copies the attributes of another node, e.g. a subtree grown elsewhere.
+
+    Key arguments:
+    node -- The other node.
+    """
+
+    for name in Node.__slots__:
+      setattr(self, name, getattr(node, name))
@@ -6,71 +6,382 @@ The style guide follows the strict python PEP 8 guidelines.
 @requires Python >=2.7
 @copyright 2013 - Present Aaron Zampaglione
 """
+import heapq
+
+import numpy as np
+
+import rtkgers.registry as Registry
+
 from rtkgers.exceptions.hyperplane import HyperplaneException
-from rtkgers.kgers.original import KGERSOriginal
-from rtkgers.rtree.node import Node
+from rtkgers.folds import Folds
+from rtkgers.profiler import Profiler
 from rtkgers.rtree.core import RTreeCore
+from rtkgers.statistics import Statistics
 
 class RTreeOriginal(RTreeCore):
   """
-  Grows the recursive tree by analyzing every point and every feature
-  possible to determine the best split.
+  Grows the recursive tree by analyzing every candidate point and every
+  feature possible to determine the best split.
+
+  If the split algorithm is incremental, every candidate of a feature is
+  scored at once from prefix sums of the statistics of the points, rather
+  than by fitting two models per candidate.
   """
 
-  def grow(self, node, points):
-    """See parent."""
+  # The max number of statistics held at once while summing the points,
+  #  see prefixes().
+  CHUNK = 2 ** 22
+
+  def errors(self, training, test):
+    """
+    Returns the RMSE of the fits of stacked training statistics over
+    stacked test statistics, see statistics().
+
+    Key arguments:
+    training -- The (m, t) training statistics.
+    test     -- The (m, t) test statistics.
+    """
+
+    dimensions = self.points[0].dimensions
+    algorithm = Registry.load(Registry.KGERS, self.split_algorithm)
+
+    ata, aty = self.unpack(training)[:2]
+    if Registry.BATCH_FIT in self.capabilities:
+      coefficients = algorithm.batch(self.config, ata, aty)
+    else:
+      coefficients = []
+      for i in range(len(training)):
+        statistics = Statistics(dimensions)
+        statistics.ata, statistics.aty = ata[i], aty[i]
+        coefficients.append(algorithm.fit(self.config, statistics))
+      coefficients = np.array(coefficients)
+
+    ata, aty, yty, count = self.unpack(test)
+    sse = yty - 2.0 * np.einsum('ij,ij->i', coefficients, aty) + \
+      np.einsum('ij,ijk,ik->i', coefficients, ata, coefficients)
+
+    # A side without test points can not be scored.
+    errors = np.empty(len(test))
+    errors.fill(np.inf)
+    errors[count > 0] = np.sqrt(np.maximum(RTreeOriginal.PRECISION * yty,
+      sse)[count > 0] / count[count > 0])
+
+    return errors
+
+
+  def prefixes(self, segment, labels, k, indices):
+    """
+    Returns the statistics of the first i points of a segment for every
+    index i and of the whole segment last, as a (k + 1, m + 1, t) matrix
+    of the statistics of all the points followed by the statistics of the
+    test points of each fold, see statistics().
+
+    The points are summed in chunks, and only between the indices, so the
+    memory used grows with the number of indices rather than of points.
+
+    Key arguments:
+    segment -- The positions of the points, in order.
+    labels  -- The fold each point of the segment is tested in.
+    k       -- The number of folds.
+    indices -- The (m) sorted indices, between 1 and the size - 1.
+    """
+
+    dimensions = self.points[0].dimensions
+    width = dimensions * dimensions + dimensions + 2
+    chunk = max(1, self.CHUNK / width)
+
+    # The sums of the points between consecutive indices.
+    sums = np.zeros((k + 1, len(indices) + 1, width), dtype=Statistics.DTYPE)
+
+    for start in range(0, len(segment), chunk):
+      end = min(start + chunk, len(segment))
+      statistics = self.statistics(self.coordinates[segment[start:end]])
+
+      # The chunk starts within the sum low and ends within the sum high.
+      low = np.searchsorted(indices, start, side='right')
+      high = np.searchsorted(indices, end, side='left')
+      starts = np.concatenate(([0], indices[low:high] - start))
+
+      sums[0, low:high + 1] += np.add.reduceat(statistics, starts)
+      for fold in range(k):
+        sums[fold + 1, low:high + 1] += np.add.reduceat(
+          statistics * (labels[start:end] == fold)[:, None], starts)
 
-    node.points = points
+    return np.cumsum(sums, axis=1)
 
-    # Return if we do not have enough points to split.
-    if (len(points) < self.min_points * 2):
-      return
+
+  def residuals(self, model, coordinates):
+    """
+    Returns the sum of the squared residuals of a model over points.
+
+    Key arguments:
+    model       -- The (executed) model.
+    coordinates -- The (n, d) coordinates of the points.
+    """
+
+    residuals = np.dot(coordinates[:, :-1], model.coefficients[:-1]) + \
+      model.coefficients[-1] - coordinates[:, -1]
+
+    return float(np.dot(residuals, residuals))
+
+
+  def split(self, node):
+    """
+    See parent.
+
+    With cross validation, the candidates are first screened by the
+    errors of their models over every point of their sides, and only the
+    best few ("[RTree] SplitFinalists") are cross validated, see validate().
+    """
+
+    if Registry.INCREMENTAL in self.capabilities:
+      return self.split_statistics(node)
+
+    segment = self.index[node.start:node.end]
+    features = self.coordinates[segment, :-1]
+    size = len(segment)
 
     # Keep track of the best index / node to split at.
     best_index = None
     best_feature = None
+    best_values = None
     best_left = None
     best_right = None
-    best_error = node.hyperplane.error()
+    # With cross validation, the holdout error of the node is not comparable.
+    best_error = node.hyperplane.error() if self.split_folds == None else \
+      np.inf
 
-    for f in range(len(points[0].features)):
-      # Sort the points by the feature provided.
-      points = sorted(points, key=lambda x: x.features[f])
-      # Cycle through every point evaluating at the desired feature.
-      for i in range(self.min_points, len(points) - self.min_points + 1):
+    # The points and the values of each feature, sorted by the feature.
+    ordered = []
 
-        left_points = points[:i]
-        right_points = points[i:]
+    # The best candidates to cross validate, as a heap of
+    #  (-error, feature, index, left model, right model).
+    finalists = []
 
-        left = globals()[self.algorithm](self.config, left_points)
-        right = globals()[self.algorithm](self.config, right_points)
+    with Profiler.timer('rtree.split'):
+      for f in range(features.shape[1]):
+        # Sort the points by the feature provided.
+        order = np.argsort(features[:, f], kind='mergesort')
+        values = features[order, f]
+        points = [self.points[i] for i in segment[order]]
+        ordered.append((points, values))
+        rows = self.coordinates[segment[order]]
+        # Cycle through the candidate points evaluating at the desired feature.
+        for i in self.candidates(size):
 
-        # Try to generate a hyperplane.
-        try:
-          left.execute()
-          right.execute()
-        except HyperplaneException, e:
-          continue
+          # Keep the best split found so far once the time is up.
+          if self.progress.expired():
+            break
+
+          Profiler.count('rtree.candidates')
+          self.progress.candidate()
+
+          # A threshold can not separate equal values.
+          if (values[i - 1] == values[i]):
+            continue
+
+          left_points = points[:i]
+          right_points = points[i:]
+
+          left = self.model(self.split_algorithm, left_points)
+          right = self.model(self.split_algorithm, right_points)
+
+          # Try to generate a hyperplane.
+          try:
+            left.execute()
+            right.execute()
+          except HyperplaneException, e:
+            continue
+
+          if (self.split_folds != None):
+            error = self.residuals(left, rows[:i]) + \
+              self.residuals(right, rows[i:])
+            heapq.heappush(finalists, (-error, f, i, left, right))
+            if (len(finalists) > self.split_finalists):
+              heapq.heappop(finalists)
+            continue
+
+          error = (len(left_points) / float(size)) * left.error() + \
+            (len(right_points) / float(size)) * right.error()
+
+          if (best_error > error):
+            best_index = i
+            best_feature = f
+            best_values = values
+            best_error = error
+            best_left = left
+            best_right = right
+
+    if (self.split_folds != None):
+      # The error of the node on the folds of each feature.
+      baselines = {}
+
+      for error, f, i, left, right in sorted(finalists, reverse=True):
+        points, values = ordered[f]
+        folds = Folds.interleaved(size, self.split_folds)
 
-        error = (len(left_points) / float(len(points))) * left.error() + \
-          (len(right_points) / float(len(points))) * right.error()
+        # A split must improve on the node scored with the same folds.
+        if not f in baselines:
+          baselines[f] = self.validate(points, folds)
 
-        if (best_error > error):
+        error = (i * self.validate(points[:i], folds[:i]) +
+          (size - i) * self.validate(points[i:], folds[i:])) / float(size)
+
+        if (min(best_error, baselines[f]) > error):
           best_index = i
           best_feature = f
+          best_values = values
           best_error = error
           best_left = left
           best_right = right
 
-    if (best_index != None):
-      node.feature = best_feature
-      node.threshold = points[best_index].features[best_feature]
+    if (best_index == None):
+      return None
+
+    # Split halfway between the last point on the left
+    #  and the first point on the right.
+    threshold = (best_values[best_index - 1] + best_values[best_index]) / 2.0
+
+    return (best_feature, threshold, best_left, best_right)
+
+
+  def split_statistics(self, node):
+    """
+    Finds the best split of a leaf from prefix sums of the statistics of
+    its points.
+
+    As with the models, the points are divided into training and test
+    points, but the same points are tested for every candidate. With
+    cross validation, the sorted points are divided into interleaved folds
+    instead, see Folds.interleaved().
+
+    Key arguments:
+    node -- The leaf to split.
+    """
+
+    segment = self.index[node.start:node.end]
+    size = len(segment)
+    dimensions = self.points[0].dimensions
+
+    if (self.split_folds != None):
+      # The folds of the sorted points.
+      folds = Folds.interleaved(size, self.split_folds)
+    else:
+      # Take 30% of the points for testing, or the minimum required.
+      folds = Folds.holdout(size, max(int(size * .3), dimensions))
+
+    best_index = None
+    best_feature = None
+    best_order = None
+    best_error = node.hyperplane.error() if self.split_folds == None else \
+      np.inf
+
+    with Profiler.timer('rtree.split'):
+      for f in range(dimensions - 1):
+        # Keep the best split found so far once the time is up.
+        if self.progress.expired():
+          break
+
+        indices = np.array(self.candidates(size), dtype=int)
+        if (len(indices) == 0):
+          continue
+
+        Profiler.count('rtree.candidates', len(indices))
+        self.progress.candidate(len(indices))
+
+        values = self.coordinates[segment, f]
+        order = np.argsort(values, kind='mergesort')
+        values = values[order]
+
+        # A threshold can not separate equal values.
+        indices = indices[values[indices - 1] != values[indices]]
+        if (len(indices) == 0):
+          continue
+
+        labels = folds.labels if self.split_folds != None else \
+          folds.labels[order]
+        prefixes = self.prefixes(segment[order], labels, folds.k, indices)
+
+        errors = np.zeros(len(indices))
+        baseline = 0.0
+        for fold in range(folds.k):
+          # The statistics of the first i points sorted by the feature,
+          #  and of all of them last.
+          testing = prefixes[fold + 1]
+          training = prefixes[0] - testing
+
+          left = self.errors(training[:-1], testing[:-1])
+          right = self.errors(training[-1] - training[:-1],
+            testing[-1] - testing[:-1])
+
+          errors += (indices * left + (size - indices) * right) / float(size)
+          baseline += self.errors(training[-1:], testing[-1:])[0]
+
+        errors /= folds.k
+
+        # With cross validation, a split must improve on the node scored
+        #  with the same folds.
+        if (self.split_folds != None):
+          best_error = min(best_error, baseline / folds.k)
+
+        i = int(np.argmin(errors))
+        if (best_error > errors[i]):
+          best_index = int(indices[i])
+          best_feature = f
+          best_order = order
+          best_error = errors[i]
+
+    if (best_index == None):
+      return None
+
+    points = [self.points[i] for i in segment[best_order]]
+
+    left = self.model(self.split_algorithm, points[:best_index])
+    right = self.model(self.split_algorithm, points[best_index:])
+
+    try:
+      left.execute()
+      right.execute()
+    except HyperplaneException, e:
+      return None
+
+    # Split halfway between the last point on the left
+    #  and the first point on the right.
+    values = self.coordinates[segment[best_order], best_feature]
+    threshold = (values[best_index - 1] + values[best_index]) / 2.0
+
+    return (best_feature, threshold, left, right)
+
+
+  def statistics(self, coordinates):
+    """
+    Returns the statistics of each point as one row of a (n, t) matrix,
+    so statistics of many points are summed with one operation.
+
+    Key arguments:
+    coordinates -- The (n, d) coordinates of the points.
+    """
+
+    a = np.ones(coordinates.shape, dtype=Statistics.DTYPE)
+    a[:, :-1] = coordinates[:, :-1]
+    y = coordinates[:, -1].astype(Statistics.DTYPE)
+
+    return np.column_stack(((a[:, :, None] * a[:, None, :]).reshape(
+      len(coordinates), -1), a * y[:, None], y * y, np.ones(len(coordinates))))
+
+
+  def unpack(self, statistics):
+    """
+    Returns the (A'A, A'y, y'y, count) statistics of stacked statistics,
+    see statistics().
 
-      node.left = Node()
-      node.left.hyperplane = best_left
+    Key arguments:
+    statistics -- The (m, t) statistics.
+    """
 
-      self.grow(node.left, points[:best_index])
+    dimensions = self.points[0].dimensions
+    area = dimensions * dimensions
 
-      node.right = Node()
-      node.right.hyperplane = best_right
-      self.grow(node.right, points[best_index:])
+    return (statistics[:, :area].reshape(-1, dimensions, dimensions),
+      statistics[:, area:area + dimensions], statistics[:, -2],
+      statistics[:, -1])
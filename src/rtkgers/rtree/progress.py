@@ -0,0 +1,139 @@
+"""
+See class summary.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import logging
+import time
+
+
+class Progress(object):
+  """
+  Tracks the growth of a tree and reports it to the "rtkgers" logger.
+
+  A point is "settled" once it belongs to a leaf that will not be split
+  any further. The estimated time remaining is based on the rate at which
+  points are settled.
+  """
+
+  # The minimum number of seconds between two reports.
+  INTERVAL = 5.0
+
+
+  def __init__(self, total, budget=None):
+    """
+    Constructor.
+
+    Key arguments:
+    total  -- The total number of points in the tree.
+    budget -- The time budget in seconds (optional).
+    """
+
+    self.total = total
+    self.budget = budget
+
+    # The number of nodes expanded, candidates evaluated and points settled.
+    self.expanded = 0
+    self.candidates = 0
+    self.settled = 0
+
+    self.start = time.time()
+    self.last = self.start
+
+    self.logger = logging.getLogger('rtkgers')
+
+
+  def candidate(self, count=1):
+    """
+    Records candidate splits evaluated.
+
+    Key arguments:
+    count -- The number of candidate splits.
+    """
+
+    self.candidates += count
+
+
+  def elapsed(self):
+    """Returns the number of seconds since growth started."""
+
+    return time.time() - self.start
+
+
+  def eta(self):
+    """
+    Returns the estimated number of seconds remaining, or None if it
+    cannot be estimated yet.
+    """
+
+    elapsed = self.elapsed()
+
+    remaining = None
+    if self.settled > 0:
+      remaining = elapsed * (self.total - self.settled) / float(self.settled)
+
+    if self.budget != None:
+      remaining = max(0.0, self.budget - elapsed) if remaining == None \
+        else min(remaining, max(0.0, self.budget - elapsed))
+
+    return remaining
+
+
+  def expand(self):
+    """Records one node expanded."""
+
+    self.expanded += 1
+    self.report()
+
+
+  def expired(self):
+    """Returns true if the time budget has been used up."""
+
+    return self.budget != None and self.elapsed() >= self.budget
+
+
+  def finish(self):
+    """Reports the final state of the growth."""
+
+    self.logger.info(
+      "Finished growing: %d nodes expanded, %d candidate splits evaluated "
+      "in %.1f seconds.", self.expanded, self.candidates, self.elapsed())
+
+
+  def report(self, force=False):
+    """
+    Logs the current progress, at most once per interval.
+
+    Key arguments:
+    force -- True to log regardless of the interval.
+    """
+
+    now = time.time()
+    if not force and now - self.last < Progress.INTERVAL:
+      return
+
+    self.last = now
+
+    eta = self.eta()
+    self.logger.info(
+      "Growing: %d nodes expanded, %d candidate splits evaluated, "
+      "%d of %d points settled, ETA %s.", self.expanded, self.candidates,
+      self.settled, self.total,
+      "unknown" if eta == None else "%.1f seconds" % eta)
+
+
+  def settle(self, count):
+    """
+    Records points that belong to a final leaf.
+
+    Key arguments:
+    count -- The number of points settled.
+    """
+
+    self.settled += count
+    self.report()
@@ -0,0 +1,195 @@
+"""
+See class summary.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import numpy as np
+
+
+class Statistics(object):
+  """
+  The sufficient statistics of a (weighted) least squares fit.
+
+  With A as the features of the points plus a constant column, y as the
+  solutions and W as the weights, the statistics are A'WA, A'Wy, y'Wy and
+  the total weight. Points can be added and removed one at a time, and
+  statistics can be added together, without revisiting any other point.
+
+  The statistics are always accumulated in double precision.
+  """
+
+  # The data type the statistics are accumulated in.
+  DTYPE = np.dtype(np.float64)
+
+  # The singular values below this fraction of the largest one are treated
+  #  as zero when solving.
+  RCOND = 1e-10
+
+
+  @staticmethod
+  def factory(points, weights=None):
+    """
+    Factory method that produces the statistics of a set of points.
+
+    Key arguments:
+    points  -- The points to build the statistics from.
+    weights -- The respective weights for each point (optional).
+    """
+
+    a = np.ones((len(points), points[0].dimensions), dtype=Statistics.DTYPE)
+    a[:, :-1] = [point.features for point in points]
+    y = np.array([point.solution for point in points], dtype=Statistics.DTYPE)
+
+    w = np.ones(len(points), dtype=Statistics.DTYPE) if weights is None \
+      else np.array(weights, dtype=Statistics.DTYPE)
+
+    statistics = Statistics(points[0].dimensions)
+    statistics.ata = np.dot(a.T * w, a)
+    statistics.aty = np.dot(a.T * w, y)
+    statistics.yty = float(np.dot(w * y, y))
+    statistics.count = float(np.sum(w))
+
+    return statistics
+
+
+  @staticmethod
+  def lstsq(ata, aty):
+    """
+    Returns the minimum norm solutions of stacked normal equations, the
+    singular values below RCOND times the largest one are treated as zero.
+    Every fit, one or many, is solved this way, so the coefficients a split
+    is scored with are the ones the leaf is fit with.
+
+    Key arguments:
+    ata -- The (m, d, d) A'A statistics.
+    aty -- The (m, d) A'y statistics.
+    """
+
+    return np.einsum('mij,mj->mi', np.linalg.pinv(ata, rcond=Statistics.RCOND),
+      aty)
+
+
+  def __init__(self, dimensions):
+    """
+    Constructor.
+
+    Key arguments:
+    dimensions -- The dimensions of the points (features plus solution).
+    """
+
+    self.ata = np.zeros((dimensions, dimensions), dtype=Statistics.DTYPE)
+    self.aty = np.zeros(dimensions, dtype=Statistics.DTYPE)
+    self.yty = 0.0
+    self.count = 0.0
+
+
+  def __add__(self, other):
+    """
+    Returns the statistics of both sets of points.
+
+    Key arguments:
+    other -- The other statistics.
+    """
+
+    statistics = Statistics(len(self.aty))
+    statistics.ata = self.ata + other.ata
+    statistics.aty = self.aty + other.aty
+    statistics.yty = self.yty + other.yty
+    statistics.count = self.count + other.count
+
+    return statistics
+
+
+  def __sub__(self, other):
+    """
+    Returns the statistics with the other set of points removed.
+
+    Key arguments:
+    other -- The other statistics.
+    """
+
+    statistics = Statistics(len(self.aty))
+    statistics.ata = self.ata - other.ata
+    statistics.aty = self.aty - other.aty
+    statistics.yty = self.yty - other.yty
+    statistics.count = self.count - other.count
+
+    return statistics
+
+
+  def add(self, point, weight=1.0):
+    """
+    Adds a point to the statistics.
+
+    Key arguments:
+    point  -- The point to add.
+    weight -- The weight of the point.
+    """
+
+    a = np.append(point.features, [1.0]).astype(Statistics.DTYPE)
+
+    self.ata += weight * np.outer(a, a)
+    self.aty += weight * point.solution * a
+    self.yty += weight * point.solution * point.solution
+    self.count += weight
+
+
+  def error(self, coefficients):
+    """
+    Returns the RMSE of the coefficients over the points.
+
+    Key arguments:
+    coefficients -- The coefficients of the linear equation.
+    """
+
+    if (self.count <= 0.0):
+      return 0.0
+
+    return np.sqrt(max(0.0, self.sse(coefficients)) / self.count)
+
+
+  def remove(self, point, weight=1.0):
+    """
+    Removes a point that was previously added to the statistics.
+
+    Key arguments:
+    point  -- The point to remove.
+    weight -- The weight the point was added with.
+    """
+
+    self.add(point, -weight)
+
+
+  def solve(self, ridge=0.0):
+    """
+    Returns the coefficients that minimize the (ridge) squared error.
+
+    The constant is not penalized by the ridge.
+
+    Key arguments:
+    ridge -- The ridge penalty.
+    """
+
+    ata = self.ata.copy()
+    ata[np.arange(len(ata) - 1), np.arange(len(ata) - 1)] += ridge
+
+    # If the points do not span the space, the minimum norm solution
+    #  is taken.
+    return Statistics.lstsq(ata[None], self.aty[None])[0]
+
+
+  def sse(self, coefficients):
+    """
+    Returns the sum of squared errors of the coefficients over the points.
+
+    Key arguments:
+    coefficients -- The coefficients of the linear equation.
+    """
+
+    return self.yty - 2.0 * np.dot(coefficients, self.aty) + \
+      np.dot(coefficients, np.dot(self.ata, coefficients))
@@ -0,0 +1,191 @@
+"""
+See class summary.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import math
+
+
+class Quantile(object):
+  """
+  Estimates a quantile of a stream of values with the P-square algorithm
+  (Jain and Chlamtac), which keeps five markers rather than the values.
+  The first five values are kept, so small streams are exact.
+  """
+
+  __slots__ = ('p', 'heights', 'positions', 'desired', 'increments')
+
+
+  def __init__(self, p):
+    """
+    Constructor.
+
+    Key arguments:
+    p -- The quantile to estimate, between 0 and 1.
+    """
+
+    self.p = p
+
+    # The heights of the markers, the first values until there are five.
+    self.heights = []
+
+    # The actual and desired positions of the markers.
+    self.positions = [1, 2, 3, 4, 5]
+    self.desired = [1.0, 1.0 + 2.0 * p, 1.0 + 4.0 * p, 3.0 + 2.0 * p, 5.0]
+    self.increments = [0.0, p / 2.0, p, (1.0 + p) / 2.0, 1.0]
+
+
+  def add(self, value):
+    """
+    Adds a value to the stream.
+
+    Key arguments:
+    value -- The value.
+    """
+
+    heights = self.heights
+
+    if (len(heights) < 5):
+      heights.append(value)
+      heights.sort()
+      return
+
+    # Find the cell of the value, extending the extreme markers.
+    if (value < heights[0]):
+      heights[0] = value
+      k = 0
+    elif (value >= heights[4]):
+      heights[4] = value
+      k = 3
+    else:
+      k = 0
+      while (value >= heights[k + 1]):
+        k += 1
+
+    for i in range(k + 1, 5):
+      self.positions[i] += 1
+    for i in range(0, 5):
+      self.desired[i] += self.increments[i]
+
+    # Move the middle markers that are off their desired positions.
+    positions = self.positions
+    for i in range(1, 4):
+      d = self.desired[i] - positions[i]
+      if (d >= 1.0 and positions[i + 1] - positions[i] > 1) or \
+        (d <= -1.0 and positions[i - 1] - positions[i] < -1):
+        d = 1 if d > 0 else -1
+
+        height = self.parabolic(i, d)
+        if not (heights[i - 1] < height < heights[i + 1]):
+          height = heights[i] + d * (heights[i + d] - heights[i]) / \
+            float(positions[i + d] - positions[i])
+
+        heights[i] = height
+        positions[i] += d
+
+
+  def parabolic(self, i, d):
+    """
+    Returns the piecewise-parabolic prediction of the height of a marker
+    moved by one position.
+
+    Key arguments:
+    i -- The marker.
+    d -- The direction of the move, 1 or -1.
+    """
+
+    q, n = self.heights, self.positions
+
+    return q[i] + d / float(n[i + 1] - n[i - 1]) * (
+      (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / float(n[i + 1] - n[i]) +
+      (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / float(n[i] - n[i - 1]))
+
+
+  def value(self):
+    """Returns the estimate of the quantile, None without values."""
+
+    if (len(self.heights) == 0):
+      return None
+
+    # The exact (nearest rank) quantile of the first values.
+    if (len(self.heights) < 5 or self.positions[4] == 5):
+      return self.heights[int(round(self.p * (len(self.heights) - 1)))]
+
+    return self.heights[2]
+
+
+class Summary(object):
+  """
+  The summary of a stream of values, computed one value at a time: the
+  mean and the (population) standard deviation with Welford's algorithm,
+  the extremes and estimates of percentiles, see Quantile.
+  """
+
+
+  def __init__(self, percentiles=(50, 90, 99)):
+    """
+    Constructor.
+
+    Key arguments:
+    percentiles -- The percentiles to estimate.
+    """
+
+    self.count = 0
+    self.mean = 0.0
+    self.minimum = None
+    self.maximum = None
+
+    # The sum of the squared differences from the mean.
+    self.m2 = 0.0
+
+    self.quantiles = [(percentile, Quantile(percentile / 100.0))
+      for percentile in percentiles]
+
+
+  def add(self, value):
+    """
+    Adds a value to the summary.
+
+    Key arguments:
+    value -- The value.
+    """
+
+    self.count += 1
+
+    delta = value - self.mean
+    self.mean += delta / self.count
+    self.m2 += delta * (value - self.mean)
+
+    self.minimum = value if self.minimum == None else min(self.minimum, value)
+    self.maximum = value if self.maximum == None else max(self.maximum, value)
+
+    for percentile, quantile in self.quantiles:
+      quantile.add(value)
+
+
+  def dict(self):
+    """Returns the summary as a (JSON serializable) dictionary."""
+
+    return {
+      'count': self.count,
+      'mean': self.mean,
+      'stdev': self.stdev(),
+      'min': self.minimum,
+      'max': self.maximum,
+      'percentiles': dict((str(percentile), quantile.value())
+        for percentile, quantile in self.quantiles)
+    }
+
+
+  def stdev(self):
+    """Returns the population standard deviation."""
+
+    if (self.count == 0):
+      return 0.0
+
+    return math.sqrt(self.m2 / self.count)
@@ -0,0 +1,96 @@
+"""
+Configuration related utility methods.
+
+The configuration parsers do not support fallbacks in Python 2, so these
+methods return a default when an optional setting was not provided or
+was left blank.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+
+
+def get(config, section, option, default=None):
+  """
+  Returns a setting as a string, or the default if it does not exist.
+
+  Key arguments:
+  config  -- The configuration to read from.
+  section -- The section of the setting.
+  option  -- The name of the setting.
+  default -- The value to return if the setting does not exist.
+  """
+
+  if not has(config, section, option):
+    return default
+
+  return config.get(section, option)
+
+
+def getboolean(config, section, option, default=False):
+  """
+  Returns a setting as a boolean, or the default if it does not exist.
+
+  Key arguments:
+  config  -- The configuration to read from.
+  section -- The section of the setting.
+  option  -- The name of the setting.
+  default -- The value to return if the setting does not exist.
+  """
+
+  if not has(config, section, option):
+    return default
+
+  return config.getboolean(section, option)
+
+
+def getfloat(config, section, option, default=None):
+  """
+  Returns a setting as a float, or the default if it does not exist.
+
+  Key arguments:
+  config  -- The configuration to read from.
+  section -- The section of the setting.
+  option  -- The name of the setting.
+  default -- The value to return if the setting does not exist.
+  """
+
+  if not has(config, section, option):
+    return default
+
+  return config.getfloat(section, option)
+
+
+def getint(config, section, option, default=None):
+  """
+  Returns a setting as an integer, or the default if it does not exist.
+
+  Key arguments:
+  config  -- The configuration to read from.
+  section -- The section of the setting.
+  option  -- The name of the setting.
+  default -- The value to return if the setting does not exist.
+  """
+
+  if not has(config, section, option):
+    return default
+
+  return config.getint(section, option)
+
+
+def has(config, section, option):
+  """
+  Returns true if a setting exists and is not blank.
+
+  Key arguments:
+  config  -- The configuration to read from.
+  section -- The section of the setting.
+  option  -- The name of the setting.
+  """
+
+  return config.has_option(section, option) and \
+    str(config.get(section, option)).strip() != ''
@@ -0,0 +1,139 @@
+"""
+Data set reading and writing utility methods.
+
+Two formats are supported:
+
+  CSV    -- The project format, "ID,Solution,Feature0,Feature1,...", with a
+            header line.
+  Binary -- A NumPy ".npy" file holding a (n, d + 1) matrix where each row
+            is the coordinates of a point (the features followed by the
+            solution).
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import csv
+
+import numpy as np
+
+from rtkgers.point import Point
+
+
+# The file extension that denotes the binary format.
+BINARY_EXTENSION = '.npy'
+
+
+def is_binary(filename):
+  """
+  Returns true if the file name denotes the binary format.
+
+  Key arguments:
+  filename -- The file name to check.
+  """
+
+  return filename.lower().endswith(BINARY_EXTENSION)
+
+
+def read(filename):
+  """
+  Reads a data set and returns a list of points, determining the format
+  from the file name.
+
+  Key arguments:
+  filename -- The file name to read from.
+  """
+
+  if is_binary(filename):
+    return read_binary(filename)
+
+  return read_csv(filename)
+
+
+def read_binary(filename):
+  """
+  Reads a binary data set and returns a list of points.
+
+  Key arguments:
+  filename -- The file name to read from.
+  """
+
+  coordinates = np.load(filename)
+
+  return [Point(row[:-1], float(row[-1])) for row in coordinates]
+
+
+def read_csv(filename):
+  """
+  Reads a CSV data set and returns a list of points.
+
+  Key arguments:
+  filename -- The file name to read from.
+  """
+
+  points = []
+
+  with open(filename, 'rb') as reader_file:
+    reader = csv.reader(reader_file, delimiter=',', quotechar='|')
+
+    # Skip the first line.
+    reader.next()
+    for row in reader:
+      points.append(
+        Point([float(feature) for feature in row[2:]], float(row[1])))
+
+  return points
+
+
+def write(filename, features, solutions):
+  """
+  Writes a data set, determining the format from the file name.
+
+  Key arguments:
+  filename  -- The file name to write to.
+  features  -- The (n, d) feature matrix.
+  solutions -- The (n,) solution vector.
+  """
+
+  if is_binary(filename):
+    write_binary(filename, features, solutions)
+  else:
+    write_csv(filename, features, solutions)
+
+
+def write_binary(filename, features, solutions):
+  """
+  Writes a data set in the binary format.
+
+  Key arguments:
+  filename  -- The file name to write to.
+  features  -- The (n, d) feature matrix.
+  solutions -- The (n,) solution vector.
+  """
+
+  np.save(filename, np.column_stack((features, solutions)))
+
+
+def write_csv(filename, features, solutions):
+  """
+  Writes a data set in the CSV format.
+
+  Key arguments:
+  filename  -- The file name to write to.
+  features  -- The (n, d) feature matrix.
+  solutions -- The (n,) solution vector.
+  """
+
+  with open(filename, 'wb') as writer_file:
+    writer = csv.writer(writer_file, delimiter=',', quotechar='|')
+
+    writer.writerow(['ID', 'Solution'] +
+      ['Feature' + str(i) for i in range(features.shape[1])])
+
+    for i in range(len(solutions)):
+      writer.writerow(
+        [i, repr(float(solutions[i]))] +
+        [repr(float(feature)) for feature in features[i]])
@@ -0,0 +1,157 @@
+"""
+Synthetic data set generation methods.
+
+Every generator returns a tuple of a (n, d) feature matrix and a (n,)
+solution vector, which can be written with rtkgers.utils.data.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import numpy as np
+
+
+# The range the features are drawn from.
+FEATURE_MIN = 0.0
+FEATURE_MAX = 10.0
+
+
+# The range the linear coefficients are drawn from.
+COEFFICIENT_MIN = -5.0
+COEFFICIENT_MAX = 5.0
+
+
+def features(size, dimensions, random):
+  """
+  Returns a uniformly distributed feature matrix.
+
+  Key arguments:
+  size       -- The number of rows.
+  dimensions -- The number of features.
+  random     -- The random state to draw from.
+  """
+
+  return random.uniform(FEATURE_MIN, FEATURE_MAX, (size, dimensions))
+
+
+def contaminate(solutions, noise, outliers, random):
+  """
+  Adds gaussian noise and gross outliers to the solutions in place.
+
+  Key arguments:
+  solutions -- The solution vector.
+  noise     -- The standard deviation of the gaussian noise.
+  outliers  -- The fraction of rows to replace with outliers.
+  random    -- The random state to draw from.
+  """
+
+  if noise > 0.0:
+    solutions += random.normal(0.0, noise, len(solutions))
+
+  num_of_outliers = int(round(len(solutions) * outliers))
+  if num_of_outliers > 0:
+    # Push the outliers well outside the spread of the clean solutions.
+    scale = 10.0 * (np.std(solutions) + 1.0)
+    indices = random.choice(len(solutions), num_of_outliers, replace=False)
+    signs = random.choice([-1.0, 1.0], num_of_outliers)
+    solutions[indices] += signs * random.uniform(scale, 2.0 * scale,
+      num_of_outliers)
+
+  return solutions
+
+
+def noisy(size, dimensions, noise=1.0, outliers=0.0, seed=None):
+  """
+  Generates a data set whose solutions are pure noise, i.e. there is no
+  structure for the tree to find.
+
+  Key arguments:
+  size       -- The number of rows.
+  dimensions -- The number of features.
+  noise      -- The standard deviation of the noise.
+  outliers   -- The fraction of rows to replace with outliers.
+  seed       -- The random seed (optional).
+  """
+
+  random = np.random.RandomState(seed)
+
+  x = features(size, dimensions, random)
+  y = contaminate(np.zeros(size), noise, outliers, random)
+
+  return x, y
+
+
+def piecewise(size, dimensions, noise=0.0, regimes=1, outliers=0.0,
+  seed=None):
+  """
+  Generates a piecewise linear data set. The first feature is divided into
+  evenly spaced regimes, each with its own random hyperplane.
+
+  Key arguments:
+  size       -- The number of rows.
+  dimensions -- The number of features.
+  noise      -- The standard deviation of the gaussian noise.
+  regimes    -- The number of true linear regimes.
+  outliers   -- The fraction of rows to replace with outliers.
+  seed       -- The random seed (optional).
+  """
+
+  random = np.random.RandomState(seed)
+
+  x = features(size, dimensions, random)
+
+  # One row of coefficients (plus the constant) per regime.
+  coefficients = random.uniform(COEFFICIENT_MIN, COEFFICIENT_MAX,
+    (regimes, dimensions + 1))
+
+  # Determine the regime of every row based on the first feature.
+  width = (FEATURE_MAX - FEATURE_MIN) / regimes
+  regime = np.minimum(((x[:, 0] - FEATURE_MIN) / width).astype(int),
+    regimes - 1)
+
+  y = np.einsum('ij,ij->i', x, coefficients[regime, :-1]) + \
+    coefficients[regime, -1]
+
+  return x, contaminate(y, noise, outliers, random)
+
+
+def polynomial(size, dimensions, degree=2, noise=0.0, outliers=0.0,
+  seed=None):
+  """
+  Generates a data set where the solution is a sum of random polynomials
+  of each feature.
+
+  Key arguments:
+  size       -- The number of rows.
+  dimensions -- The number of features.
+  degree     -- The degree of the polynomials.
+  noise      -- The standard deviation of the gaussian noise.
+  outliers   -- The fraction of rows to replace with outliers.
+  seed       -- The random seed (optional).
+  """
+
+  random = np.random.RandomState(seed)
+
+  x = features(size, dimensions, random)
+
+  # Scale the higher powers down so no single term dominates.
+  coefficients = random.uniform(COEFFICIENT_MIN, COEFFICIENT_MAX,
+    (degree, dimensions))
+
+  y = np.zeros(size)
+  for power in range(1, degree + 1):
+    y += np.dot(x ** power, coefficients[power - 1]) / \
+      pow(FEATURE_MAX, power - 1)
+
+  return x, contaminate(y, noise, outliers, random)
+
+
+# The generators available by name.
+GENERATORS = {
+  'noisy': noisy,
+  'piecewise': piecewise,
+  'polynomial': polynomial
+}
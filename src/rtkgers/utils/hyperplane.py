@@ -12,8 +12,11 @@ import numpy as np
 import sys
 
 from rtkgers.point import Point
+from rtkgers.profiler import Profiler
+from rtkgers.statistics import Statistics
 
 
+@Profiler.timed('hyperplane.average')
 def average(hyperplanes, weights):
   """
   Averages all of the hyperplanes together with their respective weights.
@@ -29,7 +32,7 @@ def average(hyperplanes, weights):
 
     index = weights.index(sys.float_info.max)
 
-    return hyperplanes[index].coefficients
+    return hyperplanes[index].coefficients.astype(Point.DTYPE)
 
   except ValueError:
     # Do nothing and continue.
@@ -40,8 +43,8 @@ def average(hyperplanes, weights):
 
   # Find the length of the hyperplane coefficients.
   hyperplane_len = len(hyperplanes[0].coefficients)
-  # Initialize coefficients to 0.
-  coefficients = np.array([0.0] * hyperplane_len, dtype=Point.DTYPE)
+  # Initialize coefficients to 0, the sum is accumulated in double precision.
+  coefficients = np.array([0.0] * hyperplane_len, dtype=Statistics.DTYPE)
 
   for i in range(0, len(hyperplanes)):
     hyperplane = hyperplanes[i]
@@ -50,9 +53,10 @@ def average(hyperplanes, weights):
     for j in range(0, hyperplane_len):
       coefficients[j] += hyperplane.coefficients[j] * hyperplane_weight
 
-  return coefficients
+  return coefficients.astype(Point.DTYPE)
 
 
+@Profiler.timed('hyperplane.weigh')
 def weigh(hyperplane, validators):
   """
   Determine the weight of a hyperplane based on a set of validators.
@@ -77,3 +81,40 @@ def weigh(hyperplane, validators):
     return sys.float_info.max
 
   return 1.0 / summation
+
+
+@Profiler.timed('hyperplane.spread')
+def spread(blocks, metric='Diameter'):
+  """
+  Returns how spread out the points of each hyperplane are, for many
+  hyperplanes at once.
+
+  The metrics are:
+
+    Diameter    -- The length of the ring through the points, in order.
+    Volume      -- The volume of the bounding box of the points.
+    MinDistance -- The smallest distance between two of the points.
+
+  Key arguments:
+  blocks -- The (hyperplanes, points, coordinates) array of the points of
+            every hyperplane.
+  metric -- The name of the metric.
+  """
+
+  if (metric == 'Diameter'):
+    # The distance from every point to the next, wrapping around.
+    segments = np.diff(np.concatenate((blocks, blocks[:, :1]), axis=1), axis=1)
+    return np.sum(np.linalg.norm(segments, axis=2), axis=1)
+
+  if (metric == 'Volume'):
+    return np.prod(np.max(blocks, axis=1) - np.min(blocks, axis=1), axis=1)
+
+  if (metric == 'MinDistance'):
+    distances = np.linalg.norm(
+      blocks[:, :, np.newaxis, :] - blocks[:, np.newaxis, :, :], axis=3)
+    # Ignore the distance from every point to itself.
+    size = blocks.shape[1]
+    distances[:, np.arange(size), np.arange(size)] = np.inf
+    return np.min(distances, axis=(1, 2))
+
+  raise ValueError("Unknown spread metric: " + metric)
@@ -0,0 +1,84 @@
+"""
+Test the consensus KGERS algorithm.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import ConfigParser
+import numpy as np
+import pytest
+
+from rtkgers.hyperplane import Hyperplane
+from rtkgers.point import Point
+from rtkgers.kgers.consensus import KGERSConsensus
+
+from rtkgers.exceptions.hyperplane import HyperplaneException
+
+
+def config():
+  """Returns the default configuration to use for the KGERS algorithm."""
+
+  config = ConfigParser.RawConfigParser()
+
+  config.add_section('Main')
+  config.set('Main', 'MaxThreads', 4)
+
+  config.add_section('KGERS')
+  config.set('KGERS', 'K', 10)
+
+  config.add_section('KGERSConsensus')
+  config.set('KGERSConsensus', 'Multiple', 10)
+  config.set('KGERSConsensus', 'Threshold', 0.5)
+  config.set('KGERSConsensus', 'Confidence', 0.99)
+  config.set('KGERSConsensus', 'NumOfValidationPoints', 100)
+
+  Hyperplane.MAX_SAMPLE_ATTEMPTS = 200
+
+  return config
+
+
+def test_kgers_outliers():
+  """Test kgers with a linear equation and gross outliers."""
+
+  # Make points for the equation 3x + 2y + 2 = z,
+  #  with every fifth point far off the plane.
+  points = []
+  for x in range(0, 50):
+    y = float((x * 7) % 11)
+    z = 3.0 * x + 2.0 * y + 2.0
+    if x % 5 == 0:
+      z += 100.0
+    points.append(Point([float(x), y], z))
+
+  kgers = KGERSConsensus(config(), points)
+  kgers.execute()
+
+  assert np.allclose(kgers.coefficients, [3.0, 2.0, 2.0])
+  assert kgers.inliers >= 0.7
+
+
+def test_kgers_required():
+  """Test the adaptive number of hyperplanes required."""
+
+  # Every sample is an inlier sample.
+  assert KGERSConsensus.required(1.0, 3, 0.99) == 1
+  # Half the points are inliers, 1 - (1 - 0.125)^n >= 0.99.
+  assert KGERSConsensus.required(0.5, 3, 0.99) == 35
+
+
+def test_kgers_fail():
+  """Test kgers with points that will not sucessfully make a hyperplane."""
+
+  # Make nine points identical so a hyperplane cannot be formed.
+  points = []
+  for i in range(0, 9):
+    points.append(Point([2.0, 2.0], 12.0))
+
+  kgers = KGERSConsensus(config(), points)
+
+  with pytest.raises(HyperplaneException):
+    kgers.execute()
@@ -0,0 +1,98 @@
+"""
+Test the least squares KGERS algorithm.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import ConfigParser
+import numpy as np
+
+from rtkgers.point import Point
+from rtkgers.kgers.leastsquares import KGERSLeastSquares
+from rtkgers.statistics import Statistics
+
+
+def config(ridge=0.0):
+  """Returns the default configuration to use for the KGERS algorithm."""
+
+  config = ConfigParser.RawConfigParser()
+
+  config.add_section('Main')
+  config.set('Main', 'MaxThreads', 4)
+
+  config.add_section('KGERS')
+  config.set('KGERS', 'K', 10)
+
+  config.add_section('KGERSLeastSquares')
+  config.set('KGERSLeastSquares', 'Ridge', ridge)
+
+  return config
+
+
+def points():
+  """Returns points for the equation 3x + 2y + 2 = z."""
+
+  points = []
+  for x in range(0, 12):
+    y = float(x % 5)
+    points.append(Point([float(x), y], 3.0 * x + 2.0 * y + 2.0))
+
+  return points
+
+
+def test_kgers_perfect():
+  """Test kgers with points that form a perfect linear equation."""
+
+  kgers = KGERSLeastSquares(config(), points())
+  kgers.execute()
+
+  assert np.allclose(kgers.coefficients, [3.0, 2.0, 2.0])
+  assert round(kgers.error(), 5) == 0.0
+
+
+def test_kgers_ridge():
+  """Test that the ridge shrinks the coefficients."""
+
+  kgers = KGERSLeastSquares(config(1000.0), points())
+  kgers.execute()
+
+  assert abs(kgers.coefficients[0]) < 3.0
+  assert abs(kgers.coefficients[1]) < 2.0
+
+
+def test_kgers_linearly_dependent():
+  """Test kgers with points that do not span the space."""
+
+  points = []
+  for x in range(0, 12):
+    points.append(Point([float(x), float(x)], 2.0 * x + 1.0))
+
+  kgers = KGERSLeastSquares(config(), points)
+  kgers.execute()
+
+  # The minimum norm solution still fits the points.
+  assert round(kgers.error(), 5) == 0.0
+
+
+def test_kgers_batch_near_singular():
+  """Test that batched fits match single fits of nearly dependent points."""
+
+  fits = []
+  for noise in [0.0, 1e-9, 1.0]:
+    points = []
+    for x in range(0, 12):
+      points.append(Point([float(x), float(x) + noise * (x % 2)],
+        2.0 * x + 1.0))
+    fits.append(Statistics.factory(points))
+
+  batched = KGERSLeastSquares.batch(config(),
+    np.array([statistics.ata for statistics in fits]),
+    np.array([statistics.aty for statistics in fits]))
+
+  for statistics, coefficients in zip(fits, batched):
+    assert np.allclose(KGERSLeastSquares.fit(config(), statistics),
+      coefficients)
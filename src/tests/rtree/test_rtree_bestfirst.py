@@ -0,0 +1,108 @@
+"""
+Test the best first RTree algorithm.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import ConfigParser
+import random
+
+import numpy as np
+
+from rtkgers.hyperplane import Hyperplane
+from rtkgers.point import Point
+from rtkgers.rtree.bestfirst import RTreeBestFirst
+
+
+def config(max_leaves):
+  """Returns the default configuration to use for the RTree algorithm."""
+
+  config = ConfigParser.RawConfigParser()
+
+  config.add_section('Main')
+  config.set('Main', 'MaxThreads', 4)
+
+  config.add_section('KGERS')
+  config.set('KGERS', 'Algorithm', 'KGERSOriginal')
+  config.set('KGERS', 'K', 10)
+
+  config.add_section('RTree')
+  config.set('RTree', 'MaxLeaves', max_leaves)
+
+  Hyperplane.MAX_SAMPLE_ATTEMPTS = 200
+
+  return config
+
+
+def points():
+  """Returns two perfect planes that meet at x = 15."""
+
+  points = []
+  for x in range(0, 30):
+    y = float(x % 7)
+    if x < 15:
+      # 3x + 2y + 2 = z
+      points.append(Point([float(x), y], 3.0 * x + 2.0 * y + 2.0))
+    else:
+      # -2x + y + 80 = z
+      points.append(Point([float(x), y], -2.0 * x + y + 80.0))
+
+  return points
+
+
+def leaves(node):
+  """Returns the number of leaves under a node."""
+
+  if node.left == None and node.right == None:
+    return 1
+
+  return leaves(node.left) + leaves(node.right)
+
+
+def test_two_planes():
+  """Tests that the most valuable split is made first."""
+
+  random.seed(1)
+  np.random.seed(1)
+
+  rtkgers = RTreeBestFirst(config(2), points())
+  rtkgers.populate()
+
+  assert leaves(rtkgers.root) == 2
+  # The split is scored on random test sets (the seed does not fix the
+  #  order the threads draw in), so it may be anywhere the candidates are.
+  assert rtkgers.root.feature == 0
+  assert rtkgers.root.threshold >= 8.5 and rtkgers.root.threshold <= 20.5
+
+  # Make sure the solutions are within range.
+  solution = rtkgers.solve(Point([3.0, 3.0]))
+  assert solution >= 15.0 and solution <= 19.0
+  solution = rtkgers.solve(Point([27.0, 6.0]))
+  assert solution >= 30.0 and solution <= 34.0
+
+
+def test_leaf_budget():
+  """Tests that the tree stops growing at the leaf budget."""
+
+  rtkgers = RTreeBestFirst(config(3), points())
+  rtkgers.populate()
+
+  assert leaves(rtkgers.root) <= 3
+
+
+def test_budget_searches():
+  """Tests that no split is searched for once the leaf budget is used up."""
+
+  rtkgers = RTreeBestFirst(config(2), points())
+
+  searched = []
+  split = rtkgers.split
+  rtkgers.split = lambda node: searched.append(node) or split(node)
+  rtkgers.populate()
+
+  # Only the root is searched, its children would exceed the budget.
+  assert searched == [rtkgers.root]
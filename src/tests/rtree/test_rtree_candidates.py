@@ -0,0 +1,39 @@
+"""
+Test the split candidate strategies.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+from rtkgers.rtree.candidates import every
+from rtkgers.rtree.candidates import quantiles
+from rtkgers.rtree.candidates import sample
+
+
+def test_every():
+  """Test that every index is returned, including both ends."""
+
+  assert every(3, 7, 2) == [3, 4, 5, 6, 7]
+
+
+def test_quantiles():
+  """Test that evenly spaced indices are returned, including both ends."""
+
+  assert quantiles(0, 100, 5) == [0, 25, 50, 75, 100]
+
+  # Small nodes evaluate every index.
+  assert quantiles(3, 5, 32) == [3, 4, 5]
+
+
+def test_sample():
+  """Test that a bounded number of sorted indices are sampled."""
+
+  for i in range(0, 100):
+    indices = sample(10, 1000, 8)
+
+    assert len(indices) == 8
+    assert indices == sorted(indices)
+    assert min(indices) >= 10 and max(indices) <= 1000
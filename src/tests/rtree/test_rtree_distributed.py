@@ -0,0 +1,139 @@
+"""
+Test the distributed recursive tree.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import pickle
+
+import ConfigParser
+
+import rtkgers.utils.generate as GenerateUtils
+
+from rtkgers.dataset import Dataset
+from rtkgers.point import Point
+from rtkgers.rtree.distributed import LocalCluster
+from rtkgers.rtree.distributed import RTreeDistributed
+
+
+def config(workers, share=False):
+  """Returns the configuration to use for the distributed algorithm."""
+
+  config = ConfigParser.RawConfigParser()
+
+  config.add_section('Main')
+  config.set('Main', 'MaxThreads', 4)
+
+  config.add_section('KGERS')
+  config.set('KGERS', 'Algorithm', 'KGERSLeastSquares')
+  config.set('KGERS', 'K', 10)
+
+  config.add_section('Distributed')
+  config.set('Distributed', 'Workers', workers)
+  config.set('Distributed', 'Jobs', 4)
+  config.set('Distributed', 'ShareData', str(share))
+
+  return config
+
+
+def dataset():
+  """Returns a data set of three linear regimes."""
+
+  features, solutions = GenerateUtils.piecewise(600, 2, noise=0.1, regimes=3,
+    seed=1)
+
+  return Dataset.factory([Point(x, y) for x, y in zip(features, solutions)])
+
+
+def leaves(node):
+  """Returns the number of leaves under a node."""
+
+  if (node.left == None or node.right == None):
+    return 1
+
+  return leaves(node.left) + leaves(node.right)
+
+
+def merges(rtkgers):
+  """Returns the list of the leaves the workers' subtrees are merged into."""
+
+  merged = []
+  merge = rtkgers.merge
+
+  def track(node, subtree, order):
+    merged.append(node)
+    merge(node, subtree, order)
+
+  rtkgers.merge = track
+
+  return merged
+
+
+def test_distributed(caplog):
+  """Test that the subtrees grown by workers are merged into the tree."""
+
+  data = dataset()
+  test = data.points(0, 100)
+
+  with LocalCluster(2) as cluster:
+    rtkgers = RTreeDistributed(config(cluster.workers()), data)
+    merged = merges(rtkgers)
+    rtkgers.populate()
+
+  # Every job was grown by a worker.
+  assert len(merged) > 0
+  assert not 'locally' in caplog.text
+
+  assert leaves(rtkgers.root) >= 3
+  assert rtkgers.error(test) < 1.0
+
+  # The ranges of the merged subtrees index the points of their leaves.
+  assert sorted(rtkgers.index) == range(0, 600)
+  for leaf in rtkgers.leaves(rtkgers.root):
+    assert all([rtkgers.leaf(point) is leaf
+      for point in rtkgers.members(leaf)])
+
+  # The model is usable after a round trip (without the tracking).
+  del rtkgers.merge
+  rtkgers = pickle.loads(pickle.dumps(rtkgers, pickle.HIGHEST_PROTOCOL))
+  assert rtkgers.error(test) < 1.0
+
+
+def test_distributed_shared(caplog):
+  """Test that workers can attach to the shared data set."""
+
+  data = dataset()
+
+  with LocalCluster(2) as cluster:
+    rtkgers = RTreeDistributed(config(cluster.workers(), share=True), data)
+    merged = merges(rtkgers)
+    rtkgers.populate()
+
+  assert len(merged) > 0
+  assert not 'locally' in caplog.text
+
+  assert leaves(rtkgers.root) >= 3
+  assert rtkgers.error(data.points(0, 100)) < 1.0
+
+  # The shared file only exists while training.
+  assert data.filename == None
+
+
+def test_distributed_local(caplog):
+  """Test that the jobs are grown locally when there are no workers."""
+
+  data = dataset()
+
+  rtkgers = RTreeDistributed(config(''), data)
+  merged = merges(rtkgers)
+  rtkgers.populate()
+
+  assert merged == []
+  assert 'Growing 4 of 4 jobs locally' in caplog.text
+
+  assert leaves(rtkgers.root) >= 3
+  assert rtkgers.error(data.points(0, 100)) < 1.0
@@ -0,0 +1,90 @@
+"""
+Test the export of trained trees.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import imp
+
+import ConfigParser
+import numpy as np
+
+import rtkgers.rtree.export as Export
+import rtkgers.utils.generate as GenerateUtils
+
+from rtkgers.point import Point
+from rtkgers.rtree.original import RTreeOriginal
+
+
+def compile(source):
+  """Returns the module of generated source."""
+
+  module = imp.new_module('predictor')
+  exec source in module.__dict__
+
+  return module
+
+
+def tree():
+  """Returns a tree grown on three linear regimes."""
+
+  config = ConfigParser.RawConfigParser()
+
+  config.add_section('Main')
+  config.set('Main', 'MaxThreads', 4)
+
+  config.add_section('KGERS')
+  config.set('KGERS', 'Algorithm', 'KGERSLeastSquares')
+  config.set('KGERS', 'K', 10)
+
+  features, solutions = GenerateUtils.piecewise(300, 2, noise=0.1, regimes=3,
+    seed=1)
+
+  rtkgers = RTreeOriginal(config,
+    [Point(x, y) for x, y in zip(features, solutions)])
+  rtkgers.populate()
+
+  return rtkgers, features
+
+
+def test_export_python():
+  """Test that the generated module solves points like the tree."""
+
+  rtkgers, features = tree()
+  module = compile(Export.python(rtkgers))
+
+  for x in features:
+    assert abs(module.solve(list(x)) - rtkgers.solve(Point(x))) < 1e-9
+
+
+def test_export_vectorized():
+  """Test that the generated NumPy module solves arrays like the tree."""
+
+  rtkgers, features = tree()
+  module = compile(Export.vectorized(rtkgers))
+
+  expected = [rtkgers.solve(Point(x)) for x in features]
+  assert np.allclose(module.solve(features), expected, rtol=0, atol=1e-9)
+
+
+def test_export_nesting():
+  """Test that subtrees nested too deep are moved into functions."""
+
+  rtkgers, features = tree()
+
+  nesting = Export.MAX_NESTING
+  Export.MAX_NESTING = 1
+  try:
+    source = Export.python(rtkgers)
+  finally:
+    Export.MAX_NESTING = nesting
+
+  assert '_subtree1' in source
+
+  module = compile(source)
+  for x in features:
+    assert abs(module.solve(list(x)) - rtkgers.solve(Point(x))) < 1e-9
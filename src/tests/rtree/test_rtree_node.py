@@ -0,0 +1,37 @@
+"""
+Test the node class.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import pickle
+
+from rtkgers.rtree.node import Node
+
+
+def test_node_pickle():
+  """Test that nodes are pickled, including ones of older versions."""
+
+  node = Node()
+  node.left = Node()
+  node.right = Node()
+  node.feature = 1
+  node.threshold = 2.5
+
+  node = pickle.loads(pickle.dumps(node, pickle.HIGHEST_PROTOCOL))
+
+  assert node.feature == 1 and node.threshold == 2.5
+  assert node.left.left == None and node.right.depth == 0
+
+  # Nodes were pickled with their dictionary before they were slotted,
+  #  possibly without the attributes added since.
+  node = Node.__new__(Node)
+  node.__setstate__({'feature': 0, 'threshold': 1.0, 'hyperplane': None,
+    'index': 0, 'left': None, 'right': None, 'extra': True})
+
+  assert node.feature == 0 and node.threshold == 1.0
+  assert node.depth == 0 and node.start == None and node.end == None
@@ -9,9 +9,14 @@ The style guide follows the strict python PEP 8 guidelines.
 @copyright 2014 - Present Aaron Zampaglione
 """
 import ConfigParser
+import pickle
 import numpy as np
 import pytest
 
+import rtkgers.utils.generate as GenerateUtils
+
+from rtkgers.dataset import Dataset
+from rtkgers.exceptions.hyperplane import HyperplaneException
 from rtkgers.point import Point
 from rtkgers.rtree.original import RTreeOriginal
 
@@ -114,3 +119,441 @@ def test_two_lines_perfect():
     # Make sure the solution is within range.
     solution = rtkgers.solve(Point([28.0, 29.0]))
     assert solution >= 103.0 and solution <= 107.0
+
+
+def test_max_leaves():
+  """Tests that the tree stops growing at the leaf budget."""
+
+  points = []
+  for x in range(0, 30):
+    points.append(Point([float(x), float(x % 7)], float(abs(x - 15))))
+
+  settings = config()
+  settings.add_section('RTree')
+  settings.set('RTree', 'MaxLeaves', 1)
+
+  rtkgers = RTreeOriginal(settings, points)
+  rtkgers.populate()
+
+  # A single leaf means the root was never split.
+  assert rtkgers.root.left == None
+  assert rtkgers.root.right == None
+
+
+def test_max_depth():
+  """Tests that the tree does not grow past the max depth."""
+
+  points = []
+  for x in range(0, 40):
+    points.append(Point([float(x), float(x % 7)], float(pow(x - 20, 2))))
+
+  settings = config()
+  settings.add_section('RTree')
+  settings.set('RTree', 'MaxDepth', 1)
+
+  rtkgers = RTreeOriginal(settings, points)
+  rtkgers.populate()
+
+  nodes = [rtkgers.root]
+  while len(nodes) > 0:
+    node = nodes.pop()
+    assert node.depth <= 1
+    nodes.extend([child for child in [node.left, node.right] if child != None])
+
+  # The progress is not kept with the model.
+  assert rtkgers.progress == None
+
+
+def test_ranges():
+  """Tests that the leaves cover contiguous ranges of one index."""
+
+  features, solutions = GenerateUtils.piecewise(300, 2, noise=0.1, regimes=3,
+    seed=1)
+  points = [Point(x, y) for x, y in zip(features, solutions)]
+
+  settings = config()
+  settings.set('KGERS', 'Algorithm', 'KGERSLeastSquares')
+
+  rtkgers = RTreeOriginal(settings, points)
+  rtkgers.populate()
+
+  assert sorted(rtkgers.index) == range(0, 300)
+  assert rtkgers.root.start == 0 and rtkgers.root.end == 300
+
+  leaves = rtkgers.leaves(rtkgers.root)
+  assert len(leaves) > 1
+  assert sum([leaf.size() for leaf in leaves]) == 300
+  for leaf in leaves:
+    assert all([rtkgers.leaf(point) is leaf
+      for point in rtkgers.members(leaf)])
+
+
+def test_split_algorithm():
+  """Tests scoring splits with a surrogate and refitting the leaves."""
+
+  points = []
+  for x in range(0, 40):
+    points.append(Point([float(x), float(x % 7)], float(pow(x - 20, 2))))
+
+  settings = config()
+  settings.add_section('RTree')
+  settings.set('RTree', 'SplitAlgorithm', 'KGERSLeastSquares')
+
+  rtkgers = RTreeOriginal(settings, points)
+  rtkgers.populate()
+
+  # A leaf that can not be refit keeps the model it was split with.
+  leaves = [leaf.hyperplane.__class__.__name__
+    for leaf in rtkgers.leaves(rtkgers.root)]
+  assert all([name in ['KGERSOriginal', 'KGERSLeastSquares']
+    for name in leaves])
+  assert 'KGERSOriginal' in leaves
+
+
+def test_split_statistics():
+  """Tests scoring splits from the statistics of an incremental algorithm."""
+
+  # Two lines, 3x + 2 = z for x < 20 and 2x + 40 = z after.
+  points = []
+  for x in range(0, 40):
+    solution = 3.0 * x + 2.0 if x < 20 else 2.0 * x + 40.0
+    points.append(Point([float(x), float(x % 7)], solution))
+
+  settings = config()
+  settings.set('KGERS', 'Algorithm', 'KGERSLeastSquares')
+
+  rtkgers = RTreeOriginal(settings, points)
+  rtkgers.populate()
+
+  assert rtkgers.root.feature == 0
+  assert rtkgers.root.threshold == 19.5
+  assert round(rtkgers.solve(Point([7.0, 0.0])) - 23.0, 5) == 0.0
+  assert round(rtkgers.solve(Point([30.0, 2.0])) - 100.0, 5) == 0.0
+
+
+def test_split_prefixes():
+  """Tests that the chunked prefix sums match the sums of every point."""
+
+  points = []
+  for x in range(0, 40):
+    points.append(Point([float(x), float(x % 7)], 3.0 * x + float(x % 5)))
+
+  settings = config()
+  settings.set('KGERS', 'Algorithm', 'KGERSLeastSquares')
+
+  rtkgers = RTreeOriginal(settings, points)
+  segment = np.arange(len(points))[::-1]
+  labels = np.arange(len(points)) % 3
+  indices = np.array([1, 5, 6, 20, 39])
+
+  statistics = rtkgers.statistics(rtkgers.coordinates[segment])
+  expected = [np.cumsum(statistics, axis=0)] + [
+    np.cumsum(statistics * (labels == fold)[:, None], axis=0)
+    for fold in range(3)]
+
+  # Chunks of one point, of a few points and of all the points.
+  width = statistics.shape[1]
+  for chunk in [1, 7 * width, 100 * width]:
+    rtkgers.CHUNK = chunk
+    prefixes = rtkgers.prefixes(segment, labels, 3, indices)
+
+    assert prefixes.shape == (4, len(indices) + 1, width)
+    for i in range(4):
+      assert np.allclose(prefixes[i, :-1], expected[i][indices - 1])
+      assert np.allclose(prefixes[i, -1], expected[i][-1])
+
+
+def test_split_folds():
+  """Tests cross validating the splits of both split algorithms."""
+
+  # Two lines, 3x + 2 = z for x < 20 and 2x + 40 = z after.
+  points = []
+  for x in range(0, 40):
+    solution = 3.0 * x + 2.0 if x < 20 else 2.0 * x + 40.0
+    points.append(Point([float(x), float(x % 7)], solution))
+
+  for algorithm in ['KGERSLeastSquares', 'KGERSOriginal']:
+    settings = config()
+    settings.add_section('RTree')
+    settings.set('RTree', 'SplitAlgorithm', algorithm)
+    settings.set('RTree', 'SplitFolds', 3)
+    settings.set('RTree', 'MaxDepth', 1)
+
+    rtkgers = RTreeOriginal(settings, points)
+    rtkgers.populate()
+
+    assert rtkgers.root.feature == 0
+    assert rtkgers.root.threshold == 19.5
+
+
+def test_algorithm_weights():
+  """Tests that every KGERS algorithm can be selected for the leaves."""
+
+  points = []
+  for x in range(0, 40):
+    points.append(Point([float(x), float(x % 7)], 3.0 * x + 2.0))
+
+  settings = config()
+  settings.set('KGERS', 'Algorithm', 'KGERSWeights')
+  settings.add_section('KGERSWeights')
+  settings.set('KGERSWeights', 'Multiple', 2)
+  settings.add_section('RTree')
+  settings.set('RTree', 'SplitAlgorithm', 'KGERSLeastSquares')
+
+  rtkgers = RTreeOriginal(settings, points)
+  rtkgers.populate()
+
+  solution = rtkgers.solve(Point([7.0, 0.0]))
+  assert solution >= 21.0 and solution <= 25.0
+
+
+def test_precision():
+  """Tests growing a tree from single precision points."""
+
+  dtype = Point.DTYPE
+  Point.DTYPE = np.dtype(np.float32)
+
+  try:
+    points = []
+    for x in range(0, 40):
+      solution = 3.0 * x + 2.0 if x < 20 else 2.0 * x + 40.0
+      points.append(Point([float(x), float(x % 7)], solution))
+
+    settings = config()
+    settings.set('KGERS', 'Algorithm', 'KGERSLeastSquares')
+
+    rtkgers = RTreeOriginal(settings, Dataset.factory(points))
+    rtkgers.populate()
+
+    assert rtkgers.dtype == np.float32
+    assert rtkgers.hyperplane(Point([7.0, 0.0])).coefficients.dtype == \
+      np.float32
+    assert abs(rtkgers.solve(Point([7.0, 0.0])) - 23.0) < 1e-3
+    assert abs(rtkgers.solve(Point([30.0, 2.0])) - 100.0) < 1e-3
+  finally:
+    Point.DTYPE = dtype
+
+
+def test_update():
+  """Tests absorbing new points of the same function into the leaves."""
+
+  points = []
+  for x in range(0, 40):
+    solution = 3.0 * x + 2.0 if x < 20 else 2.0 * x + 40.0
+    points.append(Point([float(x), float(x % 7)], solution))
+
+  settings = config()
+  settings.set('KGERS', 'Algorithm', 'KGERSLeastSquares')
+
+  rtkgers = RTreeOriginal(settings, points)
+  rtkgers.populate()
+
+  updates = []
+  for x in range(40, 60):
+    updates.append(Point([x - 39.5, float(x % 5)], 3.0 * (x - 39.5) + 2.0))
+  rtkgers.update(updates)
+
+  assert len(rtkgers.points) == 60
+  leaf = rtkgers.leaf(Point([7.0, 0.0]))
+  assert leaf.statistics.count == leaf.size()
+  assert round(rtkgers.solve(Point([7.0, 0.0])) - 23.0, 5) == 0.0
+  assert round(rtkgers.solve(Point([30.0, 2.0])) - 100.0, 5) == 0.0
+
+
+def test_update_storage():
+  """Tests that the points are views of the coordinates appended to."""
+
+  points = []
+  for x in range(0, 40):
+    points.append(Point([float(x), float(x % 7)], 3.0 * x + 2.0))
+
+  settings = config()
+  settings.set('KGERS', 'Algorithm', 'KGERSLeastSquares')
+  settings.add_section('Update')
+  settings.set('Update', 'Window', 50)
+
+  rtkgers = RTreeOriginal(settings, points)
+  rtkgers.populate()
+
+  assert all([np.may_share_memory(point.features, rtkgers.coordinates)
+    for point in rtkgers.points])
+
+  # The storage grows to twice the points, the next points are only copied.
+  rtkgers.update([Point([x + 0.5, 1.0], 3.0 * x + 3.5) for x in range(5)])
+  storage = rtkgers.storage
+  assert len(storage) == 90
+
+  rtkgers.update([Point([x + 0.5, 2.0], 3.0 * x + 3.5) for x in range(10)])
+  assert rtkgers.storage is storage
+  assert rtkgers.offset == 5
+  assert len(rtkgers.points) == len(rtkgers.coordinates) == 50
+
+  for point, row in zip(rtkgers.points, rtkgers.coordinates):
+    assert np.may_share_memory(point.features, row)
+    assert np.array_equal(point.coordinates, row)
+
+  leaf = rtkgers.leaf(Point([7.0, 0.0]))
+  assert leaf.statistics.count == leaf.size()
+  assert round(rtkgers.solve(Point([30.0, 2.0])) - 92.0, 5) == 0.0
+
+
+def test_update_config():
+  """Tests that the settings are read again from a replaced config."""
+
+  points = []
+  for x in range(0, 40):
+    solution = 3.0 * x + 2.0 if x < 20 else 2.0 * x + 40.0
+    points.append(Point([float(x), float(x % 7)], solution))
+
+  rtkgers = RTreeOriginal(config(), points)
+  rtkgers.populate()
+  rtkgers = pickle.loads(pickle.dumps(rtkgers, pickle.HIGHEST_PROTOCOL))
+
+  settings = config()
+  settings.set('KGERS', 'Algorithm', 'KGERSLeastSquares')
+  settings.add_section('RTree')
+  settings.set('RTree', 'MaxDepth', 2)
+  rtkgers.configure(settings)
+
+  assert rtkgers.config == settings
+  assert rtkgers.algorithm == 'KGERSLeastSquares'
+  assert rtkgers.split_algorithm == 'KGERSLeastSquares'
+  assert rtkgers.max_depth == 2
+
+  rtkgers.update([Point([float(x), 1.0], 3.0 * x + 2.0) for x in range(5)])
+
+  assert len(rtkgers.points) == 45
+  assert rtkgers.leaf(Point([3.0, 1.0])).hyperplane.__class__.__name__ == \
+    'KGERSLeastSquares'
+
+
+def test_update_window():
+  """Tests that the points outside the window are evicted from the leaves."""
+
+  points = []
+  for x in range(0, 40):
+    points.append(Point([float(x % 10), float(x % 7)], 3.0 * (x % 10) + 2.0))
+
+  settings = config()
+  settings.set('KGERS', 'Algorithm', 'KGERSLeastSquares')
+  settings.add_section('Update')
+  settings.set('Update', 'Window', 40)
+
+  rtkgers = RTreeOriginal(settings, points)
+  rtkgers.populate()
+
+  updates = []
+  for x in range(0, 40):
+    updates.append(Point([float(x % 10), float(x % 3)], 4.0 * (x % 10) + 1.0))
+  rtkgers.update(updates)
+
+  assert len(rtkgers.points) == 40
+  assert round(rtkgers.solve(Point([7.0, 0.0])) - 29.0, 5) == 0.0
+
+
+def test_legacy_update():
+  """Tests updating a model pickled before the nodes had index ranges."""
+
+  points = []
+  for x in range(0, 40):
+    solution = 3.0 * x + 2.0 if x < 20 else 2.0 * x + 40.0
+    points.append(Point([float(x), float(x % 7)], solution))
+
+  settings = config()
+  settings.set('KGERS', 'Algorithm', 'KGERSLeastSquares')
+
+  rtkgers = RTreeOriginal(settings, points)
+  rtkgers.populate()
+
+  # Strip the model down to the attributes of the original format.
+  for name in rtkgers.__dict__.keys():
+    if name not in ['algorithm', 'config', 'min_points', 'points', 'root']:
+      delattr(rtkgers, name)
+  for node in [rtkgers.root, rtkgers.root.left, rtkgers.root.right]:
+    node.depth = 0
+    node.start = node.end = None
+
+  rtkgers = pickle.loads(pickle.dumps(rtkgers, pickle.HIGHEST_PROTOCOL))
+
+  assert rtkgers.split_algorithm == 'KGERSLeastSquares'
+  assert rtkgers.root.left.depth == 1
+  assert rtkgers.root.left.size() == 20 and rtkgers.root.right.size() == 20
+  assert sorted(rtkgers.index) == range(0, 40)
+
+  updates = []
+  for x in range(40, 60):
+    updates.append(Point([x - 39.5, float(x % 5)], 3.0 * (x - 39.5) + 2.0))
+  rtkgers.update(updates)
+
+  assert len(rtkgers.points) == 60
+  assert rtkgers.root.left.size() == 40
+  assert round(rtkgers.solve(Point([7.0, 0.0])) - 23.0, 5) == 0.0
+  assert round(rtkgers.solve(Point([30.0, 2.0])) - 100.0, 5) == 0.0
+
+
+def test_reuse():
+  """Tests that a warm start keeps the splits that still improve the error."""
+
+  points = []
+  for x in range(0, 40):
+    solution = 3.0 * x + 2.0 if x < 20 else 2.0 * x + 40.0
+    points.append(Point([float(x), float(x % 7)], solution))
+
+  settings = config()
+  settings.set('KGERS', 'Algorithm', 'KGERSLeastSquares')
+
+  trained = RTreeOriginal(settings, points)
+  trained.populate()
+
+  # The lines drift, but still break at the same place.
+  drifted = []
+  for x in range(0, 40):
+    solution = 3.0 * x + 3.0 if x < 20 else 2.0 * x + 41.0
+    drifted.append(Point([float(x), float(x % 7)], solution))
+
+  rtkgers = RTreeOriginal(settings, drifted)
+  rtkgers.reuse(trained)
+
+  assert rtkgers.progress == None
+  assert rtkgers.root.feature == 0
+  assert rtkgers.root.threshold == 19.5
+  assert round(rtkgers.solve(Point([7.0, 0.0])) - 24.0, 5) == 0.0
+  assert round(rtkgers.solve(Point([30.0, 2.0])) - 101.0, 5) == 0.0
+
+  # A single line does not need the split anymore.
+  line = []
+  for x in range(0, 40):
+    line.append(Point([float(x), float(x % 7)], 3.0 * x + 2.0))
+
+  rtkgers = RTreeOriginal(settings, line)
+  rtkgers.reuse(trained)
+
+  assert rtkgers.root.left == None and rtkgers.root.right == None
+  assert round(rtkgers.solve(Point([30.0, 2.0])) - 92.0, 5) == 0.0
+
+
+def test_reuse_fallback():
+  """Tests that a warm start grows the tree if the splits can not be reused."""
+
+  points = []
+  for x in range(0, 40):
+    solution = 3.0 * x + 2.0 if x < 20 else 2.0 * x + 40.0
+    points.append(Point([float(x), float(x % 7)], solution))
+
+  settings = config()
+  settings.set('KGERS', 'Algorithm', 'KGERSLeastSquares')
+
+  trained = RTreeOriginal(settings, points)
+  trained.populate()
+
+  def rebuild(node, start, end):
+    raise HyperplaneException("The root can not be fit.")
+
+  rtkgers = RTreeOriginal(settings, points)
+  rtkgers.rebuild = rebuild
+  rtkgers.reuse(trained)
+
+  assert rtkgers.progress == None
+  assert rtkgers.root.feature == 0
+  assert rtkgers.root.threshold == 19.5
+  assert round(rtkgers.solve(Point([30.0, 2.0])) - 100.0, 5) == 0.0
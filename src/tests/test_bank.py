@@ -0,0 +1,105 @@
+"""
+Test the model bank.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import os
+import pickle
+
+import pytest
+
+from rtkgers.bank import ModelBank
+from rtkgers.exceptions.bank import BankException
+
+
+def write(tmpdir, id, model):
+  """Writes a model to the directory and returns its file name."""
+
+  filename = str(tmpdir.join(id + '.model'))
+  with open(filename, 'wb') as model_file:
+    pickle.dump(model, model_file, pickle.HIGHEST_PROTOCOL)
+
+  return filename
+
+
+def test_bank_lazy(tmpdir):
+  """Test that models are only loaded when requested."""
+
+  for id in ['a', 'b', 'c']:
+    write(tmpdir, id, {'id': id})
+
+  bank = ModelBank.directory(str(tmpdir))
+
+  assert bank.ids() == ['a', 'b', 'c']
+  assert 'a' in bank and not 'd' in bank
+  assert bank.loaded() == []
+
+  assert bank.get('b') == {'id': 'b'}
+  assert bank.loaded() == ['b']
+
+  with pytest.raises(BankException):
+    bank.get('d')
+
+
+def test_bank_evict(tmpdir):
+  """Test that the least recently used models are evicted."""
+
+  for id in ['a', 'b', 'c']:
+    write(tmpdir, id, {'id': id})
+
+  bank = ModelBank.directory(str(tmpdir), max_models=2)
+
+  bank.get('a')
+  bank.get('b')
+  bank.get('a')
+  bank.get('c')
+
+  assert bank.loaded() == ['a', 'c']
+
+  # The bytes limit keeps the most recently used model only.
+  bank.max_bytes = os.path.getsize(str(tmpdir.join('a.model')))
+  bank.get('b')
+
+  assert bank.loaded() == ['b']
+  assert bank.bytes == bank.max_bytes
+
+
+def test_bank_reload(tmpdir):
+  """Test that a model is reloaded when its file changes."""
+
+  filename = write(tmpdir, 'a', {'version': 1})
+
+  bank = ModelBank.directory(str(tmpdir))
+  assert bank.get('a') == {'version': 1}
+
+  write(tmpdir, 'a', {'version': 2})
+  status = os.stat(filename)
+  os.utime(filename, (status.st_atime, status.st_mtime + 10))
+
+  assert bank.get('a') == {'version': 2}
+  assert bank.loaded() == ['a']
+
+
+def test_bank_rescan(tmpdir):
+  """Test that a model written after the directory was read is found."""
+
+  write(tmpdir, 'a', {'id': 'a'})
+
+  bank = ModelBank.directory(str(tmpdir))
+  assert not 'b' in bank
+
+  write(tmpdir, 'b', {'id': 'b'})
+
+  assert 'b' in bank
+  assert bank.get('b') == {'id': 'b'}
+  assert bank.ids() == ['a', 'b']
+
+  # Ids are never paths out of the directory.
+  write(tmpdir.mkdir('c'), 'd', {'id': 'd'})
+  with pytest.raises(BankException):
+    bank.get(os.path.join('c', 'd'))
@@ -0,0 +1,101 @@
+"""
+Test the data set class.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import multiprocessing
+import os
+import pickle
+
+import numpy as np
+
+import rtkgers.utils.data as DataUtils
+
+from rtkgers.dataset import Dataset
+from rtkgers.point import Point
+
+
+def points():
+  """Returns points for the equation 3x + 2y + 2 = z."""
+
+  points = []
+  points.append(Point([2.0, 2.0], 12.0))
+  points.append(Point([3.0, 5.0], 21.0))
+  points.append(Point([4.0, 1.0], 16.0))
+  points.append(Point([7.0, 3.0], 29.0))
+
+  return points
+
+
+def total(dataset, start, end):
+  """Returns the sum of the solutions of an index range of a data set."""
+
+  return sum([point.solution for point in dataset.points(start, end)])
+
+
+def test_dataset_points():
+  """Test that points are returned by index range and by indices."""
+
+  dataset = Dataset.factory(points())
+
+  assert len(dataset) == 4
+  assert dataset.dimensions == 3
+  assert [point.solution for point in dataset.points(1, 3)] == [21.0, 16.0]
+  assert [point.solution for point in dataset.take([3, 0])] == [29.0, 12.0]
+  assert np.array_equal(dataset.points()[2].features, [4.0, 1.0])
+
+
+def test_dataset_share():
+  """Test that a shared data set is pickled as its handle only."""
+
+  dataset = Dataset.factory(points())
+  dataset.share()
+
+  try:
+    data = pickle.dumps(dataset, pickle.HIGHEST_PROTOCOL)
+    attached = pickle.loads(data)
+
+    assert isinstance(attached.coordinates, np.memmap)
+    assert np.array_equal(attached.coordinates, dataset.coordinates)
+
+    # Workers in other processes only receive the handle and a range.
+    pool = multiprocessing.Pool(2)
+    try:
+      results = pool.map_async(total_star,
+        [(dataset, 0, 2), (dataset, 2, 4)]).get(30)
+    finally:
+      pool.terminate()
+
+    assert results == [33.0, 45.0]
+  finally:
+    filename = dataset.filename
+    dataset.close()
+
+  assert not os.path.exists(filename)
+  assert len(dataset) == 4
+
+
+def test_dataset_load_binary(tmpdir):
+  """Test that a binary data set is memory-mapped from its file."""
+
+  filename = str(tmpdir.join('points.npy'))
+  DataUtils.write_binary(filename, [point.features for point in points()],
+    [point.solution for point in points()])
+
+  dataset = Dataset.load(filename)
+
+  assert isinstance(dataset.coordinates, np.memmap)
+  assert dataset.handle()[0] == filename
+  assert [point.solution for point in
+    Dataset.attach(dataset.handle()).points()] == [12.0, 21.0, 16.0, 29.0]
+
+
+def total_star(args):
+  """Unpacks the arguments of total(), for Pool.map()."""
+
+  return total(*args)
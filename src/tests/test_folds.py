@@ -0,0 +1,72 @@
+"""
+Test the folds class.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import numpy as np
+
+from rtkgers.folds import Folds
+
+
+def test_holdout():
+  """Test that a holdout tests the requested number of points."""
+
+  folds = Folds.holdout(20, 6)
+
+  assert len(folds) == 20
+  assert folds.k == 1
+  assert np.sum(folds.labels == 0) == 6
+  assert np.sum(folds.labels == -1) == 14
+
+
+def test_interleaved():
+  """Test that every range of the positions is split evenly."""
+
+  folds = Folds.interleaved(20, 3)
+
+  assert folds.k == 3
+  assert list(folds.labels[:6]) == [0, 1, 2, 0, 1, 2]
+
+  # The folds of a slice are the labels of the slice.
+  side = folds[7:17]
+  assert len(side) == 10
+  assert side.k == 3
+  for fold in range(3):
+    assert 3 <= np.sum(side.labels == fold) <= 4
+
+
+def test_shuffled():
+  """Test that every position is tested exactly once across the folds."""
+
+  folds = Folds.shuffled(10, 3, seed=1)
+
+  assert folds.k == 3
+  assert sorted([np.sum(folds.labels == fold) for fold in range(3)]) == \
+    [3, 3, 4]
+  for fold in range(3):
+    training, test = folds.indices(fold)
+    assert len(training) + len(test) == 10
+    assert len(np.intersect1d(training, test)) == 0
+
+  # The same seed gives the same folds.
+  assert np.array_equal(folds.labels, Folds.shuffled(10, 3, seed=1).labels)
+
+
+def test_take():
+  """Test that a fold takes the points in their order without copies."""
+
+  points = [object() for i in range(10)]
+
+  training, test = Folds.interleaved(10, 3).take(points, 1)
+
+  assert training == [points[i] for i in [0, 2, 3, 5, 6, 8, 9]]
+  assert test == [points[i] for i in [1, 4, 7]]
+
+  training, test = Folds.holdout(10, 0).take(points)
+  assert training == points
+  assert test == []
@@ -8,6 +8,8 @@ The style guide follows the strict python PEP 8 guidelines.
 @requires Python >=2.7
 @copyright 2014 - Present Aaron Zampaglione
 """
+import pickle
+
 import numpy as np
 
 from rtkgers.point import Point
@@ -47,3 +49,35 @@ def test_point_set_solution():
 
   assert point.solution == 4.0
   assert (point.coordinates == [1, 2, 4]).all()
+
+
+def test_point_view():
+  """Test a point that is a view into a coordinate array."""
+
+  coordinates = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+  point = Point.view(coordinates[1])
+
+  assert (point.features == [4.0, 5.0]).all()
+  assert point.solution == 6.0
+  assert point.dimensions == 3
+
+  # The features share the memory of the array.
+  coordinates[1, 0] = 7.0
+  assert point.features[0] == 7.0
+
+
+def test_point_pickle():
+  """Test that points are pickled, including ones of older versions."""
+
+  point = pickle.loads(pickle.dumps(Point([1.0, 2.0], 3.0),
+    pickle.HIGHEST_PROTOCOL))
+
+  assert (point.coordinates == [1.0, 2.0, 3.0]).all()
+  assert not hasattr(point, '__dict__')
+
+  # Points were pickled with their dictionary before they were slotted.
+  point = Point.__new__(Point)
+  point.__setstate__({'features': np.array([1.0, 2.0]), 'solution': 3.0,
+    'dimensions': 3})
+
+  assert (point.coordinates == [1.0, 2.0, 3.0]).all()
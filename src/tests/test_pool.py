@@ -0,0 +1,163 @@
+"""
+Test the thread pool class.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import threading
+
+import pytest
+
+from rtkgers.pool import Batch
+from rtkgers.pool import Pool
+
+from rtkgers.exceptions.batch import BatchException
+
+
+def test_pool_results():
+  """Test that every task's result is returned through its future."""
+
+  pool = Pool(2)
+  futures = [pool.submit(pow, i, 2) for i in range(0, 100)]
+
+  assert [future.result() for future in futures] == \
+    [pow(i, 2) for i in range(0, 100)]
+
+  pool.shutdown()
+
+
+def test_pool_exception():
+  """Test that a task's exception is raised through its future."""
+
+  def fail():
+    raise ValueError("Failed.")
+
+  pool = Pool(2)
+  future = pool.submit(fail)
+
+  assert isinstance(future.exception(), ValueError)
+  with pytest.raises(ValueError):
+    future.result()
+
+  pool.shutdown()
+
+
+def test_pool_threads():
+  """Test that the number of threads does not grow with the tasks."""
+
+  pool = Pool(3)
+  idents = set()
+  lock = threading.Lock()
+
+  def record():
+    with lock:
+      idents.add(threading.current_thread().ident)
+
+  for future in [pool.submit(record) for i in range(0, 200)]:
+    future.result()
+
+  assert len(idents) <= 3
+
+  pool.shutdown()
+
+
+def test_pool_nested():
+  """Test that a task can submit tasks to its own pool."""
+
+  pool = Pool(1)
+
+  def outer():
+    return pool.submit(pow, 2, 3).result()
+
+  assert pool.submit(outer).result() == 8
+
+  pool.shutdown()
+
+
+def test_pool_shared():
+  """Test configuring the shared pool."""
+
+  Pool.configure(2)
+
+  assert Pool.shared().size == 2
+  assert Pool.shared() is Pool.shared()
+
+  Pool.configure(Pool.DEFAULT_SIZE)
+
+
+def test_batch_fail_fast():
+  """Test that a batch is cancelled once a task fails."""
+
+  def fail():
+    raise ValueError("Failed.")
+
+  pool = Pool(1)
+  batch = Batch(pool)
+
+  # Block the only thread so the batch is queued behind it.
+  started = threading.Event()
+  release = threading.Event()
+  def block():
+    started.set()
+    release.wait()
+
+  blocker = pool.submit(block)
+  started.wait()
+
+  batch.submit(fail)
+  skipped = [batch.submit(pow, 2, 2) for i in range(0, 10)]
+  release.set()
+
+  with pytest.raises(BatchException) as info:
+    batch.wait()
+
+  # Only the failure is reported, the skipped tasks never ran.
+  assert len(info.value.exceptions) == 1
+  assert isinstance(info.value.exceptions[0], ValueError)
+  assert all([future.value == None for future in skipped])
+
+  pool.shutdown()
+
+
+def test_batch_tolerance():
+  """Test that a batch tolerates the configured number of failures."""
+
+  def fail():
+    raise ValueError("Failed.")
+
+  pool = Pool(2)
+  batch = Batch(pool, 2)
+
+  batch.submit(fail)
+  batch.submit(fail)
+  batch.submit(pow, 2, 3)
+
+  futures = batch.wait()
+
+  assert futures[2].result() == 8
+  assert not batch.cancelled()
+
+  pool.shutdown()
+
+
+def test_batch_interrupted():
+  """Test that a running task can see its batch was cancelled."""
+
+  pool = Pool(1)
+  batch = Batch(pool)
+
+  def interrupted():
+    batch.cancel()
+    return Batch.interrupted()
+
+  future = batch.submit(interrupted)
+  batch.wait()
+
+  assert future.result() == True
+  assert Batch.interrupted() == False
+
+  pool.shutdown()
@@ -0,0 +1,83 @@
+"""
+Test the profiler class.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import pytest
+
+from rtkgers.hyperplane import Hyperplane
+from rtkgers.point import Point
+from rtkgers.profiler import Profiler
+
+from rtkgers.exceptions.hyperplane import HyperplaneException
+
+
+@pytest.fixture(autouse=True)
+def profiler():
+  """Enables a clean profiler for each test and disables it afterwards."""
+
+  attempts = Hyperplane.MAX_SAMPLE_ATTEMPTS
+
+  Profiler.reset()
+  Profiler.enable()
+  yield
+  Profiler.enable(False)
+  Profiler.reset()
+
+  Hyperplane.MAX_SAMPLE_ATTEMPTS = attempts
+
+
+def test_profiler_disabled():
+  """Test that nothing is collected while the profiler is disabled."""
+
+  Profiler.enable(False)
+
+  Profiler.count('counter')
+  with Profiler.timer('phase'):
+    pass
+
+  assert Profiler.Counters == {}
+  assert Profiler.Timers == {}
+
+
+def test_profiler_timer():
+  """Test timing a phase with the context manager and decorator."""
+
+  @Profiler.timed('decorated')
+  def decorated():
+    return 1
+
+  with Profiler.timer('phase'):
+    pass
+  with Profiler.timer('phase'):
+    pass
+
+  assert decorated() == 1
+  assert Profiler.Timers['phase'][0] == 2
+  assert Profiler.Timers['decorated'][0] == 1
+  assert 'phase' in Profiler.summary()
+
+
+def test_profiler_hyperplane_failures():
+  """Test that the hyperplane retries and failures are counted."""
+
+  # Linearly dependent points can never make a hyperplane.
+  points = []
+  points.append(Point([1.0, 1.0], 1.0))
+  points.append(Point([2.0, 2.0], 2.0))
+  points.append(Point([3.0, 3.0], 3.0))
+  points.append(Point([4.0, 4.0], 4.0))
+
+  Hyperplane.MAX_SAMPLE_ATTEMPTS = 10
+
+  with pytest.raises(HyperplaneException):
+    Hyperplane.sample(points)
+
+  assert Profiler.Counters['hyperplane.retries'] == 10
+  assert Profiler.Counters['hyperplane.failures'] == 1
+  assert Profiler.Timers['hyperplane.sample'][0] == 1
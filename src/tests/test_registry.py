@@ -0,0 +1,72 @@
+"""
+Test the algorithm registry.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import pytest
+
+import rtkgers.registry as Registry
+
+from rtkgers.exceptions.registry import RegistryException
+from rtkgers.kgers.leastsquares import KGERSLeastSquares
+from rtkgers.rtree.candidates import quantiles
+from rtkgers.rtree.original import RTreeOriginal
+
+
+def test_registry_load():
+  """Test that algorithms are loaded by kind and name."""
+
+  assert Registry.load(Registry.KGERS, 'KGERSLeastSquares') is \
+    KGERSLeastSquares
+  assert Registry.load(Registry.RTREE, 'RTreeOriginal') is RTreeOriginal
+  assert Registry.load(Registry.CANDIDATES, 'Quantiles') is quantiles
+
+  with pytest.raises(RegistryException):
+    Registry.load(Registry.KGERS, 'KGERSUnknown')
+
+  with pytest.raises(RegistryException):
+    Registry.load(Registry.RTREE, 'KGERSLeastSquares')
+
+
+def test_registry_register():
+  """Test that registered algorithms replace loaded ones."""
+
+  try:
+    Registry.register(Registry.KGERS, 'KGERSCustom',
+      'rtkgers.kgers.leastsquares:KGERSLeastSquares')
+    assert Registry.load(Registry.KGERS, 'KGERSCustom') is KGERSLeastSquares
+    assert 'KGERSCustom' in Registry.names(Registry.KGERS)
+
+    Registry.register(Registry.KGERS, 'KGERSCustom',
+      'rtkgers.rtree.original:RTreeOriginal')
+    assert Registry.load(Registry.KGERS, 'KGERSCustom') is RTreeOriginal
+  finally:
+    Registry.ALGORITHMS[Registry.KGERS].pop('KGERSCustom', None)
+    Registry.LOADED.pop((Registry.KGERS, 'KGERSCustom'), None)
+
+
+def test_registry_capabilities():
+  """Test the capabilities of the algorithms."""
+
+  assert Registry.supports(Registry.KGERS, 'KGERSLeastSquares',
+    Registry.INCREMENTAL)
+  assert Registry.supports(Registry.KGERS, 'KGERSLeastSquares',
+    Registry.BATCH_FIT)
+  assert not Registry.supports(Registry.KGERS, 'KGERSOriginal',
+    Registry.INCREMENTAL)
+  assert Registry.capabilities(Registry.CANDIDATES, 'All') == frozenset()
+
+
+def test_registry_modules():
+  """Test that every registered algorithm is importable."""
+
+  for kind in Registry.ALGORITHMS:
+    for name in Registry.names(kind):
+      assert Registry.load(kind, name) != None
+
+  assert 'rtkgers.kgers.weights' in Registry.modules()
@@ -0,0 +1,75 @@
+"""
+Test the statistics class.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import numpy as np
+
+from rtkgers.point import Point
+from rtkgers.statistics import Statistics
+
+
+def points():
+  """Returns points for the equation 3x + 2y + 2 = z."""
+
+  points = []
+  points.append(Point([2.0, 2.0], 12.0))
+  points.append(Point([3.0, 5.0], 21.0))
+  points.append(Point([4.0, 1.0], 16.0))
+  points.append(Point([7.0, 3.0], 29.0))
+
+  return points
+
+
+def test_statistics_solve():
+  """Test solving a perfect linear equation."""
+
+  statistics = Statistics.factory(points())
+
+  assert np.allclose(statistics.solve(), [3.0, 2.0, 2.0])
+  assert round(statistics.error(statistics.solve()), 5) == 0.0
+
+
+def test_statistics_add_remove():
+  """Test that adding and removing points matches the factory."""
+
+  statistics = Statistics(3)
+  for point in points():
+    statistics.add(point)
+
+  assert np.allclose(statistics.ata, Statistics.factory(points()).ata)
+
+  # Remove the last point and compare against the first three.
+  statistics.remove(points()[-1])
+  expected = Statistics.factory(points()[:-1])
+
+  assert np.allclose(statistics.ata, expected.ata)
+  assert np.allclose(statistics.aty, expected.aty)
+  assert statistics.count == 3.0
+
+
+def test_statistics_subtract():
+  """Test subtracting statistics."""
+
+  statistics = Statistics.factory(points()) - Statistics.factory(points()[2:])
+  expected = Statistics.factory(points()[:2])
+
+  assert np.allclose(statistics.ata, expected.ata)
+  assert round(statistics.yty - expected.yty, 5) == 0.0
+
+
+def test_statistics_sse():
+  """Test the sum of squared errors against a direct computation."""
+
+  coefficients = np.array([1.0, 1.0, 1.0])
+  statistics = Statistics.factory(points())
+
+  expected = sum([pow(np.dot(point.features, coefficients[:-1]) +
+    coefficients[-1] - point.solution, 2) for point in points()])
+
+  assert round(statistics.sse(coefficients) - expected, 5) == 0.0
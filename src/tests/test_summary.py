@@ -0,0 +1,57 @@
+"""
+Test the summary class.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import numpy as np
+
+from rtkgers.summary import Quantile
+from rtkgers.summary import Summary
+
+
+def test_summary_moments():
+  """Test that the mean and stdev match the batch computation."""
+
+  values = np.random.RandomState(1).normal(5.0, 2.0, 1000)
+
+  summary = Summary()
+  for value in values:
+    summary.add(value)
+
+  assert summary.count == 1000
+  assert round(summary.mean - np.mean(values), 10) == 0.0
+  assert round(summary.stdev() - np.std(values), 10) == 0.0
+  assert summary.minimum == np.min(values)
+  assert summary.maximum == np.max(values)
+
+
+def test_summary_percentiles():
+  """Test that the percentiles are estimated closely."""
+
+  values = np.random.RandomState(1).uniform(0.0, 1.0, 10000)
+
+  summary = Summary([50, 90, 99])
+  for value in values:
+    summary.add(value)
+
+  percentiles = summary.dict()['percentiles']
+  assert abs(percentiles['50'] - 0.5) < 0.02
+  assert abs(percentiles['90'] - 0.9) < 0.02
+  assert abs(percentiles['99'] - 0.99) < 0.01
+
+
+def test_quantile_small():
+  """Test that the quantile of a few values is exact."""
+
+  quantile = Quantile(0.5)
+  assert quantile.value() == None
+
+  for value in [3.0, 1.0, 2.0]:
+    quantile.add(value)
+
+  assert quantile.value() == 2.0
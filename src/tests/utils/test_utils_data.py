@@ -0,0 +1,52 @@
+"""
+Test the data set reading and writing utility methods.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import numpy as np
+
+from rtkgers.utils.data import read
+from rtkgers.utils.data import write
+
+
+def test_csv_round_trip(tmpdir):
+  """Test writing and reading a data set in the CSV format."""
+
+  features = np.array([[1.0, 2.0], [3.0, 4.0]])
+  solutions = np.array([5.0, 6.0])
+
+  filename = str(tmpdir.join('data.csv'))
+  write(filename, features, solutions)
+
+  # Make sure the project header is written.
+  with open(filename, 'r') as reader:
+    assert reader.readline().strip() == 'ID,Solution,Feature0,Feature1'
+
+  points = read(filename)
+
+  assert len(points) == 2
+  assert (points[1].features == [3.0, 4.0]).all()
+  assert points[1].solution == 6.0
+
+
+def test_binary_round_trip(tmpdir):
+  """Test writing and reading a data set in the binary format."""
+
+  features = np.array([[1.0, 2.0], [3.0, 4.0]])
+  solutions = np.array([5.0, 6.0])
+
+  filename = str(tmpdir.join('data.npy'))
+  write(filename, features, solutions)
+
+  # The binary format is the coordinates of every point.
+  assert (np.load(filename) == [[1.0, 2.0, 5.0], [3.0, 4.0, 6.0]]).all()
+
+  points = read(filename)
+
+  assert len(points) == 2
+  assert (points[0].coordinates == [1.0, 2.0, 5.0]).all()
@@ -0,0 +1,63 @@
+"""
+Test the synthetic data set generation methods.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import numpy as np
+
+from rtkgers.utils.generate import noisy
+from rtkgers.utils.generate import piecewise
+from rtkgers.utils.generate import polynomial
+
+
+def test_piecewise_shape():
+  """Test the shape of a generated piecewise data set."""
+
+  features, solutions = piecewise(100, 5, regimes=3, seed=1)
+
+  assert features.shape == (100, 5)
+  assert solutions.shape == (100,)
+
+
+def test_piecewise_single_regime():
+  """Test that a noiseless single regime is a perfect hyperplane."""
+
+  features, solutions = piecewise(50, 3, seed=2)
+
+  a = np.column_stack((features, np.ones(50)))
+  residuals = np.linalg.lstsq(a, solutions, rcond=None)[1]
+
+  assert round(residuals[0], 5) == 0.0
+
+
+def test_piecewise_seed():
+  """Test that the same seed generates the same data set."""
+
+  features1, solutions1 = piecewise(20, 2, noise=1.0, regimes=2, seed=3)
+  features2, solutions2 = piecewise(20, 2, noise=1.0, regimes=2, seed=3)
+
+  assert (features1 == features2).all()
+  assert (solutions1 == solutions2).all()
+
+
+def test_polynomial_outliers():
+  """Test that outliers are pushed away from the clean solutions."""
+
+  _, clean = polynomial(200, 2, degree=3, seed=4)
+  _, dirty = polynomial(200, 2, degree=3, outliers=0.1, seed=4)
+
+  assert np.sum(clean != dirty) == 20
+
+
+def test_noisy():
+  """Test that a noisy data set has no structure around zero."""
+
+  features, solutions = noisy(1000, 4, noise=1.0, seed=5)
+
+  assert features.shape == (1000, 4)
+  assert abs(np.mean(solutions)) < 0.2
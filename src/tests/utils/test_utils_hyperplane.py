@@ -15,6 +15,7 @@ from rtkgers.point import Point
 from rtkgers.hyperplane import Hyperplane
 
 from rtkgers.utils.hyperplane import average
+from rtkgers.utils.hyperplane import spread
 from rtkgers.utils.hyperplane import weigh
 
 def test_average():
@@ -69,3 +70,29 @@ def test_weigh_nonperfect():
   #  square error is found (0.01), we return what fraction of one that is.
   #  e.g. 1.0 / 0.01 == 100
   assert round(weigh(hyperplane, validators)) == 100.0
+
+
+def test_spread_diameter():
+  """Test the diameter of a ring of points."""
+
+  # A right triangle with sides 3, 4 and 5.
+  blocks = np.array([[[0.0, 0.0], [3.0, 0.0], [3.0, 4.0]]])
+
+  assert np.allclose(spread(blocks, 'Diameter'), [12.0])
+
+
+def test_spread_volume():
+  """Test the volume of the bounding box of the points."""
+
+  blocks = np.array([[[0.0, 0.0], [3.0, 0.0], [3.0, 4.0]],
+    [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0]]])
+
+  assert np.allclose(spread(blocks, 'Volume'), [12.0, 0.0])
+
+
+def test_spread_min_distance():
+  """Test the smallest distance between two of the points."""
+
+  blocks = np.array([[[0.0, 0.0], [3.0, 0.0], [3.0, 4.0]]])
+
+  assert np.allclose(spread(blocks, 'MinDistance'), [3.0])
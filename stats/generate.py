@@ -0,0 +1,87 @@
+"""
+Main execution script for generating synthetic data sets.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import getopt
+import sys
+
+import rtkgers.utils.data as DataUtils
+import rtkgers.utils.generate as GenerateUtils
+
+
+def main():
+  """Main execution."""
+
+  # Determine command line arguments.
+  try:
+    rawopts, _ = getopt.getopt(sys.argv[1:], 't:n:d:s:r:f:p:x:o:')
+  except getopt.GetoptError:
+    usage()
+    sys.exit(2)
+
+  opts = {}
+
+  # Process each command line argument.
+  for o, a in rawopts:
+    opts[o[1]] = a
+
+  # The following arguments are required in all cases.
+  for opt in ['t', 'n', 'd', 'o']:
+    if not opt in opts:
+      usage()
+      sys.exit(2)
+
+  if not opts['t'] in GenerateUtils.GENERATORS:
+    usage()
+    sys.exit(2)
+
+  size = int(opts['n'])
+  dimensions = int(opts['d'])
+  noise = float(opts.get('s', 0.0))
+  outliers = float(opts.get('f', 0.0))
+  seed = int(opts['x']) if 'x' in opts else None
+
+  if opts['t'] == 'piecewise':
+    features, solutions = GenerateUtils.piecewise(size, dimensions,
+      noise=noise, regimes=int(opts.get('r', 1)), outliers=outliers, seed=seed)
+  elif opts['t'] == 'polynomial':
+    features, solutions = GenerateUtils.polynomial(size, dimensions,
+      degree=int(opts.get('p', 2)), noise=noise, outliers=outliers, seed=seed)
+  else:
+    features, solutions = GenerateUtils.noisy(size, dimensions,
+      noise=float(opts.get('s', 1.0)), outliers=outliers, seed=seed)
+
+  DataUtils.write(opts['o'], features, solutions)
+
+
+def usage():
+  """Prints the usage of the program."""
+
+  print("\n" +
+    "The following are arguments required:\n" +
+    "\t-t: the type of data set (piecewise,polynomial,noisy).\n" +
+    "\t-n: the number of rows.\n" +
+    "\t-d: the number of features.\n" +
+    "\t-o: the output file (\".npy\" writes the binary format).\n" +
+    "\n" +
+    "The following arguments are optional:\n" +
+    "\t-s: the standard deviation of the noise.\n" +
+    "\t-r: the number of true regimes (piecewise only).\n" +
+    "\t-p: the polynomial degree (polynomial only).\n" +
+    "\t-f: the fraction of outliers.\n" +
+    "\t-x: the random seed.\n" +
+    "\n" +
+    "Example Usage:\n" +
+    "\tpython generate.py -t \"piecewise\" -n 1000000 -d 50 -r 8 -s 0.5 -o \"training.npy\"" +
+    "\n")
+
+
+"""Main execution."""
+if __name__ == "__main__":
+  main()
@@ -8,21 +8,81 @@ The style guide follows the strict python PEP 8 guidelines.
 @requires Python >=2.7
 @copyright 2014 - Present Aaron Zampaglione
 """
-import csv
+import collections
 import getopt
-import math
+import json
+import multiprocessing
 import os
+import random
 import sys
-import threading
 import timeit
 
 import ConfigParser
 
-from rtkgers.exthread import ExThread
+import numpy as np
+
+import rtkgers.registry as Registry
+import rtkgers.utils.config as ConfigUtils
+
+from rtkgers.dataset import Dataset
 from rtkgers.hyperplane import Hyperplane
-from rtkgers.point import Point
-from rtkgers.kgers.original import KGERSOriginal
-from rtkgers.kgers.weights import KGERSWeights
+from rtkgers.pool import Pool
+from rtkgers.summary import Summary
+
+
+# The state of a trial process, set once by initialize().
+TRIAL = {}
+
+
+def histogram(writer, title, counts, summary, sigfig, minimum, maximum):
+  """
+  Writes the histogram of rounded values, followed by their average and
+  standard deviation.
+
+  Key arguments:
+  writer  -- The output file.
+  title   -- The title of the values.
+  counts  -- The counts of the rounded values.
+  summary -- The summary of the values.
+  sigfig  -- The number of decimals the values were rounded to.
+  minimum -- The smallest value to display.
+  maximum -- The largest value to display.
+  """
+
+  writer.write(title + "\tCount\n")
+
+  value = minimum
+  while value < maximum:
+    writer.write(str(value) + "\t" + str(counts[value]) + "\n")
+    value = round(value + 1.0 / pow(10, sigfig), sigfig)
+
+  # Final stats, avg, stdev, etc.
+  writer.write("Average:\t" + str(summary.mean) + "\n")
+  writer.write("Stdev:\t" + str(summary.stdev()) + "\n")
+
+
+def initialize(config_filename, dataset):
+  """
+  Prepares a trial process, the data set is attached to once rather than
+  shipped with every trial.
+
+  Key arguments:
+  config_filename -- The config file name.
+  dataset         -- The (shared) data set.
+  """
+
+  config = ConfigParser.ConfigParser()
+  config.read(config_filename)
+
+  # Overload globals.
+  Pool.configure(config.getint('Main', 'MaxThreads'))
+  Hyperplane.MAX_SAMPLE_ATTEMPTS = \
+    config.getint('KGERS', 'MaxHyperplaneAttempts')
+
+  TRIAL['config'] = config
+  TRIAL['points'] = dataset.points()
+  TRIAL['algorithm'] = Registry.load(Registry.KGERS,
+    config.get('KGERS', 'Algorithm'))
 
 
 def main():
@@ -30,7 +90,7 @@ def main():
 
   # Determine command line arguments.
   try:
-    rawopts, _ = getopt.getopt(sys.argv[1:], 'c:s:i:o:')
+    rawopts, _ = getopt.getopt(sys.argv[1:], 'c:s:i:o:j:')
   except getopt.GetoptError:
     usage()
     sys.exit(2)
@@ -47,121 +107,87 @@ def main():
       usage()
       sys.exit(2)
 
-  # Load in the configuration.
-  config = ConfigParser.ConfigParser()
-  config.read(opts['c'])
-
   # Load in the stat settings.
   settings = ConfigParser.ConfigParser()
   settings.read(opts['s'])
 
-  # The points are essentially feature sets with the known solution.
-  points = []
+  trials = settings.getint('Stats', 'NumOfTrials')
+  processes = ConfigUtils.getint(settings, 'Stats', 'Processes',
+    multiprocessing.cpu_count())
+  seed = ConfigUtils.getint(settings, 'Stats', 'Seed',
+    random.randint(0, 2 ** 31 - 1 - trials))
+  percentiles = [int(percentile) for percentile in ConfigUtils.get(settings,
+    'Stats', 'Percentiles', '50,90,99').split(',')]
+
+  error_sigfig = settings.getint('Stats', 'ErrorSigFig')
+  time_sigfig = settings.getint('Stats', 'TimeSigFig')
+
+  # The points are loaded once and shared with the trial processes.
+  dataset = Dataset.load(opts['i'])
+  dataset.share()
+
+  # The summaries and the counts of the rounded values are kept as the
+  #  trials finish, rather than every value.
+  errors = Summary(percentiles)
+  times = Summary(percentiles)
+  rounded_errors = collections.Counter()
+  rounded_times = collections.Counter()
+
+  pool = multiprocessing.Pool(processes, initialize, (opts['c'], dataset))
+  try:
+    # Each trial has its own seed, so a study can be repeated.
+    for error, time in pool.imap_unordered(trial,
+      xrange(seed, seed + trials), max(1, trials / (4 * processes))):
+      errors.add(error)
+      times.add(time)
+      rounded_errors[round(error, error_sigfig)] += 1
+      rounded_times[round(time, time_sigfig)] += 1
+
+    pool.close()
+  finally:
+    pool.terminate()
+    pool.join()
+    dataset.close()
 
-  # Create our reader.
-  with open(opts['i'], 'rb') as reader_file:
-    reader = csv.reader(reader_file, delimiter=',', quotechar='|')
+  # Write to the output file.
+  with open(opts['o'], 'w') as writer:
+    histogram(writer, "RMSE", rounded_errors, errors, error_sigfig,
+      settings.getfloat('Stats', 'MinErrorDisplay'),
+      settings.getfloat('Stats', 'MaxErrorDisplay'))
 
-    # Skip the first line.
-    reader.next()
-    for row in reader:
-      points.append(
-        Point([float(feature) for feature in row[2:]], float(row[1])))
+    writer.write("\n")
 
-  # Overload globals.
-  max_threads = config.getint('Main', 'MaxThreads')
-  max_sample_attempts = config.get('KGERS', 'MaxHyperplaneAttempts')
-  ExThread.Thread_Limit = threading.BoundedSemaphore(max_threads)
-  Hyperplane.MAX_SAMPLE_ATTEMPTS = max_sample_attempts
-
-  # Load the desired algorithm.
-  algorithm = config.get('KGERS', 'Algorithm')
-
-  # Maintain a list of actual errors and times.
-  errors = []
-  times = []
-
-  # Maintain a count of rounded errors and times.
-  rounded_errors = {}
-  rounded_times = {}
-
-  for i in range(settings.getint('Stats', 'NumOfTrials')):
-    # Construct the desired KGERS implementation.
-    kgers = globals()[algorithm](config, points)
-
-    # Execute.
-    timer = timeit.Timer(lambda: kgers.execute())
-    time = timer.timeit(1)
-    error = kgers.error()
-
-    # Append to the an actual list.
-    errors.append(error)
-    times.append(time)
-
-    # Add to the rounded error list.
-    rounded_error = str(round(error, settings.getint('Stats', 'ErrorSigFig')))
-    if rounded_error in rounded_errors:
-      rounded_errors[rounded_error] += 1
-    else:
-      rounded_errors[rounded_error] = 1
-
-    # Add to the rounded time list.
-    rounded_time = str(round(time, settings.getint('Stats', 'TimeSigFig')))
-    if rounded_time in rounded_times:
-      rounded_times[rounded_time] += 1
-    else:
-      rounded_times[rounded_time] = 1
-
-  error_sigfig = pow(10, settings.getint('Stats', 'ErrorSigFig'))
-  error_display_min = settings.getfloat('Stats', 'MinErrorDisplay')
-  error_display_max = settings.getfloat('Stats', 'MaxErrorDisplay')
-
-  time_sigfig = pow(10, settings.getint('Stats', 'TimeSigFig'))
-  time_display_min = settings.getfloat('Stats', 'MinTimeDisplay')
-  time_display_max = settings.getfloat('Stats', 'MaxTimeDisplay')
+    histogram(writer, "Time", rounded_times, times, time_sigfig,
+      settings.getfloat('Stats', 'MinTimeDisplay'),
+      settings.getfloat('Stats', 'MaxTimeDisplay'))
 
-  # Write to the output file.
-  with open(opts['o'], 'w') as writer:
+  # Write the summary next to the histogram, unless a file was provided.
+  json_filename = opts.get('j', os.path.splitext(opts['o'])[0] + '.json')
+  with open(json_filename, 'w') as writer:
+    json.dump({'trials': trials, 'seed': seed, 'rmse': errors.dict(),
+      'time': times.dict()}, writer, indent=2, sort_keys=True)
+
+
+def trial(seed):
+  """
+  Runs one trial and returns its (error, time).
+
+  Key arguments:
+  seed -- The seed of the trial.
+  """
+
+  random.seed(seed)
+  np.random.seed(seed)
+
+  # Construct the desired KGERS implementation.
+  kgers = TRIAL['algorithm'](TRIAL['config'], TRIAL['points'])
+
+  # Execute.
+  timer = timeit.Timer(lambda: kgers.execute())
+  time = timer.timeit(1)
+
+  return (kgers.error(), time)
 
-    # Write the RMSE.
-    writer.write("RMSE\tCount\n")
-
-    error = error_display_min
-    while error < error_display_max:
-      if str(error) in rounded_errors:
-        writer.write(str(error) + "\t" + str(rounded_errors[str(error)]) + "\n")
-      else:
-        writer.write(str(error) + "\t" + str(0) + "\n")
-
-      error = round(
-        error + 1.0 / error_sigfig,
-        settings.getint('Stats', 'ErrorSigFig'))
-
-    # Final stats, avg, stdev, etc.
-    avg = sum(errors) / float(len(errors))
-    stdev = math.sqrt(sum([math.pow(e - avg, 2) for e in errors]) / float(len(errors)))
-    writer.write("Average:\t" + str(avg) + "\n")
-    writer.write("Stdev:\t" + str(stdev) + "\n")
-
-    # Write the Time.
-    writer.write("\nTime\tCount\n")
-
-    time = time_display_min
-    while time < time_display_max:
-      if str(time) in rounded_times:
-        writer.write(str(time) + "\t" + str(rounded_times[str(time)]) + "\n")
-      else:
-        writer.write(str(time) + "\t" + str(0) + "\n")
-
-      time = round(
-        time + 1.0 / time_sigfig,
-        settings.getint('Stats', 'TimeSigFig'))
-
-    # Final stats, avg, stdev, etc.
-    avg = sum(times) / float(len(times))
-    stdev = math.sqrt(sum([math.pow(t - avg, 2) for t in times]) / float(len(times)))
-    writer.write("Average:\t" + str(avg) + "\n")
-    writer.write("Stdev:\t" + str(stdev) + "\n")
 
 def usage():
   """Prints the usage of the program."""
@@ -169,11 +195,15 @@ def usage():
   print("\n" +
     "The following are arguments required:\n" +
     "\t-c: the path to the configuration file.\n" +
-    "\t-t: the number of trials.\n" +
+    "\t-s: the path to the stats settings file.\n" +
     "\t-i: the input file.\n" +
+    "\t-o: the output file of the histograms.\n" +
+    "\n" +
+    "The following arguments are optional:\n" +
+    "\t-j: the output file of the JSON summary (default: next to -o).\n" +
     "\n" +
     "Example Usage:\n" +
-    "\tpython kgers.py -c \"config.cfg\" -i \"training.csv\"" +
+    "\tpython kgers.py -c \"config.cfg\" -s \"stats.cfg\" -i \"training.csv\" -o \"stats.txt\"" +
     "\n")
 
 
@@ -0,0 +1,293 @@
+"""
+Main execution script for sweeping the configuration of rtkgers.
+
+Every combination of the values of a grid of config overrides is trained
+and tested with k-fold cross validation. The data set is loaded once and
+shared with the processes, and the same folds are reused for every
+combination, so they are compared on the same splits.
+
+The style guide follows the strict python PEP 8 guidelines.
+@see http://www.python.org/dev/peps/pep-0008/
+
+@author Aaron Zampaglione <azampagl@azampagl.com>
+@requires Python >=2.7
+@copyright 2014 - Present Aaron Zampaglione
+"""
+import getopt
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import sys
+import timeit
+
+import ConfigParser
+
+import numpy as np
+
+import rtkgers.registry as Registry
+import rtkgers.utils.config as ConfigUtils
+
+from rtkgers.dataset import Dataset
+from rtkgers.exceptions.hyperplane import HyperplaneException
+from rtkgers.exceptions.kgers import KGERSException
+from rtkgers.folds import Folds
+from rtkgers.hyperplane import Hyperplane
+from rtkgers.point import Point
+from rtkgers.pool import Pool
+from rtkgers.summary import Summary
+
+
+# The section of the grid file with the settings of the sweep itself.
+SWEEP = 'Sweep'
+
+
+# The state of a sweep process, set once by initialize().
+SWEEPER = {}
+
+
+def combinations(grid):
+  """
+  Returns every combination of the overrides of a grid, as a list of
+  lists of (section, option, value).
+
+  Key arguments:
+  grid -- The grid, each option is a comma separated list of values.
+  """
+
+  axes = []
+  for section in grid.sections():
+    if (section == SWEEP):
+      continue
+    for option in grid.options(section):
+      axes.append([(section, option, value.strip())
+        for value in grid.get(section, option).split(',')])
+
+  return [list(combination) for combination in itertools.product(*axes)]
+
+
+def configure(config_filename, overrides):
+  """
+  Returns the config with overrides applied.
+
+  Key arguments:
+  config_filename -- The config file name.
+  overrides       -- The list of (section, option, value) to override.
+  """
+
+  # "%(dir)s" is the directory of the config.
+  config = ConfigParser.ConfigParser(
+    {'dir': os.path.dirname(os.path.abspath(config_filename))})
+  config.read(config_filename)
+
+  for section, option, value in overrides:
+    if not config.has_section(section):
+      config.add_section(section)
+    config.set(section, option, value)
+
+  return config
+
+
+def evaluate(job):
+  """
+  Trains a tree on the training folds and tests it on the remaining fold,
+  returns (combination, RMSE, training time). The RMSE is None if the tree
+  could not be built or trained, e.g. a fold too small for a leaf.
+
+  Key arguments:
+  job -- A tuple of (combination number, fold number, seed).
+  """
+
+  number, fold, seed = job
+
+  random.seed(seed)
+  np.random.seed(seed)
+
+  config = configure(SWEEPER['config'], SWEEPER['combinations'][number])
+
+  # Overload globals.
+  Hyperplane.MAX_SAMPLE_ATTEMPTS = \
+    config.getint('KGERS', 'MaxHyperplaneAttempts')
+  Pool.configure(config.getint('Main', 'MaxThreads'))
+
+  dataset = SWEEPER['dataset']
+  training, test = SWEEPER['folds'].indices(fold)
+
+  try:
+    algorithm = Registry.load(Registry.RTREE,
+      config.get('RTree', 'Algorithm'))
+    rtkgers = algorithm(config, dataset.take(training))
+
+    time = timeit.Timer(lambda: rtkgers.populate()).timeit(1)
+  except (HyperplaneException, KGERSException), e:
+    return (number, None, None)
+
+  return (number, rtkgers.error(dataset.take(test)), time)
+
+
+def initialize(config_filename, dataset, combinations, folds):
+  """
+  Prepares a sweep process, the data set is attached to once rather than
+  shipped with every job.
+
+  Key arguments:
+  config_filename -- The config file name.
+  dataset         -- The (shared) data set.
+  combinations    -- The combinations of overrides.
+  folds           -- The folds of the data set.
+  """
+
+  Point.DTYPE = dataset.coordinates.dtype
+
+  SWEEPER['config'] = config_filename
+  SWEEPER['dataset'] = dataset
+  SWEEPER['combinations'] = combinations
+  SWEEPER['folds'] = folds
+
+
+def main():
+  """Main execution."""
+
+  # Determine command line arguments.
+  try:
+    rawopts, _ = getopt.getopt(sys.argv[1:], 'c:g:i:o:j:')
+  except getopt.GetoptError:
+    usage()
+    sys.exit(2)
+
+  opts = {}
+
+  # Process each command line argument.
+  for o, a in rawopts:
+    opts[o[1]] = a
+
+  # The following arguments are required in all cases.
+  for opt in ['c', 'g', 'i', 'o']:
+    if not opt in opts:
+      usage()
+      sys.exit(2)
+
+  # Load in the grid of overrides.
+  grid = ConfigParser.RawConfigParser()
+  grid.optionxform = str
+  grid.read(opts['g'])
+
+  folds = ConfigUtils.getint(grid, SWEEP, 'Folds', 5)
+  processes = ConfigUtils.getint(grid, SWEEP, 'Processes',
+    multiprocessing.cpu_count())
+  seed = ConfigUtils.getint(grid, SWEEP, 'Seed', random.randint(0, 2 ** 30))
+
+  # The precision of the points is the one of the base config.
+  config = configure(opts['c'], [])
+  Point.DTYPE = np.dtype(ConfigUtils.get(config, 'Main', 'Precision',
+    'float64'))
+
+  # The points are loaded once and shared with the sweep processes.
+  dataset = Dataset.load(opts['i'])
+  dataset.share()
+
+  overrides = combinations(grid)
+  splits = Folds.shuffled(len(dataset), folds, seed)
+
+  # The errors and times of each combination, over its folds.
+  errors = [Summary() for combination in overrides]
+  times = [Summary() for combination in overrides]
+  failures = [0] * len(overrides)
+
+  jobs = [(number, fold, seed + fold) for number in range(len(overrides))
+    for fold in range(folds)]
+
+  pool = multiprocessing.Pool(processes, initialize,
+    (opts['c'], dataset, overrides, splits))
+  try:
+    for number, error, time in pool.imap_unordered(evaluate, jobs):
+      if (error == None):
+        failures[number] += 1
+        continue
+      errors[number].add(error)
+      times[number].add(time)
+
+    pool.close()
+  finally:
+    pool.terminate()
+    pool.join()
+    dataset.close()
+
+  results = []
+  for number, combination in enumerate(overrides):
+    results.append({
+      'overrides': ['%s.%s=%s' % override for override in combination],
+      'rmse': errors[number].mean if errors[number].count > 0 else None,
+      'rmse_stdev': errors[number].stdev(),
+      'time': times[number].mean if times[number].count > 0 else None,
+      'failures': failures[number]
+    })
+
+  front = pareto(results)
+  for number, result in enumerate(results):
+    result['pareto'] = number in front
+
+  # Write the results, best first.
+  results.sort(key=lambda result: (result['rmse'] == None, result['rmse']))
+  with open(opts['o'], 'w') as writer:
+    writer.write("RMSE\tStdev\tTime\tFailures\tPareto\tOverrides\n")
+    for result in results:
+      writer.write("\t".join([str(result['rmse']), str(result['rmse_stdev']),
+        str(result['time']), str(result['failures']),
+        '*' if result['pareto'] else '', ' '.join(result['overrides'])]) +
+        "\n")
+
+  # Write the summary next to the results, unless a file was provided.
+  json_filename = opts.get('j', os.path.splitext(opts['o'])[0] + '.json')
+  with open(json_filename, 'w') as writer:
+    json.dump({'folds': folds, 'seed': seed, 'results': results}, writer,
+      indent=2, sort_keys=True)
+
+
+def pareto(results):
+  """
+  Returns the indices of the results on the Pareto front of RMSE and time,
+  the results no other result is both as accurate and as fast as, and
+  better in one of them.
+
+  Key arguments:
+  results -- The results, with their 'rmse' and 'time'.
+  """
+
+  scored = sorted([(result['rmse'], result['time'], number)
+    for number, result in enumerate(results) if result['rmse'] != None])
+
+  # By increasing RMSE, a result is on the front if it is faster than every
+  #  more accurate result.
+  front = set()
+  fastest = None
+  for rmse, time, number in scored:
+    if (fastest == None or time < fastest):
+      front.add(number)
+      fastest = time
+
+  return front
+
+
+def usage():
+  """Prints the usage of the program."""
+
+  print("\n" +
+    "The following are arguments required:\n" +
+    "\t-c: the path to the base configuration file.\n" +
+    "\t-g: the path to the grid of overrides.\n" +
+    "\t-i: the input file.\n" +
+    "\t-o: the output file of the results.\n" +
+    "\n" +
+    "The following arguments are optional:\n" +
+    "\t-j: the output file of the JSON summary (default: next to -o).\n" +
+    "\n" +
+    "Example Usage:\n" +
+    "\tpython sweep.py -c \"defaults.cfg\" -g \"sweep.cfg\" -i \"training.csv\" -o \"sweep.txt\"" +
+    "\n")
+
+
+"""Main execution."""
+if __name__ == "__main__":
+  main()